@@ -0,0 +1,96 @@
+"""Ability estimate for the adaptive assessment mode.
+
+A candidate's ability is tracked as a level on the 1-20 scale the question
+prompts use, with a standard deviation for how sure we are. The expected
+score on a question of difficulty ``d`` is ``sigmoid((level - d) / SCALE)``.
+After every evaluation, the observed score (the mean of the four 0-10
+scores, as 0-1) updates the estimate with a one-dimensional extended
+Kalman step.
+
+The next question is asked at the current level estimate, where a score
+tells us the most. It targets the technology that has been asked least,
+breaking ties toward the weakest one so far. At the current level the
+expected score is about 0.5 whatever the answers were, so the standard
+deviation shrinks the same way for every candidate. The stop rule therefore
+also checks the residuals: the assessment stops only once the standard
+deviation is below the confidence bound *and* the scores so far fit the
+estimate (their RMS distance from the expected scores at the current level
+is at most ``MAX_RESIDUAL``). A strong answer followed by a weak one keeps
+the assessment going.
+
+The estimate is a plain JSON-friendly dict so it can live on
+``SessionState`` and in the session store. Updates return a new dict.
+"""
+
+import math
+import re
+
+SCALE = 3.0  # levels per logit of the expected-score curve
+SCORE_NOISE = 0.2  # standard deviation of an observed 0-1 score around its expectation
+PRIOR_SD = 4.0
+MAX_RESIDUAL = SCORE_NOISE  # RMS residual that still counts as a consistent fit: no more than the noise
+MIN_LEVEL, MAX_LEVEL = 1, 20
+
+
+def prior_level(experience) -> float:
+    """Starting level from free-text experience ("3", "5 years", "10+"); level ~ years, as in the prompts."""
+    match = re.search(r"\d+(\.\d+)?", str(experience or ""))
+    years = float(match.group(0)) if match else 5.0
+    return min(max(years, MIN_LEVEL + 1), MAX_LEVEL - 2)
+
+
+def initial(experience) -> dict:
+    return {"level": prior_level(experience), "sd": PRIOR_SD, "answered": 0, "techs": {}, "current": None,
+            "scores": []}
+
+
+def expected_score(level: float, difficulty: float) -> float:
+    return 1 / (1 + math.exp(-(level - difficulty) / SCALE))
+
+
+def update(ability: dict, score: float, difficulty: float, tech: str | None) -> dict:
+    """New estimate after a 0-1 ``score`` on a question of ``difficulty`` about ``tech``."""
+    level, var = ability["level"], ability["sd"] ** 2
+    p = expected_score(level, difficulty)
+    slope = p * (1 - p) / SCALE
+    gain = var * slope / (slope * slope * var + SCORE_NOISE ** 2)
+    level = min(max(level + gain * (score - p), MIN_LEVEL), MAX_LEVEL)
+    var = (1 - gain * slope) * var
+    techs = dict(ability["techs"])
+    if tech:
+        count, total = techs.get(tech, (0, 0.0))
+        techs[tech] = [count + 1, round(total + score, 4)]
+    scores = [*ability.get("scores", []), [difficulty, round(score, 4)]]
+    return dict(ability, level=round(level, 3), sd=round(math.sqrt(var), 3), answered=ability["answered"] + 1,
+                techs=techs, scores=scores)
+
+
+def next_target(ability: dict, tech_stack: list) -> tuple:
+    """(difficulty, technology) for the next question; technology is None with an empty stack."""
+    difficulty = int(min(max(round(ability["level"]), MIN_LEVEL), MAX_LEVEL))
+    if not tech_stack:
+        return difficulty, None
+    techs = ability["techs"]
+
+    def priority(tech):
+        count, total = techs.get(tech, (0, 0.0))
+        return count, total / count if count else 0.0
+
+    return difficulty, min(tech_stack, key=priority)
+
+
+def residual(ability: dict) -> float:
+    """RMS difference between the observed scores and those expected at the current level."""
+    scores = ability.get("scores", [])
+    if not scores:
+        return 0.0
+    level = ability["level"]
+    return math.sqrt(sum((score - expected_score(level, d)) ** 2 for d, score in scores) / len(scores))
+
+
+def is_confident(ability: dict, confidence: float, max_residual: float = MAX_RESIDUAL) -> bool:
+    return ability["sd"] <= confidence and residual(ability) <= max_residual
+
+
+def describe(ability: dict) -> str:
+    return f"{ability['level']:.1f}/20 (±{ability['sd']:.1f})"
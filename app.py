@@ -1,814 +1,528 @@
-import random
-from datetime import datetime
-import os
-import streamlit as st
-from dotenv import load_dotenv
-from groq import Groq
-
-load_dotenv()
-
-# Initialize Groq client
-client = Groq(api_key=os.getenv("GROQ_API_KEY"))
-
-# Page configuration
-st.set_page_config(
-    page_title="TalentScout - AI Hiring Assistant",
-    page_icon="🧠",
-    layout="centered",
-    initial_sidebar_state="expanded"
-)
-
-# Custom CSS (keeping your original styling)
-st.markdown("""
-<style>
-    /* Main app styling */
-    .main {
-        padding-top: 1rem;
-    }
-    
-    /* Chat container styling */
-    .stChatMessage {
-        background-color: #f8f9fa;
-        border-radius: 10px;
-        padding: 1rem;
-        margin-bottom: 1rem;
-        border-left: 4px solid #007bff;
-        display: flex;
-        width: 100%;
-    }
-    
-   /* User message styling */
-.stChatMessage[data-testid="user-message"] {
-    background-color: #007bff;
-    color: white;
-    border-left: none;
-    border-right: 4px solid #0056b3;
-    margin-left: auto;
-    margin-right: 0;
-    max-width: 70%;
-    text-align: right;
-    display: flex;
-    flex-direction: column;
-    align-items: flex-end;
-    justify-content: flex-start;
-    width: fit-content; /* Ensures container only takes needed space */
-    min-width: 200px; /* Optional: sets minimum width */
-}
-
-/* Additional styling to ensure all child elements align right */
-.stChatMessage[data-testid="user-message"] * {
-    text-align: right !important;
-    align-self: flex-end;
-    width: 100%;
-}
-
-/* Specific targeting for text content */
-.stChatMessage[data-testid="user-message"] p,
-.stChatMessage[data-testid="user-message"] div,
-.stChatMessage[data-testid="user-message"] span {
-    text-align: right !important;
-    direction: rtl; /* Right-to-left direction for better right alignment */
-    unicode-bidi: plaintext; /* Maintains proper text rendering */
-}
-
-
-    /* Assistant message styling */
-    .stChatMessage[data-testid="assistant-message"] {
-        background-color: #f5f5f5;
-        border-left: 4px solid #4caf50;
-        margin-left: 0;
-        margin-right: auto;
-        max-width: 70%;
-        text-align: left;
-    }
-    
-    /* Chat input styling */
-    .stChatInput {
-        position: sticky;
-        bottom: 0;
-        background: white;
-        border-top: 1px solid #e0e0e0;
-        padding: 1rem 0;
-        z-index: 100;
-    }
-    
-    .stChatInput > div {
-        max-width: 100%;
-    }
-    
-    /* Sidebar styling */
-    .css-1d391kg {
-        background-color: #f8f9fa;
-    }
-    
-    /* Progress bar styling */
-    .stProgress > div > div > div {
-        background-color: #007bff;
-    }
-    
-    /* Button styling */
-    .stButton > button {
-        background-color: #007bff;
-        color: white;
-        border-radius: 8px;
-        border: none;
-        padding: 0.5rem 1rem;
-        font-weight: 500;
-        transition: all 0.3s ease;
-    }
-    
-    .stButton > button:hover {
-        background-color: #0056b3;
-        transform: translateY(-2px);
-        box-shadow: 0 4px 8px rgba(0,0,0,0.1);
-    }
-    
-    /* Sidebar header */
-    .css-1lcbmhc h1 {
-        color: #007bff;
-        font-size: 1.5rem;
-        font-weight: 600;
-        margin-bottom: 1rem;
-    }
-    
-    /* Summary box styling */
-    .css-1v0mbdj {
-        background-color: white;
-        border: 1px solid #e0e0e0;
-        border-radius: 8px;
-        padding: 1rem;
-        margin-bottom: 1rem;
-    }
-    
-    /* Avatar styling */
-    .stChatMessage .css-1v0mbdj {
-        width: 40px;
-        height: 40px;
-        border-radius: 50%;
-        display: flex;
-        align-items: center;
-        justify-content: center;
-        font-weight: bold;
-    }
-    
-    /* User avatar - positioned on right */
-    .stChatMessage[data-testid="user-message"] .css-1v0mbdj {
-        margin-left: 1rem;
-        margin-right: 0;
-        background-color: #0056b3;
-        color: white;
-    }
-    
-    /* Assistant avatar - positioned on left */
-    .stChatMessage[data-testid="assistant-message"] .css-1v0mbdj {
-        margin-right: 1rem;
-        margin-left: 0;
-        background-color: #4caf50;
-        color: white;
-    }
-    
-    /* Spinner styling */
-    .stSpinner {
-        color: #007bff;
-    }
-    
-    /* Title styling */
-    h1 {
-        color: #007bff;
-        text-align: center;
-        margin-bottom: 2rem;
-        font-weight: 600;
-    }
-    
-    /* Privacy notice styling */
-    .css-1v0mbdj blockquote {
-        background-color: #fff3cd;
-        border-left: 4px solid #ffc107;
-        padding: 1rem;
-        margin: 1rem 0;
-        border-radius: 4px;
-    }
-    
-    /* Question styling */
-    .stChatMessage strong {
-        color: #007bff;
-        font-size: 1.1rem;
-    }
-    
-    /* User message question styling */
-    .stChatMessage[data-testid="user-message"] strong {
-        color: white;
-    }
-    
-    /* Evaluation styling */
-    .stChatMessage h3 {
-        color: #28a745;
-        margin-bottom: 0.5rem;
-    }
-</style>
-""", unsafe_allow_html=True)
-
-
-PRIVACY_NOTICE = (
-    "Your information will be used solely for recruitment purposes. "
-    "We comply with GDPR and data-protection regulations. "
-    "You can request data deletion at any time."
-    "Export Your Data as We will not store your Data after this session is over due to privacy "
-)
-
-FALLBACK_RESPONSES = [
-    "I didn't quite understand that 🤔  Could you please re-phrase?",
-    "Let me try a different approach – can you give more detail?",
-    "Hmm, I'm not sure I follow. Could you clarify?",
-    "That's interesting! Can you elaborate a bit more?",
-    "I want to be sure I understand – could you re-state that?",
-]
-
-
-PHASES = [
-    "welcome",
-    "language_selection", 
-    "consent",
-    "personal_info",
-    "professional_info",
-    "tech_stack",
-    "technical_assessment",
-    "summary",
-    "completion",
-]
-
-PHASE_FRIENDLY = {
-    "welcome": "Getting Started",
-    "language_selection": "Language Selection",  
-    "consent": "Privacy Consent",
-    "personal_info": "Personal Information",
-    "professional_info": "Professional Background",
-    "tech_stack": "Tech-Stack Review",
-    "technical_assessment": "Technical Assessment",
-    "summary": "Summary Review",
-    "completion": "Complete",
-}
-#Function to detect language
-def detect_language_with_groq(user_input):
-    """Send user's language preference to Groq for processing."""
-    prompt = f"""
-    The user said: "{user_input}"
-    
-    They are trying to tell me what language they want to use for interview questions.
-    Please identify the language they mentioned and return just the language name in English.
-    
-    Examples:
-    - If they said "Spanish" or "Español" → return "Spanish"
-    - If they said "Hindi" or "हिंदी" → return "Hindi" 
-    - If they said "French" or "Français" → return "French"
-    - If they said "German" or "Deutsch" → return "German"
-    - If they said "Chinese" or "中文" → return "Chinese"
-    - If unclear, return "English"
-    
-    Return only the language name in English:
-    """
-    
-    try:
-        response = client.chat.completions.create(
-            model="meta-llama/llama-4-scout-17b-16e-instruct",
-            messages=[{"role": "user", "content": prompt}],
-            temperature=0.1,
-            max_completion_tokens=20,
-            top_p=1,
-            stream=False,
-        )
-        return response.choices[0].message.content.strip()
-    except Exception as e:
-        st.error(f"Error processing language: {str(e)}")
-        return "English"
-# Helper functions
-def add_message(role: str, content: str, avatar: str | None = None):
-    """Store message in session state and render it."""
-    # Store message in session state
-    st.session_state.messages.append({
-        "role": role, 
-        "content": content, 
-        "avatar": avatar,
-        "timestamp": datetime.utcnow().isoformat()
-    })
-    
-    # Render the message
-    with st.chat_message(role, avatar=avatar):
-        st.markdown(content)
-
-def update_progress_bar():
-    """Update the progress bar based on current phase and assessment progress."""
-    current_phase = st.session_state.phase
-    phase_idx = PHASES.index(current_phase)
-    total_phases = len(PHASES)
-    
-    if current_phase == "technical_assessment":
-        # Calculate fine-grained progress within technical assessment
-        answered_questions = len(st.session_state.get("technical_responses", []))
-        total_questions = st.session_state.get("total_questions", 3)
-        
-        # Base progress from completed phases
-        base_progress = phase_idx / total_phases
-        # Progress within current phase
-        phase_progress = (answered_questions / total_questions) / total_phases
-        
-        total_progress = int((base_progress + phase_progress) * 100)
-        label = f"{PHASE_FRIENDLY[current_phase]} "
-    else:
-        # Standard phase progress
-        total_progress = int(((phase_idx + 1) / total_phases) * 100)
-        label = PHASE_FRIENDLY[current_phase]
-    
-    st.sidebar.progress(total_progress, text=f"Phase: {label}")
-
-
-def generate_ai_question(tech_stack: list, experience, position: str, question_num: int, total_questions: int):
-    """Generate a technical question using Groq AI based on candidate's tech stack and position."""
-    tech_stack_str = ", ".join(tech_stack)
-    
-    # Get the user's preferred language from session state
-    user_language = st.session_state.get("user_language", "English")
-    
-    question_prompt = (
-        f"Generate 1 technical interview question for a {position} role. "
-        f"Focus on the following technologies: {tech_stack_str}. "
-        f"Make it practical and relevant to real-world development scenarios. "
-        f"Return only the question without additional formatting. "
-        f"Generate question for short one line answers. "
-        f"Level: {experience}/20 "
-        f"Strictly generate the question in {user_language} language."
-    )
-    
-    try:
-        response = client.chat.completions.create(
-            model="meta-llama/llama-4-scout-17b-16e-instruct",
-            messages=[{"role": "user", "content": question_prompt}],
-            temperature=0.8,
-            max_completion_tokens=512,
-            top_p=1,
-            stream=False,
-        )
-        return response.choices[0].message.content.strip()
-    except Exception as e:
-        st.error(f"Error generating question: {str(e)}")
-        
-        # Fallback question with language consideration
-        fallback_msg = f"Describe your experience working with {tech_stack[0] if tech_stack else 'your primary technology'} in a production environment."
-        
-        # Try to translate fallback if not English
-        if user_language.lower() != "english":
-            try:
-                translate_prompt = f"Translate this to {user_language}: {fallback_msg}"
-                translate_response = client.chat.completions.create(
-                    model="meta-llama/llama-4-scout-17b-16e-instruct",
-                    messages=[{"role": "user", "content": translate_prompt}],
-                    temperature=0.2,
-                    max_completion_tokens=100,
-                    stream=False,
-                )
-                return translate_response.choices[0].message.content.strip()
-            except:
-                pass
-        
-        return fallback_msg
-
-
-def evaluate_answer(question: str, answer: str, tech_context: str):
-    """Evaluate candidate's answer using Groq AI."""
-    
-    # Get the user's preferred language from session state
-    user_language = st.session_state.get("user_language", "English")
-    
-    eval_prompt = (
-        f"You are an expert technical interviewer evaluating a candidate's response. "
-        f"Your role is strictly limited to technical interview evaluation.\n\n"
-        f"IMPORTANT CONSTRAINTS:\n"
-        f"Technology context: {tech_context}\n"
-        f"Question: '{question}'\n"
-        f"Candidate's answer: '{answer}'\n\n"
-        f"Provide a brief evaluation covering:\n"
-        f"1. Technical accuracy (0-10)\n"
-        f"2. Completeness (0-10)\n"
-        f"3. Clarity of explanation (0-10)\n"
-        f"4. Correctness of explanation (0-10)\n"
-        f"5. Brief constructive feedback\n"
-        f"Keep the response concise and professional. "
-        f"Remember: You are conducting a technical interview. Stay focused on evaluating technical competency. "
-        f"Strictly generate the evaluation in {user_language} language."
-    )
-    
-    try:
-        response = client.chat.completions.create(
-            model="meta-llama/llama-4-scout-17b-16e-instruct",
-            messages=[{"role": "user", "content": eval_prompt}],
-            temperature=0.3,
-            max_completion_tokens=512,
-            top_p=1,
-            stream=False,
-        )
-        return response.choices[0].message.content.strip()
-    except Exception as e:
-        st.error(f"Error evaluating answer: {str(e)}")
-        return "Unable to evaluate answer at this time. Thank you for your response!"
-
-def update_summary():
-    cd = st.session_state.candidate
-    lines = []
-    if cd.get("name"):
-        lines.append(f"**Name**: {cd['name']}")
-    if cd.get("email"):
-        lines.append(f"**Email**: {cd['email']}")
-    if cd.get("phone"):
-        lines.append(f"**Phone**: {cd['phone']}")
-    if cd.get("location"):
-        lines.append(f"**Location**: {cd['location']}")
-    if cd.get("experience"):
-        lines.append(f"**Experience**: {cd['experience']}")
-    if cd.get("position"):
-        lines.append(f"**Position**: {cd['position']}")
-    if cd.get("tech_stack"):
-        stack = ", ".join(cd["tech_stack"])
-        lines.append(f"**Tech-Stack**: {stack}")
-    if cd.get("language_selection"):
-        lines.append(f"**Language**: {cd['language_selection']}")
-    summary.markdown("\n\n".join(lines) if lines else "_No information yet…_")
-
-def ask_next_question():
-    idx = st.session_state.q_idx
-    total_q = st.session_state.total_questions
-    
-    if idx >= total_q:
-        finish_technical()
-        return
-    
-    cd = st.session_state.candidate
-    tech_stack = cd.get("tech_stack", [])
-    experience = cd.get("experience")
-    position = cd.get("position", "Software Developer")
-    
-    with st.spinner("🤖 Generating your next question..."):
-        question = generate_ai_question(tech_stack, experience, position, idx + 1, total_q)
-        st.session_state.current_question = question
-        
-        add_message("assistant", f"**Question {idx+1}/{total_q}**\n\n{question}")
-        st.session_state.q_idx += 1
-
-def finish_technical():
-    add_message("assistant", "🎉 Excellent work – you've completed the technical assessment.")
-    st.session_state.phase = "summary"
-    build_summary()
-
-def build_summary():
-    cd = st.session_state.candidate
-    add_message(
-        "assistant",
-        "### Application Summary\n"
-        f"**Name:** {cd.get('name','_Not provided_')}  \n"
-        f"**Email:** {cd.get('email','_Not provided_')}  \n"
-        f"**Experience:** {cd.get('experience','_Not provided_')}  \n"
-        f"**Position:** {cd.get('position','_Not provided_')}  \n"
-        f"**Location:** {cd.get('location','_Not provided_')}  \n"
-        f"**Tech-Stack:** {', '.join(cd.get('tech_stack',[])) or '_Not provided_'}",
-    )
-    add_message(
-        "assistant",
-        "Thank you for completing the screening! Our recruitment team will review "
-        "your responses within **2-3 business days** and contact you if there is a match.",
-    )
-    st.session_state.phase = "completion"
-
-# Session-state initialization
-if "phase" not in st.session_state:
-    st.session_state.phase = "welcome"
-    st.session_state.messages = []  # Store all chat messages
-    st.session_state.candidate = {}
-    st.session_state.tech_questions = []
-    st.session_state.q_idx = 0
-    st.session_state.consent_given = False
-    st.session_state.personal_step = "name"
-    st.session_state.current_question = ""
-    st.session_state.total_questions = 3
-    st.session_state.technical_responses = []
-    st.session_state.user_language = "English"
-
-# Re-render all stored messages to maintain chat history
-for message in st.session_state.messages:
-    with st.chat_message(message["role"], avatar=message.get("avatar")):
-        st.markdown(message["content"])
-
-# Sidebar summary
-st.sidebar.header("📋 Candidate Summary")
-summary = st.sidebar.empty()
-
-# 
-update_progress_bar()
-
-# Display welcome  on first load
-if st.session_state.phase == "welcome":
-    add_message("assistant", "Hello! I'm **TalentScout**, your AI hiring assistant. 👋")
-    add_message(
-        "assistant",
-        "This screening takes roughly *5–10 minutes* and uses **AI-powered questions** "
-        "tailored to your skills and background.",
-    )
-    add_message(
-        "assistant",
-        f"Before we begin, **do you consent** to our privacy policy?\n\n> {PRIVACY_NOTICE}\n\n"
-        "Please respond with **yes** or **no**.",
-    )
-    st.session_state.phase = "consent"
-
-# Chat input / processing loop
-user_input = st.chat_input("Type your response and hit ⮐")
-
-if user_input:
-    add_message("user", user_input, avatar="👤")
-    
-    phase = st.session_state.phase
-    
-    # Consent phase
-    if phase == "consent":
-        if user_input.lower().startswith(("y", "yes")):
-            st.session_state.consent_given = True
-            add_message(
-                "assistant",
-                "Excellent! Let's start with some basic information. What's your **full name**?",
-            )
-            st.session_state.phase = "personal_info"
-            st.session_state.personal_step = "name"
-            
-        elif user_input.lower().startswith(("n", "no")):
-            add_message(
-                "assistant",
-                "I understand. Without consent we cannot proceed. Feel free to return when ready. 👋",
-            )
-            st.session_state.phase = "completion"
-           
-        else:
-            add_message("assistant", "Please reply **yes** or **no** regarding consent.")
-    
-    # Personal information
-    elif phase == "personal_info":
-        step = st.session_state.personal_step
-        cd = st.session_state.candidate
-        
-        if step == "name":
-            cd["name"] = user_input.strip()
-            add_message("assistant", "Great! What's your **email address**?")
-            st.session_state.personal_step = "email"
-        
-        elif step == "email":
-            if "@" in user_input and "." in user_input:
-                cd["email"] = user_input.strip()
-                add_message("assistant", "Thanks! What's your **phone number**?")
-                st.session_state.personal_step = "phone"
-            else:
-                add_message("assistant", "That doesn't look like a valid email. Please try again.")
-        
-        elif step == "phone":
-            cd["phone"] = user_input.strip()
-            add_message("assistant", "And your **current location** (city, country)?")
-            st.session_state.personal_step = "location"
-        
-        elif step == "location":
-            cd["location"] = user_input.strip()
-            add_message(
-                "assistant",
-                "Awesome. How many **years of experience** do you have in technology?",
-            )
-            st.session_state.phase = "professional_info"
-            st.session_state.personal_step = "experience"
-            
-        update_summary()
-    
-    # Professional info
-    elif phase == "professional_info":
-        step = st.session_state.personal_step
-        cd = st.session_state.candidate
-        
-        if step == "experience":
-            cd["experience"] = user_input.strip()
-            add_message(
-                "assistant",
-                "What **position(s)** are you interested in or currently seeking?",
-            )
-            st.session_state.personal_step = "position"
-        
-        elif step == "position":
-            cd["position"] = user_input.strip()
-            add_message(
-                "assistant",
-                "Great choice! Please list your **tech stack** "
-                "(languages / frameworks / tools) separated by commas.",
-            )
-            st.session_state.phase = "tech_stack"
-           
-        update_summary()
-    
-    # Tech stack phase
-    elif phase == "tech_stack":
-        techs = [t.strip() for t in user_input.split(",") if t.strip()]
-        if techs:
-            cd = st.session_state.candidate
-            cd["tech_stack"] = techs
-            update_summary()
-            
-            add_message("assistant", f"Impressive stack: {', '.join(techs)}")
-            add_message(
-                "assistant",
-                "**What language would you like to use for Questions?** 🌍\n\n"
-                "Please type your preferred language (e.g., English, Spanish, Hindi, French, etc.):"
-            )
-            # add_message(
-            #     "assistant",
-            #     "Perfect! Now I'll generate **AI-powered technical questions** "
-            #     f"tailored to your skills. Ready for {st.session_state.total_questions} questions?",
-            # )
-            
-            # st.session_state.q_idx = 0
-            # st.session_state.technical_responses = []  # Reset responses
-            st.session_state.phase = "language_selection"
-            
-            
-        else:
-            add_message("assistant", "Please provide at least one technology.")
-        # st.session_state.phase = "technical_assessment"
-        update_summary()
-    
-    elif phase=="language_selection":
-        detected_language = detect_language_with_groq(user_input)
-        st.session_state.user_language = detected_language
-        st.session_state.candidate["preferred_language"] = detected_language
-        cd = st.session_state.candidate
-        cd["language_selection"] = detected_language
-        add_message("assistant", f"Perfect! I've noted that you prefer **{detected_language}** for this Questions. 👍")
-        add_message(
-                "assistant",
-                "Perfect! Now I'll generate **AI-powered technical questions** "
-                f"tailored to your skills. Ready for {st.session_state.total_questions} questions?",
-            )
-            
-        st.session_state.q_idx = 0
-        st.session_state.technical_responses = []  # Reset responses
-        st.session_state.phase = "technical_assessment"
-        update_summary()
-        ask_next_question()
-    # Technical Q&A
-    elif phase == "technical_assessment":
-        # Store the user's answer
-        if not hasattr(st.session_state, 'technical_responses'):
-            st.session_state.technical_responses = []
-        
-        # Get the current question info
-        current_q_num = st.session_state.q_idx - 1
-        current_question = st.session_state.current_question
-        tech_context = ", ".join(st.session_state.candidate.get("tech_stack", []))
-        
-        # Store response
-        st.session_state.technical_responses.append({
-            "question_number": current_q_num + 1,
-            "question": current_question,
-            "answer": user_input,
-            "timestamp": datetime.utcnow().isoformat()
-        })
-        
-        # Evaluate the answer using AI
-        with st.spinner("🤖 Evaluating your answer..."):
-            evaluation = evaluate_answer(current_question, user_input, tech_context)
-            add_message("assistant", f"**📊 Evaluation:**\n\n{evaluation}")
-        
-        # Move to next question or finish
-        if st.session_state.q_idx < st.session_state.total_questions:
-            ask_next_question()
-        else:
-            finish_technical()
-    
-    # Fallback for completion
-    else:
-        if st.session_state.phase == "completion":
-            add_message(
-                "assistant", "The session is complete. Thank you for using TalentScout! 👋"
-            )
-        else:
-            add_message("assistant", random.choice(FALLBACK_RESPONSES))
-   
-
-   
-    #st.rerun()
-
-# Export / reset widgets
-st.sidebar.markdown("---")
-
-# Export functionality
-if st.sidebar.button("⬇️ Export Session Data"):
-    try:
-        # Create text format export
-        export_lines = []
-        export_lines.append("=" * 60)
-        export_lines.append("TALENTSCOUT SESSION EXPORT")
-        export_lines.append("=" * 60)
-        export_lines.append(f"Export Date: {datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S UTC')}")
-        export_lines.append(f"Session Phase: {st.session_state.get('phase', 'unknown').title()}")
-        export_lines.append("")
-        
-        # Candidate Information
-        cd = st.session_state.get('candidate', {})
-        if cd:
-            export_lines.append("CANDIDATE INFORMATION:")
-            export_lines.append("-" * 25)
-            for key, value in cd.items():
-                if isinstance(value, list):
-                    value = ", ".join(value)
-                export_lines.append(f"{key.replace('_', ' ').title()}: {value}")
-            export_lines.append("")
-        
-        # Chat Messages
-        export_lines.append("CONVERSATION HISTORY:")
-        export_lines.append("-" * 25)
-        
-        for msg in st.session_state.get('messages', []):
-            role = msg.get('role', 'unknown')
-            content = msg.get('content', '')
-            timestamp = msg.get('timestamp', '')
-            
-            if role == 'assistant':
-                # Assistant messages on the left
-                export_lines.append(f"🤖 AI Assistant:")
-                export_lines.append(f"{content}")
-                export_lines.append("")
-            elif role == 'user':
-                
-                lines = content.split('\n')
-                max_width = 60
-                export_lines.append(f"{'👤 User:':>60}")
-                for line in lines:
-                    if len(line) <= max_width:
-                        export_lines.append(f"{line:>{max_width}}")
-                    else:
-                        
-                        words = line.split(' ')
-                        current_line = ""
-                        for word in words:
-                            if len(current_line + word + " ") <= max_width:
-                                current_line += word + " "
-                            else:
-                                if current_line:
-                                    export_lines.append(f"{current_line.strip():>{max_width}}")
-                                current_line = word + " "
-                        if current_line:
-                            export_lines.append(f"{current_line.strip():>{max_width}}")
-                export_lines.append("")
-        
-        # Technical Responses Summary
-        tech_responses = st.session_state.get('technical_responses', [])
-        if tech_responses:
-            export_lines.append("TECHNICAL ASSESSMENT SUMMARY:")
-            export_lines.append("-" * 35)
-            for i, response in enumerate(tech_responses, 1):
-                export_lines.append(f"Question {i}:")
-                export_lines.append(f"Q: {response.get('question', 'N/A')}")
-                export_lines.append(f"A: {response.get('answer', 'N/A')}")
-                export_lines.append("")
-        
-        # Session Metadata
-        export_lines.append("SESSION METADATA:")
-        export_lines.append("-" * 20)
-        export_lines.append(f"Total Questions: {st.session_state.get('total_questions', 3)}")
-        export_lines.append(f"Questions Answered: {len(st.session_state.get('technical_responses', []))}")
-        export_lines.append(f"Completion Status: {st.session_state.get('phase', 'unknown').title()}")
-        export_lines.append("")
-        export_lines.append("=" * 60)
-        export_lines.append("END OF SESSION EXPORT")
-        export_lines.append("=" * 60)
-
-        text_content = "\n".join(export_lines)
-        
-        st.sidebar.download_button(
-            label="📄 Download Session Data (TXT)",
-            data=text_content,
-            file_name=f"talentscout_session_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.txt",
-            mime="text/plain",
-            key="download_session"
-        )
-        
-    except Exception as e:
-        st.sidebar.error(f"Export error: {str(e)}")
-
-# Reset functionality
-if st.sidebar.button("🔄 New Session", key="reset_session"):
-    try:
-        # Clear all session state variables
-        keys_to_delete = list(st.session_state.keys())
-        for key in keys_to_delete:
-            del st.session_state[key]
-        
-        # Force a clean rerun
-        st.rerun()
-        
-    except Exception as e:
-        st.sidebar.error(f"Reset error: {str(e)}")
-
-# Add configuration in sidebar
-st.sidebar.markdown("---")
-st.sidebar.subheader("Privacy")
-st.sidebar.markdown(PRIVACY_NOTICE)
+from contextlib import nullcontext
+import time
+import zlib
+from datetime import datetime
+import os
+import streamlit as st
+from dotenv import load_dotenv
+
+import async_llm
+import export
+import history
+import llm
+import metrics
+import session_store
+from engine import PHASES, USER_AVATAR, Busy, InterviewEngine, SessionState
+from services import InterviewServices
+
+load_dotenv()
+
+# Newest messages rendered as chat bubbles; older ones collapse into one block (0 renders all)
+LIVE_MESSAGES = int(os.getenv("TALENTSCOUT_LIVE_MESSAGES", "20"))
+
+# Seconds between checks for evaluations that finish after the summary
+EVAL_POLL = 2
+
+# Run Groq calls as coroutines on a shared background event loop (set to 1 to enable)
+LLM_ASYNC = os.getenv("TALENTSCOUT_LLM_ASYNC", "0") != "0"
+
+# Operator panel with LLM call metrics, cache and bank stats in the sidebar
+DEBUG_PANEL = os.getenv("TALENTSCOUT_DEBUG", "0") != "0"
+
+@st.cache_resource
+def get_llm_gateway():
+    """Groq gateway shared by every session and worker thread in this process."""
+    metrics.serve()  # no-op unless TALENTSCOUT_METRICS_PORT is set
+    gateway_cls = async_llm.AsyncLLMGateway if LLM_ASYNC else llm.LLMGateway
+    return gateway_cls.from_env()
+
+@st.cache_resource
+def get_services():
+    """Interview services (worker pool, question bank) shared by all sessions."""
+    return InterviewServices(get_llm_gateway(), on_error=st.error)
+
+@st.cache_resource
+def get_session_store():
+    """Durable session store shared by all sessions, or None when disabled."""
+    return session_store.from_env()
+
+services = get_services()
+store = get_session_store()
+interview = InterviewEngine(services)
+
+# Page configuration
+st.set_page_config(
+    page_title="TalentScout - AI Hiring Assistant",
+    page_icon="🧠",
+    layout="centered",
+    initial_sidebar_state="expanded"
+)
+
+# Custom CSS (keeping your original styling)
+st.markdown("""
+<style>
+    /* Main app styling */
+    .main {
+        padding-top: 1rem;
+    }
+    
+    /* Chat container styling */
+    .stChatMessage {
+        background-color: #f8f9fa;
+        border-radius: 10px;
+        padding: 1rem;
+        margin-bottom: 1rem;
+        border-left: 4px solid #007bff;
+        display: flex;
+        width: 100%;
+    }
+    
+   /* User message styling */
+.stChatMessage[data-testid="user-message"] {
+    background-color: #007bff;
+    color: white;
+    border-left: none;
+    border-right: 4px solid #0056b3;
+    margin-left: auto;
+    margin-right: 0;
+    max-width: 70%;
+    text-align: right;
+    display: flex;
+    flex-direction: column;
+    align-items: flex-end;
+    justify-content: flex-start;
+    width: fit-content; /* Ensures container only takes needed space */
+    min-width: 200px; /* Optional: sets minimum width */
+}
+
+/* Additional styling to ensure all child elements align right */
+.stChatMessage[data-testid="user-message"] * {
+    text-align: right !important;
+    align-self: flex-end;
+    width: 100%;
+}
+
+/* Specific targeting for text content */
+.stChatMessage[data-testid="user-message"] p,
+.stChatMessage[data-testid="user-message"] div,
+.stChatMessage[data-testid="user-message"] span {
+    text-align: right !important;
+    direction: rtl; /* Right-to-left direction for better right alignment */
+    unicode-bidi: plaintext; /* Maintains proper text rendering */
+}
+
+
+    /* Assistant message styling */
+    .stChatMessage[data-testid="assistant-message"] {
+        background-color: #f5f5f5;
+        border-left: 4px solid #4caf50;
+        margin-left: 0;
+        margin-right: auto;
+        max-width: 70%;
+        text-align: left;
+    }
+    
+    /* Chat input styling */
+    .stChatInput {
+        position: sticky;
+        bottom: 0;
+        background: white;
+        border-top: 1px solid #e0e0e0;
+        padding: 1rem 0;
+        z-index: 100;
+    }
+    
+    .stChatInput > div {
+        max-width: 100%;
+    }
+    
+    /* Sidebar styling */
+    .css-1d391kg {
+        background-color: #f8f9fa;
+    }
+    
+    /* Progress bar styling */
+    .stProgress > div > div > div {
+        background-color: #007bff;
+    }
+    
+    /* Button styling */
+    .stButton > button {
+        background-color: #007bff;
+        color: white;
+        border-radius: 8px;
+        border: none;
+        padding: 0.5rem 1rem;
+        font-weight: 500;
+        transition: all 0.3s ease;
+    }
+    
+    .stButton > button:hover {
+        background-color: #0056b3;
+        transform: translateY(-2px);
+        box-shadow: 0 4px 8px rgba(0,0,0,0.1);
+    }
+    
+    /* Sidebar header */
+    .css-1lcbmhc h1 {
+        color: #007bff;
+        font-size: 1.5rem;
+        font-weight: 600;
+        margin-bottom: 1rem;
+    }
+    
+    /* Summary box styling */
+    .css-1v0mbdj {
+        background-color: white;
+        border: 1px solid #e0e0e0;
+        border-radius: 8px;
+        padding: 1rem;
+        margin-bottom: 1rem;
+    }
+    
+    /* Avatar styling */
+    .stChatMessage .css-1v0mbdj {
+        width: 40px;
+        height: 40px;
+        border-radius: 50%;
+        display: flex;
+        align-items: center;
+        justify-content: center;
+        font-weight: bold;
+    }
+    
+    /* User avatar - positioned on right */
+    .stChatMessage[data-testid="user-message"] .css-1v0mbdj {
+        margin-left: 1rem;
+        margin-right: 0;
+        background-color: #0056b3;
+        color: white;
+    }
+    
+    /* Assistant avatar - positioned on left */
+    .stChatMessage[data-testid="assistant-message"] .css-1v0mbdj {
+        margin-right: 1rem;
+        margin-left: 0;
+        background-color: #4caf50;
+        color: white;
+    }
+    
+    /* Spinner styling */
+    .stSpinner {
+        color: #007bff;
+    }
+    
+    /* Title styling */
+    h1 {
+        color: #007bff;
+        text-align: center;
+        margin-bottom: 2rem;
+        font-weight: 600;
+    }
+    
+    /* Privacy notice styling */
+    .css-1v0mbdj blockquote {
+        background-color: #fff3cd;
+        border-left: 4px solid #ffc107;
+        padding: 1rem;
+        margin: 1rem 0;
+        border-radius: 4px;
+    }
+    
+    /* Question styling */
+    .stChatMessage strong {
+        color: #007bff;
+        font-size: 1.1rem;
+    }
+    
+    /* User message question styling */
+    .stChatMessage[data-testid="user-message"] strong {
+        color: white;
+    }
+    
+    /* Evaluation styling */
+    .stChatMessage h3 {
+        color: #28a745;
+        margin-bottom: 0.5rem;
+    }
+</style>
+""", unsafe_allow_html=True)
+
+PHASE_FRIENDLY = {
+    "welcome": "Getting Started",
+    "language_selection": "Language Selection",  
+    "consent": "Privacy Consent",
+    "personal_info": "Personal Information",
+    "professional_info": "Professional Background",
+    "tech_stack": "Tech-Stack Review",
+    "technical_assessment": "Technical Assessment",
+    "summary": "Summary Review",
+    "completion": "Complete",
+}
+# Helper functions
+def render_message(role: str, content: str, avatar: str | None = None):
+    """Render a message as a chat bubble."""
+    with st.chat_message(role, avatar=avatar):
+        st.markdown(content)
+
+def stream_message(role: str, chunks, avatar: str | None = None, prefix: str = "", started: float | None = None):
+    """Render streamed text chunks into a chat bubble and return the final text.
+
+    ``started`` is when the request behind ``chunks`` was issued, so the
+    time-to-first-token includes the wait under the spinner.
+    """
+    started = time.perf_counter() if started is None else started
+    first_token = []
+
+    def timed_chunks():
+        if prefix:
+            yield prefix
+        for chunk in chunks:
+            if not first_token:
+                first_token.append(time.perf_counter() - started)
+            yield chunk
+
+    with st.chat_message(role, avatar=avatar):
+        content = st.write_stream(timed_chunks())
+    if not isinstance(content, str):
+        content = "".join(str(part) for part in content)
+    content = content.rstrip()
+
+    # Time-to-first-token is the headline latency number for streamed turns
+    if first_token:
+        st.session_state.setdefault("stream_ttft", []).append(first_token[0])
+    return content
+
+def render_replies(replies):
+    """Render what the engine yields, showing a spinner while it is busy."""
+    busy = None
+    while True:
+        # The engine issues the request for a streamed reply inside next()
+        requested = time.perf_counter()
+        with st.spinner(busy) if busy else nullcontext():
+            item = next(replies, None)
+        if item is None:
+            return
+        if isinstance(item, Busy):
+            busy = item.message
+            continue
+        busy = None
+        if item.streamed:
+            content = stream_message(item.role, item.content, item.avatar, prefix=item.prefix, started=requested)
+            item.text = content[len(item.prefix):].strip()
+        else:
+            render_message(item.role, f"{item.prefix}{item.content}", item.avatar)
+
+def format_collapsed_message(message) -> str:
+    speaker = "👤 **You**" if message["role"] == "user" else "🤖 **TalentScout**"
+    return f"{speaker}\n\n{message['content']}"
+
+def collapsed_history_markdown(count: int) -> str:
+    """Markdown for the first ``count`` messages, extended incrementally across reruns.
+
+    With the cold history tier on, the cached block is kept compressed as well.
+    """
+    cache = st.session_state.get("history_block")
+    if cache is None or cache["count"] > count:
+        cache = {"count": 0, "markdown": ""}
+    markdown = cache["markdown"]
+    if isinstance(markdown, bytes):
+        markdown = zlib.decompress(markdown).decode("utf-8")
+    if cache["count"] < count:
+        new_parts = [format_collapsed_message(m) for m in state.messages[cache["count"]:count]]
+        markdown = "\n\n---\n\n".join(filter(None, [markdown, *new_parts]))
+        cache = {
+            "count": count,
+            "markdown": zlib.compress(markdown.encode("utf-8")) if history.COLD_AFTER > 0 else markdown,
+        }
+    st.session_state.history_block = cache
+    return markdown
+
+def load_full_history():
+    """Fetch the messages a resumed session left in the store."""
+    if store is not None and state.history_offset:
+        store.load_history(state)
+        st.session_state.pop("history_block", None)
+
+def render_history():
+    """Render the newest messages as chat bubbles and fold older ones into one block.
+
+    Per-rerun render cost stays flat as the conversation grows: the folded
+    part is a single cached markdown element instead of one bubble per message.
+    """
+    if state.history_offset and st.button(f"Load {state.history_offset} earlier messages"):
+        load_full_history()
+    messages = state.messages
+    cutoff = max(len(messages) - LIVE_MESSAGES, 0) if LIVE_MESSAGES > 0 else 0
+    if cutoff:
+        with st.expander(f"Show {cutoff} earlier messages"):
+            st.markdown(collapsed_history_markdown(cutoff))
+    for message in messages[cutoff:]:
+        render_message(message["role"], message["content"], message.get("avatar"))
+
+def update_progress_bar():
+    """Update the progress bar based on current phase and assessment progress."""
+    current_phase = state.phase
+    phase_idx = PHASES.index(current_phase)
+    total_phases = len(PHASES)
+    
+    if current_phase == "technical_assessment":
+        # Calculate fine-grained progress within technical assessment
+        answered_questions = len(state.technical_responses)
+        total_questions = state.total_questions
+        
+        # Base progress from completed phases
+        base_progress = phase_idx / total_phases
+        # Progress within current phase
+        phase_progress = (answered_questions / total_questions) / total_phases
+        
+        total_progress = int((base_progress + phase_progress) * 100)
+        label = f"{PHASE_FRIENDLY[current_phase]} "
+    else:
+        # Standard phase progress
+        total_progress = int(((phase_idx + 1) / total_phases) * 100)
+        label = PHASE_FRIENDLY[current_phase]
+    
+    st.sidebar.progress(total_progress, text=f"Phase: {label}")
+
+def update_summary():
+    cd = state.candidate
+    lines = []
+    if cd.get("name"):
+        lines.append(f"**Name**: {cd['name']}")
+    if cd.get("email"):
+        lines.append(f"**Email**: {cd['email']}")
+    if cd.get("phone"):
+        lines.append(f"**Phone**: {cd['phone']}")
+    if cd.get("location"):
+        lines.append(f"**Location**: {cd['location']}")
+    if cd.get("experience"):
+        lines.append(f"**Experience**: {cd['experience']}")
+    if cd.get("position"):
+        lines.append(f"**Position**: {cd['position']}")
+    if cd.get("tech_stack"):
+        stack = ", ".join(cd["tech_stack"])
+        lines.append(f"**Tech-Stack**: {stack}")
+    if cd.get("language_selection"):
+        lines.append(f"**Language**: {cd['language_selection']}")
+    summary.markdown("\n\n".join(lines) if lines else "_No information yet…_")
+
+@st.fragment(run_every=EVAL_POLL)
+def poll_evaluations():
+    """Rerun the page once a queued evaluation finishes, even if the candidate sends nothing."""
+    if services.evaluations_ready(state):
+        st.rerun()
+
+# Session-state initialization
+if "interview" not in st.session_state:
+    # Resume the interview named in the URL, e.g. after a restart or on another replica
+    resumed = None
+    session_id = st.query_params.get("session")
+    if store is not None and session_id:
+        try:
+            resumed = store.load(session_id, SessionState, tail=LIVE_MESSAGES)
+        except Exception as e:
+            st.error(f"Could not restore session: {str(e)}")
+    st.session_state.interview = resumed or SessionState()
+state = st.session_state.interview
+
+# Re-render stored messages to maintain chat history
+render_history()
+
+# Queued evaluations that finished since the last rerun, so the store and exports get them
+render_replies(interview.late_evaluations(state))
+
+# Sidebar summary
+st.sidebar.header("📋 Candidate Summary")
+summary = st.sidebar.empty()
+
+# 
+update_progress_bar()
+
+# Display welcome  on first load
+render_replies(interview.start(state))
+
+# Chat input / processing loop
+user_input = st.chat_input("Type your response and hit ⮐")
+
+if user_input:
+    render_message("user", user_input, avatar=USER_AVATAR)
+    render_replies(interview.handle(state, user_input))
+
+update_summary()
+
+# Evaluations still queued after the summary are picked up by the next rerun
+if state.phase in ("summary", "completion") and services.pending_futures(state):
+    poll_evaluations()
+
+# Persist this turn's changes and keep the session id in the URL for resuming
+if store is not None:
+    try:
+        store.save(state)
+        if st.query_params.get("session") != state.session_id:
+            st.query_params["session"] = state.session_id
+    except Exception as e:
+        st.error(f"Could not save session: {str(e)}")
+
+# Export / reset widgets
+st.sidebar.markdown("---")
+
+# Export functionality
+export_format = st.sidebar.selectbox("Export format", list(export.FORMATS), format_func=str.upper, key="export_format")
+if st.sidebar.button("⬇️ Export Session Data"):
+    try:
+        load_full_history()
+        _, mime = export.FORMATS[export_format]
+        st.sidebar.download_button(
+            label=f"📄 Download Session Data ({export_format.upper()})",
+            data=export.to_bytes(state, export_format),
+            file_name=f"talentscout_session_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}.{export_format}",
+            mime=mime,
+            key="download_session"
+        )
+        
+    except Exception as e:
+        st.sidebar.error(f"Export error: {str(e)}")
+
+# Reset functionality
+if st.sidebar.button("🔄 New Session", key="reset_session"):
+    try:
+        # Stop background question generation for this session
+        services.reset(state)
+
+        # Delete the stored copy and forget the session id
+        if store is not None and state.session_id:
+            store.delete(state.session_id)
+        st.query_params.clear()
+        
+        # Clear all session state variables
+        keys_to_delete = list(st.session_state.keys())
+        for key in keys_to_delete:
+            del st.session_state[key]
+        
+        # Force a clean rerun
+        st.rerun()
+        
+    except Exception as e:
+        st.sidebar.error(f"Reset error: {str(e)}")
+
+# Add configuration in sidebar
+st.sidebar.markdown("---")
+st.sidebar.subheader("Privacy")
+st.sidebar.markdown(services.localize(state, "privacy_notice"))
+
+if DEBUG_PANEL:
+    with st.sidebar.expander("🛠️ LLM metrics (process-wide)"):
+        rows = metrics.summary()
+        if rows:
+            st.dataframe(rows, hide_index=True)
+        else:
+            st.caption("No LLM calls yet.")
+        tiers = metrics.tier_summary()
+        if tiers:
+            st.caption("Routed calls per model tier")
+            st.dataframe(tiers, hide_index=True)
+        ttft = st.session_state.get("stream_ttft", [])
+        if ttft:
+            st.caption(f"This session: {len(ttft)} streamed replies, last first token after {ttft[-1]:.2f}s")
+        st.json(services.stats(), expanded=False)
@@ -0,0 +1,206 @@
+"""Asyncio execution path for Groq calls.
+
+``AsyncLLMGateway`` runs an ``AsyncGroq`` client on one long-lived event loop
+in a background thread, shared by every session in the process. Requests in
+flight cost a coroutine instead of a blocked thread, so one process can keep
+hundreds of completions going at once.
+
+Two ways in:
+
+- ``submit(coro)`` schedules one of the ``request_*`` coroutines below and
+  returns a ``concurrent.futures.Future`` to poll or wait on. Services use it
+  for background question generation and question bank top-ups, so those no
+  longer hold a worker thread per call.
+- ``chat.completions.create`` is a blocking facade, so the gateway also works
+  with the sync helpers in llm.py. Streamed responses are pumped by the loop
+  into a queue and read as a normal iterator.
+
+Deadlines, retries with backoff, the in-flight cap, routing, the circuit
+breaker and ``metrics`` recording behave as in ``llm.LLMGateway``.
+"""
+
+import asyncio
+import queue
+import threading
+import time
+
+import httpx
+from groq import AsyncGroq
+
+import llm
+
+_DONE = object()
+
+
+class _AsyncReleasingStream:
+    """Async streamed response that frees its slot and reports metrics when it ends."""
+
+    def __init__(self, stream, release, started: float, on_done):
+        self._stream = stream
+        self._release = release
+        self._started = started
+        self._on_done = on_done
+        self._ttft = None
+        self._usage = None
+        self._outcome = "abandoned"
+
+    async def __aiter__(self):
+        try:
+            async for chunk in self._stream:
+                if self._ttft is None:
+                    self._ttft = time.perf_counter() - self._started
+                x_groq = getattr(chunk, "x_groq", None)
+                usage = getattr(x_groq, "usage", None) or getattr(chunk, "usage", None)
+                if usage is not None:
+                    self._usage = usage
+                yield chunk
+            self._outcome = "ok"
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            self._outcome = "error"
+            raise
+        finally:
+            await self.aclose()
+
+    async def aclose(self):
+        if self._release is not None:
+            release, self._release = self._release, None
+            try:
+                await self._stream.close()
+            finally:
+                release()
+                self._on_done(self._outcome, self._ttft, self._usage)
+
+
+class _QueueStream:
+    """Sync iterator over an async stream that the event loop pumps into a queue."""
+
+    def __init__(self, gateway, stream):
+        self._queue = queue.Queue()
+        self._pump = gateway.submit(self._run(stream))
+
+    async def _run(self, stream):
+        try:
+            async for chunk in stream:
+                self._queue.put(chunk)
+        except Exception as error:
+            self._queue.put(error)
+        finally:
+            await stream.aclose()
+            self._queue.put(_DONE)
+
+    def __iter__(self):
+        try:
+            while (item := self._queue.get()) is not _DONE:
+                if isinstance(item, Exception):
+                    raise item
+                yield item
+        finally:
+            self.close()
+
+    def close(self):
+        self._pump.cancel()
+
+    def __del__(self):
+        self.close()
+
+
+class AsyncLLMGateway(llm.LLMGateway):
+    """``LLMGateway`` whose calls run as coroutines on a shared background event loop."""
+
+    def _connect(self, api_key, base_url, timeout: float, max_inflight: int):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self.loop.run_forever, name="llm-event-loop", daemon=True)
+        self._thread.start()
+        self._slots = asyncio.Semaphore(max_inflight)
+        self.http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=max_inflight, max_keepalive_connections=max_inflight),
+            timeout=timeout,
+        )
+        self.client = AsyncGroq(api_key=api_key, base_url=base_url, http_client=self.http_client, max_retries=0, timeout=timeout)
+
+    def submit(self, coro):
+        """Schedule ``coro`` on the gateway's loop; returns a ``concurrent.futures.Future``."""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def create(self, *, deadline: float | None = None, task: str = "-", phase: str = "-", **kwargs):
+        """Blocking ``chat.completions.create``; streams come back as a sync iterator."""
+        response = self.submit(self.acreate(deadline=deadline, task=task, phase=phase, **kwargs)).result()
+        if kwargs.get("stream"):
+            return _QueueStream(self, response)
+        return response
+
+    async def acreate(self, *, deadline: float | None = None, task: str = "-", phase: str = "-", **kwargs):
+        """Async ``chat.completions.create`` with retries inside a per-call deadline (seconds)."""
+        call = llm._Call(self, deadline, task, phase, kwargs)
+        while True:
+            remaining = call.remaining()
+            try:
+                if remaining <= 0:
+                    raise TimeoutError
+                await asyncio.wait_for(self._slots.acquire(), remaining)
+            except TimeoutError:
+                raise call.slot_timeout() from None
+            try:
+                response = await self.client.chat.completions.create(timeout=call.request_timeout(), **kwargs)
+            except Exception as error:
+                self._slots.release()
+                delay = call.retry_delay(error)
+                if delay is None:
+                    raise
+                if delay:
+                    await asyncio.sleep(delay)
+                continue
+            return call.respond(response, self._slots.release, _AsyncReleasingStream)
+
+    def close(self):
+        """Close the HTTP client and stop the loop."""
+        self.submit(self.http_client.aclose()).result()
+        self.loop.call_soon_threadsafe(self.loop.stop)
+
+
+# Async twins of the llm.request_* helpers, for AsyncLLMGateway.submit()
+async def request_language(client, user_input: str, phase: str = "-") -> str:
+    response = await client.acreate(task="language", phase=phase, **llm.language_request(user_input))
+    return response.choices[0].message.content.strip()
+
+
+async def request_question(client, tech_stack: list, experience, position: str, user_language: str, phase: str = "-") -> str:
+    response = await client.acreate(
+        task="question", phase=phase, **llm.question_request(tech_stack, experience, position, user_language),
+    )
+    return response.choices[0].message.content.strip()
+
+
+async def request_question_batch(client, tech_stack: list, experience, position: str, user_language: str, count: int,
+                                 phase: str = "-") -> list:
+    response = await client.acreate(
+        task="question_batch", phase=phase,
+        **llm.question_batch_request(tech_stack, experience, position, user_language, count),
+    )
+    return llm.parse_question_batch(response.choices[0].message.content, count)
+
+
+async def request_translation(client, strings: dict, user_language: str, phase: str = "-") -> dict:
+    response = await client.acreate(task="translation", phase=phase, **llm.translation_request(strings, user_language))
+    return llm.parse_translations(response.choices[0].message.content)
+
+
+async def request_structured_evaluation(client, question: str, answer: str, tech_context: str, user_language: str,
+                                        question_number: int, retries: int = 1, phase: str = "-") -> llm.Evaluation:
+    request = llm.structured_evaluation_request(question, answer, tech_context, user_language)
+    for _ in range(retries + 1):
+        response = await client.acreate(task="evaluation", phase=phase, **request)
+        evaluation = llm.parse_evaluation(response.choices[0].message.content, question_number)
+        if evaluation is not None:
+            return evaluation
+    raise ValueError("Model returned a malformed evaluation")
+
+
+async def request_evaluation(client, question: str, answer: str, tech_context: str, user_language: str,
+                             phase: str = "-") -> str:
+    response = await client.acreate(
+        task="evaluation", phase=phase, **llm.evaluation_request(question, answer, tech_context, user_language),
+    )
+    return response.choices[0].message.content.strip()
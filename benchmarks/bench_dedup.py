@@ -0,0 +1,81 @@
+"""Time near-duplicate lookups in ``dedup.DedupIndex`` against a linear scan.
+
+Builds an index of synthetic questions under one key, then looks up reworded
+copies of indexed questions (which should be found) and fresh questions
+(which should not). Needs no API access.
+
+    python benchmarks/bench_dedup.py --questions 5000
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import dedup
+
+VOCABULARY = (
+    "cache index query shard replica leader follower queue topic partition consumer producer lock mutex thread "
+    "process coroutine event loop socket buffer stream batch window join schema migration rollback transaction "
+    "isolation deadlock timeout retry backoff idempotency token session cookie header proxy gateway router "
+    "service mesh container pod node cluster scheduler quota limit budget latency throughput memory heap stack "
+    "garbage collector profiler trace metric alert dashboard incident rollout canary feature flag test fixture "
+    "mock contract snapshot bundle render component hook state reducer store selector effect closure decorator "
+    "generator iterator descriptor metaclass interface generic trait module package dependency lockfile build"
+).split()
+STEMS = ("How would you use", "Explain the role of", "What goes wrong with", "How do you monitor",
+         "Describe a test strategy for", "When would you avoid")
+
+
+def make_question(rng) -> str:
+    return f"{rng.choice(STEMS)} {' '.join(rng.sample(VOCABULARY, 7))}?"
+
+
+def reword(question: str) -> str:
+    return "Could you tell me: " + question.replace("How would you", "How do you").rstrip("?") + "."
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--questions", type=int, default=5000)
+    parser.add_argument("--lookups", type=int, default=500)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    questions = [make_question(rng) for _ in range(args.questions)]
+    key = ("backend developer", ("python",), "mid", "english")
+
+    started = time.perf_counter()
+    index = dedup.DedupIndex()
+    for question in questions:
+        index.add(key, question)
+    build = time.perf_counter() - started
+
+    paraphrases = [reword(q) for q in rng.sample(questions, args.lookups // 2)]
+    fresh = [make_question(rng) for _ in range(args.lookups // 2)]
+    for text in paraphrases + fresh:
+        dedup.signature(text)  # time the lookups, not the hashing
+
+    started = time.perf_counter()
+    found = sum(index.find(key, text) is not None for text in paraphrases)
+    false_hits = sum(index.find(key, text) is not None for text in fresh)
+    indexed = (time.perf_counter() - started) / args.lookups
+
+    scan_lookups = max(10, args.lookups // 50)
+    started = time.perf_counter()
+    for text in paraphrases[:scan_lookups]:
+        dedup.near_duplicate(text, questions)
+    scan = (time.perf_counter() - started) / scan_lookups
+
+    print(f"{args.questions} questions indexed in {build:.2f}s ({build / args.questions * 1000:.2f} ms each incl. hashing), "
+          f"{len(index._sigs) * index._sigs.itemsize / 1024:.0f} KiB of signatures")
+    print(f"lookup: index {indexed * 1000:.3f} ms, linear scan {scan * 1000:.1f} ms ({scan / indexed:,.0f}x)")
+    print(f"paraphrases found {found}/{len(paraphrases)}, fresh questions flagged {false_hits}/{len(fresh)} "
+          f"(threshold {dedup.THRESHOLD})")
+
+
+if __name__ == "__main__":
+    main()
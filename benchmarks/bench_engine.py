@@ -0,0 +1,63 @@
+"""Run simulated interviews through InterviewEngine without Streamlit or Groq.
+
+Uses the engine's OfflineServices, so this measures the non-LLM paths only:
+phase handling, message recording and state updates.
+
+    python benchmarks/bench_engine.py --sessions 10000
+    python benchmarks/bench_engine.py --sessions 2000 --profile
+"""
+
+import argparse
+import cProfile
+import os
+import pstats
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from engine import InterviewEngine, SessionState
+
+SCRIPT = [
+    "yes", "Ada Lovelace", "ada@example.com", "+44 20 7946 0000", "London, UK",
+    "5", "Backend Developer", "Python, Django, PostgreSQL", "English",
+    "A decorator wraps a function.", "Lists are mutable, tuples are not.", "The GIL serializes bytecode.",
+]
+
+
+def run_session(engine):
+    state = SessionState()
+    engine.run_turn(state)
+    for user_input in SCRIPT:
+        engine.run_turn(state, user_input)
+    assert state.phase == "completion", state.phase
+    return state
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=10000)
+    parser.add_argument("--profile", action="store_true", help="print the top functions by cumulative time")
+    args = parser.parse_args()
+
+    engine = InterviewEngine()
+    profiler = cProfile.Profile() if args.profile else None
+    started = time.perf_counter()
+    if profiler:
+        profiler.enable()
+    for _ in range(args.sessions):
+        run_session(engine)
+    if profiler:
+        profiler.disable()
+    elapsed = time.perf_counter() - started
+
+    turns = args.sessions * (len(SCRIPT) + 1)
+    print(f"{args.sessions} sessions, {turns} turns in {elapsed:.2f}s")
+    print(f"{args.sessions / elapsed:,.0f} sessions/s, {turns / elapsed:,.0f} turns/s, "
+          f"{elapsed / turns * 1e6:.1f} us/turn")
+    if profiler:
+        pstats.Stats(profiler).sort_stats("cumulative").print_stats(15)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Time session export and measure its peak memory.
+
+Builds sessions with the engine's OfflineServices in a temporary SQLite
+session store, then:
+
+- exports one long session in each format and reports time and peak traced
+  memory next to the old approach of joining the whole transcript first,
+- streams every stored session into one gzip file with ``bulk_export``.
+
+    python benchmarks/bench_export.py --sessions 2000 --answers 200
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import export
+import session_store
+from engine import InterviewEngine, SessionState
+
+SCRIPT = [
+    "yes", "Ada Lovelace", "ada@example.com", "+44 20 7946 0000", "London, UK",
+    "5", "Backend Developer", "Python, Django, PostgreSQL", "English",
+]
+ANSWER = ("A decorator wraps a function so behaviour can be added before and after each call, "
+          "for example caching, retries, timing or access checks, without changing the function body. ") * 3
+
+
+def build_session(engine, answers: int):
+    state = SessionState()
+    engine.run_turn(state)
+    for user_input in SCRIPT:
+        engine.run_turn(state, user_input)
+    state.total_questions = max(state.total_questions, answers)
+    for _ in range(answers):
+        engine.run_turn(state, ANSWER)
+    return state
+
+
+def measure(fn):
+    tracemalloc.start()
+    started = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=500)
+    parser.add_argument("--answers", type=int, default=200, help="answers in the long single-session export")
+    args = parser.parse_args()
+
+    engine = InterviewEngine()
+    long_session = build_session(engine, args.answers)
+    print(f"one session, {len(long_session.messages)} messages:")
+    elapsed, peak = measure(lambda: "".join(export.iter_txt(long_session)).encode("utf-8"))
+    print(f"  {'txt joined':<16}{elapsed * 1000:>8.1f} ms, peak {peak / 1024:>8.0f} KiB")
+    for fmt in export.FORMATS:
+        elapsed, peak = measure(lambda: export.to_bytes(long_session, fmt))
+        print(f"  {fmt + ' streamed':<16}{elapsed * 1000:>8.1f} ms, peak {peak / 1024:>8.0f} KiB")
+
+    directory = tempfile.mkdtemp(prefix="talentscout-export-")
+    store = session_store.SQLiteSessionStore(os.path.join(directory, "sessions.db"))
+    for _ in range(args.sessions):
+        store.save(build_session(engine, 3))
+    out = os.path.join(directory, "sessions.jsonl.gz")
+    elapsed, peak = measure(lambda: export.bulk_export(store, out))
+    print(f"bulk export of {args.sessions} sessions: {elapsed:.2f}s ({args.sessions / elapsed:,.0f} sessions/s), "
+          f"peak {peak / 1024:.0f} KiB, {os.path.getsize(out) / 1024:.0f} KiB gzip")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Measure memory held per interview session at 10/100/1000 concurrent sessions.
+
+Builds sessions with the engine and LLM-free services whose evaluations are
+as long as real ones, keeps them all alive, and reports traced bytes per
+session for three message layouts:
+
+- ``dicts``: the old layout, one dict per message with an ISO timestamp string,
+- ``records``: ``history.Message`` records in a ``MessageLog``,
+- ``cold``: the same, with messages older than ``--cold-after`` compressed.
+
+    python benchmarks/bench_memory.py --sessions 10 100 1000 --answers 10
+"""
+
+import argparse
+import gc
+import os
+import random
+import sys
+import tracemalloc
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import history
+from engine import InterviewEngine, OfflineServices, SessionState
+
+SCRIPT = [
+    "yes", "Ada Lovelace", "ada@example.com", "+44 20 7946 0000", "London, UK",
+    "5", "Backend Developer", "Python, Django, PostgreSQL", "English",
+]
+ANSWER = ("A decorator wraps a function so behaviour can be added before and after each call, "
+          "for example caching, retries, timing or access checks, without changing the function body.")
+WORDS = (
+    "the answer covers correct concept but misses edge cases error handling performance memory "
+    "concurrency threads async await closure scope decorator generator iterator context manager "
+    "exception testing mocking fixtures database index query transaction isolation cache eviction "
+    "candidate explains clearly could improve example detail trade-offs production experience"
+).split()
+
+
+class VerboseServices(OfflineServices):
+    """Offline services whose evaluations are about as long as Groq's (~1.5 KB)."""
+
+    def __init__(self, seed: int = 0):
+        self.random = random.Random(seed)
+
+    def evaluate(self, state, question, answer):
+        scores = "\n".join(f"{i}. {name}: {self.random.randint(4, 9)}/10" for i, name in
+                           enumerate(["Technical accuracy", "Completeness", "Clarity", "Correctness"], 1))
+        feedback = " ".join(self.random.choice(WORDS) for _ in range(220))
+        return f"{scores}\n\n**Feedback:** {feedback.capitalize()}."
+
+
+class DictEngine(InterviewEngine):
+    """The engine as it recorded messages before ``history``."""
+
+    def record(self, state, role, content, avatar=None):
+        state.messages.append({
+            "role": role,
+            "content": content,
+            "avatar": avatar,
+            "timestamp": datetime.utcnow().isoformat()
+        })
+
+
+def build_session(engine, messages, answers: int):
+    state = SessionState(messages=messages, total_questions=answers)
+    engine.run_turn(state)
+    for user_input in SCRIPT:
+        engine.run_turn(state, user_input)
+    for i in range(answers):
+        engine.run_turn(state, f"{ANSWER} ({i})")
+    return state
+
+
+LAYOUTS = {
+    "dicts": (DictEngine, lambda cold_after: []),
+    "records": (InterviewEngine, lambda cold_after: history.MessageLog(cold_after=0)),
+    "cold": (InterviewEngine, lambda cold_after: history.MessageLog(cold_after=cold_after)),
+}
+
+
+def bytes_per_session(layout: str, sessions: int, answers: int, cold_after: int) -> tuple:
+    engine_cls, new_log = LAYOUTS[layout]
+    engine = engine_cls(VerboseServices())
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    states = [build_session(engine, new_log(cold_after), answers) for _ in range(sessions)]
+    gc.collect()
+    held = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return held / sessions, len(states[0].messages)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--answers", type=int, default=10, help="technical questions answered per session")
+    parser.add_argument("--cold-after", type=int, default=8, help="newest messages kept uncompressed in 'cold'")
+    args = parser.parse_args()
+
+    print(f"{'sessions':>8}  {'layout':>8}  {'messages':>8}  {'bytes/session':>13}  {'total MiB':>9}  {'vs dicts':>8}")
+    for sessions in args.sessions:
+        baseline = None
+        for layout in LAYOUTS:
+            per_session, messages = bytes_per_session(layout, sessions, args.answers, args.cold_after)
+            baseline = baseline or per_session
+            print(f"{sessions:>8}  {layout:>8}  {messages:>8}  {per_session:>13,.0f}  "
+                  f"{per_session * sessions / 2**20:>9.1f}  {per_session / baseline:>7.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""Prompt tokens per call before and after the prompts.py templates.
+
+Replays recorded sessions: the candidate profile, language and each
+question/answer pair. For every LLM call those sessions made, it prints the
+prompt tokens of the old inline f-string prompts next to the templated
+messages, and how many of the new tokens are the stable system prefix that
+providers with prompt caching can reuse. Tokens are estimated with
+``prompts.count_tokens``.
+
+    python benchmarks/bench_prompts.py                      # sessions simulated offline
+    python benchmarks/bench_prompts.py --sessions sessions.jsonl
+
+A sessions file holds one JSON object per line with ``candidate``,
+``user_language`` and ``technical_responses``, as kept on ``SessionState``.
+"""
+
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import prompts
+from engine import InterviewEngine, SessionState
+
+QUESTION_COUNT = 3
+STACKS = ["Python, Django, PostgreSQL", "JavaScript, React, Node.js, TypeScript, Next.js, GraphQL, Redis",
+          "Java, Spring, Kafka", "Go, Kubernetes, gRPC, Terraform, AWS, Prometheus, Grafana, Helm, Istio"]
+ANSWERS = [
+    "It caches results keyed by arguments.",
+    "Use an index on the foreign key and check the query plan before and after.",
+    # Candidates sometimes paste whole files as their answer
+    "Here is my implementation:\n" + "def handler(event):\n    return process(event) if event else None\n" * 120,
+]
+
+
+# The prompts as they were built before prompts.py, kept here for comparison
+def build_language_prompt(user_input: str) -> str:
+    return f"""
+    The user said: "{user_input}"
+
+    They are trying to tell me what language they want to use for interview questions.
+    Please identify the language they mentioned and return just the language name in English.
+
+    Examples:
+    - If they said "Spanish" or "Español" → return "Spanish"
+    - If they said "Hindi" or "हिंदी" → return "Hindi"
+    - If they said "French" or "Français" → return "French"
+    - If they said "German" or "Deutsch" → return "German"
+    - If they said "Chinese" or "中文" → return "Chinese"
+    - If unclear, return "English"
+
+    Return only the language name in English:
+    """
+
+
+def build_question_prompt(tech_stack: list, experience, position: str, user_language: str) -> str:
+    tech_stack_str = ", ".join(tech_stack)
+    return (
+        f"Generate 1 technical interview question for a {position} role. "
+        f"Focus on the following technologies: {tech_stack_str}. "
+        f"Make it practical and relevant to real-world development scenarios. "
+        f"Return only the question without additional formatting. "
+        f"Generate question for short one line answers. "
+        f"Level: {experience}/20 "
+        f"Strictly generate the question in {user_language} language."
+    )
+
+
+def build_question_batch_prompt(tech_stack: list, experience, position: str, user_language: str, count: int) -> str:
+    tech_stack_str = ", ".join(tech_stack)
+    return (
+        f"Generate {count} different technical interview questions for a {position} role. "
+        f"Focus on the following technologies: {tech_stack_str}. "
+        f"Make them practical and relevant to real-world development scenarios. "
+        f"Generate questions for short one line answers. "
+        f"Level: {experience}/20 "
+        f"Strictly generate the questions in {user_language} language. "
+        f'Return only a JSON object of the form {{"questions": ["question 1", "question 2", ...]}} '
+        f"with exactly {count} plain-text questions and no additional formatting."
+    )
+
+
+def build_eval_prompt(question: str, answer: str, tech_context: str, user_language: str) -> str:
+    return (
+        f"You are an expert technical interviewer evaluating a candidate's response. "
+        f"Your role is strictly limited to technical interview evaluation.\n\n"
+        f"IMPORTANT CONSTRAINTS:\n"
+        f"Technology context: {tech_context}\n"
+        f"Question: '{question}'\n"
+        f"Candidate's answer: '{answer}'\n\n"
+        f"Provide a brief evaluation covering:\n"
+        f"1. Technical accuracy (0-10)\n"
+        f"2. Completeness (0-10)\n"
+        f"3. Clarity of explanation (0-10)\n"
+        f"4. Correctness of explanation (0-10)\n"
+        f"5. Brief constructive feedback\n"
+        f"Keep the response concise and professional. "
+        f"Remember: You are conducting a technical interview. Stay focused on evaluating technical competency. "
+        f"Strictly generate the evaluation in {user_language} language."
+    )
+
+
+def recorded_sessions(count: int) -> list:
+    """Run ``count`` scripted sessions through the engine with offline services."""
+    engine = InterviewEngine()
+    sessions = []
+    for i in range(count):
+        state = SessionState()
+        engine.run_turn(state)
+        script = [
+            "yes", f"Candidate {i}", f"c{i}@example.com", "+1 555 0100", "Berlin, Germany", str(1 + i % 12),
+            "Backend Developer", STACKS[i % len(STACKS)], ["English", "Spanish", "German"][i % 3],
+            *(ANSWERS[(i + n) % len(ANSWERS)] for n in range(QUESTION_COUNT)),
+        ]
+        for user_input in script:
+            engine.run_turn(state, user_input)
+        sessions.append({
+            "candidate": state.candidate,
+            "user_language": state.user_language,
+            "technical_responses": state.technical_responses,
+        })
+    return sessions
+
+
+def message_tokens(messages: list) -> int:
+    return sum(prompts.count_tokens(m["content"]) for m in messages)
+
+
+def calls(session: dict):
+    """(task, legacy prompt, templated messages) for every call the session made."""
+    cd = session["candidate"]
+    stack, experience = cd.get("tech_stack", []), cd.get("experience")
+    position, lang = cd.get("position", "Software Developer"), session.get("user_language", "English")
+    profile = dict(tech_stack=stack, experience=experience, position=position, user_language=lang)
+
+    yield "language", build_language_prompt(lang), prompts.LANGUAGE.messages(user_input=lang)
+    yield ("question_batch", build_question_batch_prompt(stack, experience, position, lang, QUESTION_COUNT),
+           prompts.QUESTION_BATCH.messages(count=QUESTION_COUNT, **profile))
+    for response in session["technical_responses"]:
+        yield "question", build_question_prompt(stack, experience, position, lang), prompts.QUESTION.messages(**profile)
+        args = dict(question=response["question"], answer=response["answer"], tech_context=", ".join(stack), user_language=lang)
+        yield "evaluation", build_eval_prompt(**args), prompts.EVALUATION.messages(**args)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", help="JSONL file of recorded sessions")
+    parser.add_argument("--count", type=int, default=200, help="sessions to simulate when no file is given")
+    args = parser.parse_args()
+
+    if args.sessions:
+        with open(args.sessions, encoding="utf-8") as f:
+            sessions = [json.loads(line) for line in f if line.strip()]
+    else:
+        sessions = recorded_sessions(args.count)
+
+    totals = {}  # task -> [calls, before, after, stable prefix, max before, max after]
+    for session in sessions:
+        for task, legacy, messages in calls(session):
+            before, after = prompts.count_tokens(legacy), message_tokens(messages)
+            row = totals.setdefault(task, [0, 0, 0, 0, 0, 0])
+            row[0] += 1
+            row[1] += before
+            row[2] += after
+            row[3] += prompts.count_tokens(messages[0]["content"])
+            row[4] = max(row[4], before)
+            row[5] = max(row[5], after)
+
+    print(f"{len(sessions)} sessions; prompt tokens per call (estimated)")
+    print(f"{'task':<16}{'calls':>7}{'before':>9}{'after':>8}{'prefix':>8}{'uncached':>10}{'max before':>12}{'max after':>11}")
+    all_calls = all_before = all_after = all_prefix = 0
+    for task, (n, before, after, prefix, max_before, max_after) in totals.items():
+        print(f"{task:<16}{n:>7}{before / n:>9.0f}{after / n:>8.0f}{prefix / n:>8.0f}{(after - prefix) / n:>10.0f}"
+              f"{max_before:>12}{max_after:>11}")
+        all_calls, all_before, all_after, all_prefix = all_calls + n, all_before + before, all_after + after, all_prefix + prefix
+    print(f"{'all':<16}{all_calls:>7}{all_before / all_calls:>9.0f}{all_after / all_calls:>8.0f}"
+          f"{all_prefix / all_calls:>8.0f}{(all_after - all_prefix) / all_calls:>10.0f}")
+    print(f"total prompt tokens: {all_before:,} before, {all_after:,} after ({1 - all_after / all_before:.0%} fewer); "
+          f"{all_after - all_prefix:,} outside the cacheable prefix ({1 - (all_after - all_prefix) / all_before:.0%} fewer)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""Compare batched vs per-question generation: wall time and token usage.
+
+Runs against the real Groq API (GROQ_API_KEY) or any compatible endpoint
+set through GROQ_BASE_URL.
+
+    python benchmarks/bench_question_batch.py --questions 3 --rounds 5
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv
+from groq import Groq
+
+import llm
+
+
+class UsageRecorder:
+    """Wrap a Groq client and add up ``response.usage`` of every call."""
+
+    def __init__(self, client):
+        self._client = client
+        self.chat = self
+        self.completions = self
+        self.calls = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+
+    def create(self, **kwargs):
+        response = self._client.chat.completions.create(**kwargs)
+        self.calls += 1
+        if response.usage:
+            self.prompt_tokens += response.usage.prompt_tokens
+            self.completion_tokens += response.usage.completion_tokens
+        return response
+
+
+def run_single(client, args):
+    for _ in range(args.questions):
+        llm.request_question(client, args.tech_stack, args.experience, args.position, args.language)
+
+
+def run_batch(client, args):
+    slots = llm.request_question_batch(client, args.tech_stack, args.experience, args.position, args.language, args.questions)
+    # Same fallback the app uses: regenerate only the slots that failed to parse
+    for slot in slots:
+        if slot is None:
+            llm.request_question(client, args.tech_stack, args.experience, args.position, args.language)
+    return slots.count(None)
+
+
+def measure(name, runner, client, args):
+    timings = []
+    failed_slots = 0
+    recorder = UsageRecorder(client)
+    for _ in range(args.rounds):
+        started = time.perf_counter()
+        failed_slots += runner(recorder, args) or 0
+        timings.append(time.perf_counter() - started)
+    rounds = args.rounds
+    print(
+        f"{name:<8} wall mean {statistics.mean(timings):6.2f}s  "
+        f"median {statistics.median(timings):6.2f}s  "
+        f"calls/set {recorder.calls / rounds:4.1f}  "
+        f"prompt tok/set {recorder.prompt_tokens / rounds:7.1f}  "
+        f"completion tok/set {recorder.completion_tokens / rounds:7.1f}"
+        + (f"  fallback slots {failed_slots}" if name == "batch" else "")
+    )
+
+
+def main():
+    load_dotenv()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--questions", type=int, default=3)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--position", default="Backend Developer")
+    parser.add_argument("--experience", default="5")
+    parser.add_argument("--language", default="English")
+    parser.add_argument("--tech-stack", default="Python, Django, PostgreSQL")
+    args = parser.parse_args()
+    args.tech_stack = [t.strip() for t in args.tech_stack.split(",") if t.strip()]
+
+    client = Groq(api_key=os.getenv("GROQ_API_KEY"))
+    print(f"{args.rounds} rounds x {args.questions} questions, model {llm.MODEL}")
+    measure("single", run_single, client, args)
+    measure("batch", run_batch, client, args)
+
+
+if __name__ == "__main__":
+    main()
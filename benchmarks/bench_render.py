@@ -0,0 +1,75 @@
+"""Measure Streamlit script execution time against chat-history length.
+
+Each sample preloads a finished session with N messages and times a rerun of
+app.py through Streamlit's AppTest harness, once rendering every message as
+a chat bubble (TALENTSCOUT_LIVE_MESSAGES=0) and once with older messages
+folded into the cached history block. No LLM calls are made.
+
+    python benchmarks/bench_render.py --sizes 10 50 100 500 --repeat 5
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from datetime import datetime
+
+os.environ.setdefault("GROQ_API_KEY", "benchmark")
+
+from streamlit.testing.v1 import AppTest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, "app.py")
+sys.path.insert(0, ROOT)
+
+from engine import SessionState
+
+
+def make_messages(count):
+    messages = []
+    for i in range(count):
+        role = "assistant" if i % 2 == 0 else "user"
+        content = (
+            f"**📊 Evaluation:**\n\n1. Technical accuracy: 7/10\n2. Completeness: 6/10\n"
+            f"3. Clarity: 8/10\n4. Correctness: 7/10\n\nFeedback for message {i}. " * 2
+            if role == "assistant" else f"Candidate answer number {i} about Python closures."
+        )
+        messages.append({
+            "role": role,
+            "content": content,
+            "avatar": "👤" if role == "user" else None,
+            "timestamp": datetime.utcnow().isoformat(),
+        })
+    return messages
+
+
+def time_rerun(count, live_messages, repeat):
+    os.environ["TALENTSCOUT_LIVE_MESSAGES"] = str(live_messages)
+    at = AppTest.from_file(APP, default_timeout=60).run()
+    at.session_state["interview"] = SessionState(phase="completion", messages=make_messages(count))
+    at.run()  # warm the history block cache
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        at.run()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 50, 100, 250, 500])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--live", type=int, default=20, help="live messages in incremental mode")
+    args = parser.parse_args()
+
+    print(f"{'messages':>8}  {'full (ms)':>10}  {'incremental (ms)':>16}")
+    for count in args.sizes:
+        full = time_rerun(count, 0, args.repeat)
+        incremental = time_rerun(count, args.live, args.repeat)
+        print(f"{count:>8}  {full:>10.1f}  {incremental:>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
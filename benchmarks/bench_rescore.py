@@ -0,0 +1,80 @@
+"""Run the offline re-scoring pipeline against a local fake Groq server.
+
+Writes a synthetic JSONL export, then re-scores it with ``rescore.run`` in
+two passes. The first is cut off partway to stand in for an interrupted
+run. The second resumes from the checkpoint and must skip what was already
+scored. Reports throughput in answers per hour and checks every answer ends
+up scored exactly once.
+
+    python benchmarks/bench_rescore.py --answers 3000 --workers 32 --rpm 30000
+    python benchmarks/bench_rescore.py --rate-limit-rate 0.05   # with injected 429s
+"""
+
+import argparse
+import gzip
+import itertools
+import json
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fake_groq import FakeConfig, start_server
+
+import llm
+import rescore
+
+
+def write_export(path: str, answers: int, per_session: int = 3):
+    with gzip.open(path, "wt", encoding="utf-8") as out:
+        for s in range(0, answers, per_session):
+            session_id = f"session{s // per_session:06d}"
+            out.write(json.dumps({"record": "session", "session_id": session_id, "language": "English",
+                                  "candidate": {"tech_stack": "Python, Django, PostgreSQL"}}) + "\n")
+            for q in range(1, min(per_session, answers - s) + 1):
+                out.write(json.dumps({
+                    "record": "response", "session_id": session_id, "question_number": q,
+                    "question": f"How would you index table {q} for lookups by customer?",
+                    "answer": "Add a composite index on customer id and created at, then check the query plan.",
+                }) + "\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--answers", type=int, default=3000)
+    parser.add_argument("--workers", type=int, default=32)
+    parser.add_argument("--rpm", type=float, default=0.0, help="requests per minute (0 for no limit)")
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    directory = tempfile.mkdtemp(prefix="talentscout-rescore-")
+    export_path = os.path.join(directory, "sessions.jsonl.gz")
+    out_path = os.path.join(directory, "scores.jsonl")
+    write_export(export_path, args.answers)
+
+    config = FakeConfig(latency=args.latency, token_rate=0, rate_limit_rate=args.rate_limit_rate, retry_after=0.2)
+    _, base_url, stats = start_server(config=config)
+    client = llm.LLMGateway(api_key="bench", base_url=base_url, max_inflight=args.workers)
+    limiter = rescore.RateLimiter(args.rpm) if args.rpm else None
+
+    first = rescore.run(itertools.islice(rescore.iter_export_answers(export_path), args.answers // 3),
+                        out_path, client, args.workers, limiter, progress_every=0)
+    second = rescore.run(rescore.iter_export_answers(export_path), out_path, client, args.workers, limiter,
+                         progress_every=0)
+
+    with open(out_path, encoding="utf-8") as lines:
+        records = [json.loads(line) for line in lines]
+    scored = {(r["session_id"], r["question_number"]) for r in records if "error" not in r}
+    total = first["scored"] + second["scored"]
+    seconds = first["seconds"] + second["seconds"]
+    print(f"interrupted pass: {first['scored']} scored in {first['seconds']:.1f}s; "
+          f"resumed pass: {second['scored']} scored, {second['skipped']} skipped from the checkpoint")
+    print(f"{total} answers in {seconds:.1f}s with {args.workers} workers: {total / seconds * 3600:,.0f} answers/hour, "
+          f"{first['errors'] + second['errors']} errors, {stats.snapshot()['rate_limited']} 429s retried")
+    print(f"distinct answers scored: {len(scored)}/{args.answers}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Time the local input parsers in ``validation`` per input.
+
+Runs labelled consent replies, emails, phone numbers and tech stacks through
+the rule-based fast path and reports microseconds per input, accuracy on
+every input, and how many come back None. For consent and tech stacks None
+means "ask Groq"; invalid emails and phone numbers are simply asked again.
+With ``--groq`` the left-over inputs also go to a local fake Groq server, to
+compare a round trip against the local cost. Needs no API access.
+
+    python benchmarks/bench_validation.py --repeat 2000
+    python benchmarks/bench_validation.py --groq --latency 0.3
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import llm
+import validation
+
+# (input, expected); None means the input should be left for Groq
+CONSENT = [
+    ("yes", True), ("Yes please", True), ("y", True), ("sure", True), ("ok", True), ("Of course!", True),
+    ("I agree", True), ("Sí", True), ("oui", True), ("ja", True), ("sim", True), ("да", True), ("हाँ", True),
+    ("はい", True), ("是的", True), ("네", True), ("no", False), ("n", False), ("nope", False), ("No thanks", False),
+    ("non", False), ("nein", False), ("нет", False), ("नहीं", False), ("いいえ", False), ("不要", False),
+    ("yeah no", None), ("not sure", None), ("I do not consent", None), ("maybe later", None), ("what data?", None),
+    ("no problem", None), ("why not", None),
+]
+EMAILS = [
+    ("ada@example.com", "ada@example.com"), ("it's Ada.L+jobs@mail.co.uk.", "Ada.L+jobs@mail.co.uk"),
+    ("a@b", None), ("ada at example dot com", None), ("first.last@sub.example.org", "first.last@sub.example.org"),
+]
+PHONES = [
+    ("+44 20 7946 0000", "+44 20 7946 0000"), ("(555) 123-4567", "(555) 123-4567"), ("555.123.4567", "555.123.4567"),
+    ("+91 98765 43210", "+91 98765 43210"), ("12345", None), ("call me", None), ("2024-01-01", None),
+]
+STACKS = [
+    ("Python, Django, PostgreSQL", ["Python", "Django", "PostgreSQL"]),
+    ("js, react/redux and node", ["JavaScript", "React", "Redux", "Node.js"]),
+    ("ruby on rails & postgres", ["Ruby on Rails", "PostgreSQL"]),
+    ("I know python and some golang", ["Python", "Go"]),
+    ("C#, asp.net core, SQL Server", ["C#", ".NET", "SQL Server"]),
+    ("k8s; terraform | aws", ["Kubernetes", "Terraform", "AWS"]),
+    ("Elixir, Phoenix", ["Elixir", "Phoenix"]),
+    ("mostly backend things in the JVM world", None),
+    ("I have experience in React and Go", ["React", "Go"]),
+    ("I mainly do data science with pandas", ["Pandas"]),
+]
+PARSERS = [
+    ("consent", validation.parse_yes_no, CONSENT),
+    ("email", validation.parse_email, EMAILS),
+    ("phone", validation.parse_phone, PHONES),
+    ("tech stack", validation.parse_tech_stack, STACKS),
+]
+
+
+def time_parser(parse, cases, repeat: int) -> float:
+    """Mean microseconds per input."""
+    inputs = [text for text, _ in cases]
+    started = time.perf_counter()
+    for _ in range(repeat):
+        for text in inputs:
+            parse(text)
+    return (time.perf_counter() - started) / (repeat * len(inputs)) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=2000)
+    parser.add_argument("--groq", action="store_true", help="also send left-over inputs to a local fake Groq server")
+    parser.add_argument("--latency", type=float, default=0.3, help="fake Groq latency with --groq")
+    args = parser.parse_args()
+
+    print(f"{'input':<11} {'us/input':>9} {'correct':>8} {'None':>9}")
+    for name, parse, cases in PARSERS:
+        per_input = time_parser(parse, cases, args.repeat)
+        correct = sum(parse(text) == expected for text, expected in cases)
+        left = sum(parse(text) is None for text, _ in cases)
+        print(f"{name:<11} {per_input:>9.1f} {correct:>5}/{len(cases):<2} {left:>6}/{len(cases)}")
+
+    if args.groq:
+        from fake_groq import FakeConfig, start_server
+
+        _, base_url, _ = start_server(config=FakeConfig(latency=args.latency, token_rate=0))
+        client = llm.LLMGateway(api_key="bench", base_url=base_url)
+        escalated = [(llm.request_consent, text) for text, expected in CONSENT if expected is None]
+        escalated += [(llm.request_tech_stack, text) for text, expected in STACKS if expected is None]
+        started = time.perf_counter()
+        for request, text in escalated:
+            request(client, text)
+        per_call = (time.perf_counter() - started) / len(escalated) * 1e3
+        print(f"Groq round trip for the {len(escalated)} left-over inputs: {per_call:.0f} ms each "
+              f"({args.latency * 1e3:.0f} ms fake latency)")
+
+
+if __name__ == "__main__":
+    main()
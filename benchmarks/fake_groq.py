@@ -0,0 +1,266 @@
+"""Local stand-in for the Groq chat-completions endpoint.
+
+Serves ``POST /openai/v1/chat/completions`` with configurable time to first
+token, token rate, error and 429 injection (overridable per model), for both
+plain and streamed (server-sent events) responses. An outage window answers
+every request with HTTP 503. Point the app or the benchmarks at it with
+``GROQ_BASE_URL=http://127.0.0.1:<port>``.
+
+    python benchmarks/fake_groq.py --port 8900 --latency 0.3 --token-rate 200 --rate-limit-rate 0.05
+    python benchmarks/fake_groq.py --port 8900 --model llama-3.1-8b-instant=2.0:0.5   # slow, half 429s
+    python benchmarks/fake_groq.py --port 8900 --outage 60:120   # down from 60 s to 180 s after start
+"""
+
+import argparse
+import itertools
+import json
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+WORDS = (
+    "explain how you would design cache invalidation for a service with heavy read traffic "
+    "and describe the trade offs between consistency latency and cost in production"
+).split()
+
+
+@dataclass
+class FakeConfig:
+    latency: float = 0.2  # seconds before the first token
+    token_rate: float = 250.0  # completion tokens per second, 0 for instant
+    error_rate: float = 0.0  # share of requests answered with HTTP 500
+    rate_limit_rate: float = 0.0  # share of requests answered with HTTP 429
+    retry_after: float = 1.0  # Retry-After sent with 429s
+    completion_tokens: int = 60  # length of free-text answers
+    duplicate_rate: float = 0.0  # share of questions that paraphrase an earlier one
+    models: dict = field(default_factory=dict)  # model -> (latency, rate_limit_rate) overrides
+    outage: tuple = ()  # (start, duration) in seconds after the server started; 503 for every request
+
+
+@dataclass
+class FakeStats:
+    requests: int = 0
+    streamed: int = 0
+    errors: int = 0
+    rate_limited: int = 0
+    unavailable: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def add(self, **counts):
+        with self.lock:
+            for name, value in counts.items():
+                setattr(self, name, getattr(self, name) + value)
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            return {k: v for k, v in vars(self).items() if k != "lock"}
+
+
+def count_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token)."""
+    return max(1, len(text) // 4)
+
+
+_serial = itertools.count(1)
+_recent_questions = []
+
+
+def fake_question(config: FakeConfig, words: int) -> str:
+    """A new question, or with ``duplicate_rate`` a light rewording of a recent one."""
+    if _recent_questions and random.random() < config.duplicate_rate:
+        earlier = random.choice(_recent_questions).split(": ", 1)[1]
+        return f"Fake question {next(_serial)}: could you {earlier}"
+    question = f"Fake question {next(_serial)}: {' '.join(random.sample(WORDS, words))}?"
+    _recent_questions.append(question)
+    del _recent_questions[:-20]
+    return question
+
+
+def completion_text(body: dict, config: FakeConfig) -> str:
+    """Pick a plausible answer for the prompt the app sent."""
+    prompt = "\n".join(str(m.get("content", "")) for m in body.get("messages", []))
+    json_mode = (body.get("response_format") or {}).get("type") == "json_object"
+
+    if json_mode and prompt.startswith("Translate every value"):
+        match = re.search(r"Language: (.*)\nStrings: (\{.*\})", prompt, re.DOTALL)
+        language, strings = (match.group(1), json.loads(match.group(2))) if match else ("?", {})
+        return json.dumps({key: f"[{language}] {text}" for key, text in strings.items()}, ensure_ascii=False)
+    if json_mode and '"technologies"' in prompt:
+        return json.dumps({"technologies": ["Python", "PostgreSQL"]})
+    if "consent" in prompt and body.get("max_completion_tokens", 512) <= 5:
+        return "yes"
+    if json_mode and '"questions"' in prompt:
+        match = re.search(r"Number of questions: (\d+)", prompt)
+        count = int(match.group(1)) if match else 3
+        return json.dumps({"questions": [fake_question(config, 8) for _ in range(count)]})
+    if json_mode:
+        return json.dumps({
+            "technical_accuracy": random.randint(3, 9),
+            "completeness": random.randint(3, 9),
+            "clarity": random.randint(3, 9),
+            "correctness": random.randint(3, 9),
+            "feedback": " ".join(random.sample(WORDS, 12)),
+        })
+    if body.get("max_completion_tokens", 512) <= 20:
+        return "Spanish"
+    if prompt.startswith("Translate"):
+        return "Pregunta traducida: " + " ".join(random.sample(WORDS, 8))
+    if "interview question" in prompt:
+        return fake_question(config, 10)
+    words = [random.choice(WORDS) for _ in range(config.completion_tokens)]
+    return "Technical accuracy: 7/10. Completeness: 6/10. Clarity: 8/10. Correctness: 7/10. " + " ".join(words)
+
+
+class FakeGroqHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    config: FakeConfig
+    stats: FakeStats
+    started: float
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status: int, payload: dict, headers: dict | None = None):
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _write_chunk(self, data: bytes):
+        self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        if not self.path.endswith("/chat/completions"):
+            self._send_json(404, {"error": {"message": f"unknown path {self.path}"}})
+            return
+
+        config = self.config
+        model = body.get("model", "fake-model")
+        latency, rate_limit_rate = config.models.get(model, (config.latency, config.rate_limit_rate))
+        if config.outage and 0 <= time.monotonic() - self.started - config.outage[0] < config.outage[1]:
+            self.stats.add(requests=1, unavailable=1)
+            time.sleep(latency)
+            self._send_json(503, {"error": {"message": "Service unavailable", "type": "service_unavailable"}})
+            return
+        roll = random.random()
+        if roll < rate_limit_rate:
+            self.stats.add(requests=1, rate_limited=1)
+            self._send_json(429, {"error": {"message": "Rate limit reached", "type": "rate_limit"}},
+                            {"Retry-After": str(config.retry_after)})
+            return
+        if roll < rate_limit_rate + config.error_rate:
+            self.stats.add(requests=1, errors=1)
+            self._send_json(500, {"error": {"message": "Injected server error"}})
+            return
+
+        prompt_tokens = sum(count_tokens(str(m.get("content", ""))) for m in body.get("messages", []))
+        text = completion_text(body, config)
+        tokens = re.findall(r"\S+\s*", text)
+        usage = {"prompt_tokens": prompt_tokens, "completion_tokens": len(tokens), "total_tokens": prompt_tokens + len(tokens)}
+        self.stats.add(requests=1, streamed=1 if body.get("stream") else 0,
+                       prompt_tokens=prompt_tokens, completion_tokens=len(tokens))
+        created = int(time.time())
+        time.sleep(latency)
+        delay = 1 / config.token_rate if config.token_rate else 0
+
+        if not body.get("stream"):
+            time.sleep(delay * len(tokens))
+            self._send_json(200, {
+                "id": "chatcmpl-fake", "object": "chat.completion", "created": created, "model": model,
+                "choices": [{"index": 0, "message": {"role": "assistant", "content": text}, "finish_reason": "stop"}],
+                "usage": usage,
+            })
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for i, token in enumerate(tokens):
+            last = i == len(tokens) - 1
+            chunk = {
+                "id": "chatcmpl-fake", "object": "chat.completion.chunk", "created": created, "model": model,
+                "choices": [{"index": 0, "delta": {"content": token}, "finish_reason": "stop" if last else None}],
+            }
+            if last:
+                chunk["x_groq"] = {"id": "req-fake", "usage": usage}
+            self._write_chunk(b"data: " + json.dumps(chunk).encode() + b"\n\n")
+            if delay:
+                time.sleep(delay)
+        self._write_chunk(b"data: [DONE]\n\n")
+        self._write_chunk(b"")
+
+
+def start_server(host: str = "127.0.0.1", port: int = 0, config: FakeConfig | None = None):
+    """Start the fake server on a daemon thread; returns (server, base_url, stats)."""
+    stats = FakeStats()
+    handler = type("Handler", (FakeGroqHandler,), {
+        "config": config or FakeConfig(), "stats": stats, "started": time.monotonic(),
+    })
+    server = ThreadingHTTPServer((host, port), handler, bind_and_activate=False)
+    server.request_queue_size = 1024  # the default backlog of 5 drops bursts of new connections
+    server.server_bind()
+    server.server_activate()
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="fake-groq", daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}", stats
+
+
+def parse_model_overrides(values: list) -> dict:
+    """``["name=LATENCY[:RATE_LIMIT_RATE]", ...]`` -> {name: (latency, rate_limit_rate)}."""
+    overrides = {}
+    for value in values or []:
+        name, _, spec = value.rpartition("=")
+        latency, _, rate = spec.partition(":")
+        overrides[name] = (float(latency), float(rate or 0))
+    return overrides
+
+
+def parse_outage(value: str | None) -> tuple:
+    """``"START:DURATION"`` (seconds) -> (start, duration); empty for None."""
+    if not value:
+        return ()
+    start, _, duration = value.partition(":")
+    return float(start), float(duration)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--latency", type=float, default=FakeConfig.latency)
+    parser.add_argument("--token-rate", type=float, default=FakeConfig.token_rate)
+    parser.add_argument("--error-rate", type=float, default=FakeConfig.error_rate)
+    parser.add_argument("--rate-limit-rate", type=float, default=FakeConfig.rate_limit_rate)
+    parser.add_argument("--retry-after", type=float, default=FakeConfig.retry_after)
+    parser.add_argument("--duplicate-rate", type=float, default=FakeConfig.duplicate_rate)
+    parser.add_argument("--model", action="append", metavar="NAME=LATENCY[:RATE_LIMIT_RATE]",
+                        help="latency and 429 share for one model (repeatable)")
+    parser.add_argument("--outage", metavar="START:DURATION", help="answer 503 from START for DURATION seconds")
+    args = parser.parse_args()
+
+    config = FakeConfig(args.latency, args.token_rate, args.error_rate, args.rate_limit_rate, args.retry_after,
+                        duplicate_rate=args.duplicate_rate, models=parse_model_overrides(args.model),
+                        outage=parse_outage(args.outage))
+    server, base_url, stats = start_server(args.host, args.port, config)
+    print(f"Fake Groq listening on {base_url} ({config})")
+    try:
+        while True:
+            time.sleep(10)
+            print(stats.snapshot())
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
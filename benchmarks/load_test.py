@@ -0,0 +1,282 @@
+"""Simulate many concurrent candidates against a local fake Groq server.
+
+Each candidate runs the full scripted flow (consent through
+technical_assessment to completion) through ``InterviewEngine`` with the real
+``InterviewServices`` and ``LLMGateway``. The only stand-in is the HTTP
+endpoint, so the call pattern the app produces is what gets measured.
+
+    python benchmarks/load_test.py --candidates 200 --concurrency 50
+    python benchmarks/load_test.py --rate-limit-rate 0.05 --stream
+    python benchmarks/load_test.py --duplicate-rate 0.3 --no-dedup   # repeats without dedup
+    python benchmarks/load_test.py --routing --model meta-llama/llama-4-scout-17b-16e-instruct=0.2:0.3  # failover
+    python benchmarks/load_test.py --outage 0.5:3 --breaker --think-time 0.2   # degraded mode during an outage
+    python benchmarks/load_test.py --eval-queue memory --eval-workers 8   # evaluate answers in the background
+    python benchmarks/load_test.py --base-url http://127.0.0.1:8900   # external fake server
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fake_groq import FakeConfig, parse_model_overrides, parse_outage, start_server
+
+import async_llm
+import breaker
+import dedup
+import eval_queue
+import i18n
+import llm
+import metrics
+import router
+import session_store
+from engine import Busy, InterviewEngine, SessionState
+from services import InterviewServices
+
+LANGUAGES = ["English", "Spanish", "Français", "हिंदी", "Deutsch"]
+STACKS = ["Python, Django, PostgreSQL", "JavaScript, React, Node.js", "Java, Spring, Kafka", "Go, Kubernetes, gRPC"]
+
+
+def candidate_script(i: int) -> list:
+    return [
+        "yes", f"Candidate {i}", f"candidate{i}@example.com", "+1 555 0100", "Berlin, Germany",
+        str(1 + i % 12), "Backend Developer", STACKS[i % len(STACKS)], LANGUAGES[i % len(LANGUAGES)],
+        "It caches results keyed by arguments.", "Use an index on the foreign key.", "Retry with backoff and jitter.",
+    ]
+
+
+def percentile(values: list, pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[rank]
+
+
+def deep_sizeof(obj, seen=None) -> int:
+    """Approximate retained size of a session state object graph."""
+    seen = set() if seen is None else seen
+    if id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(deep_sizeof(k, seen) + deep_sizeof(v, seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(deep_sizeof(item, seen) for item in obj)
+    elif hasattr(obj, "__slots__"):
+        size += sum(deep_sizeof(getattr(obj, name), seen) for name in obj.__slots__ if hasattr(obj, name))
+    return size
+
+
+class Recorder:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.turns = {}  # phase -> [seconds]
+        self.timeline = []  # (start offset, seconds) of every turn
+        self.origin = time.monotonic()
+        self.ttft = []
+        self.errors = 0
+        self.peak_threads = 0
+
+    def on_error(self, message):
+        with self.lock:
+            self.errors += 1
+
+    def add_turn(self, phase, seconds, ttft):
+        with self.lock:
+            self.turns.setdefault(phase, []).append(seconds)
+            self.timeline.append((time.monotonic() - seconds - self.origin, seconds))
+            self.peak_threads = max(self.peak_threads, threading.active_count())
+            if ttft is not None:
+                self.ttft.append(ttft)
+
+
+def run_turn(engine, state, user_input, recorder, think_time, store=None):
+    phase = state.phase
+    started = time.perf_counter()
+    first_token = None
+    items = engine.handle(state, user_input) if user_input is not None else engine.start(state)
+    for item in items:
+        if isinstance(item, Busy):
+            continue
+        if item.streamed:
+            chunks = []
+            for chunk in item.content:
+                if first_token is None:
+                    first_token = time.perf_counter() - started
+                chunks.append(chunk)
+            item.text = "".join(chunks).strip()
+    if store is not None:
+        store.save(state)
+    recorder.add_turn(phase if user_input is not None else "welcome", time.perf_counter() - started, first_token)
+    if think_time:
+        time.sleep(think_time)
+
+
+def run_candidate(i, engine, recorder, think_time, store=None):
+    state = SessionState()
+    run_turn(engine, state, None, recorder, 0, store)
+    for user_input in candidate_script(i):
+        run_turn(engine, state, user_input, recorder, think_time, store)
+    return state
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--candidates", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=25)
+    parser.add_argument("--think-time", type=float, default=0.0, help="seconds a candidate waits between turns")
+    parser.add_argument("--base-url", help="use an already running fake server instead of starting one")
+    parser.add_argument("--latency", type=float, default=FakeConfig.latency)
+    parser.add_argument("--token-rate", type=float, default=FakeConfig.token_rate)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--retry-after", type=float, default=0.5)
+    parser.add_argument("--duplicate-rate", type=float, default=0.0, help="share of fake questions that paraphrase earlier ones")
+    parser.add_argument("--stream", action="store_true", help="stream questions and evaluations")
+    parser.add_argument("--question-mode", default="single", choices=["single", "batch"])
+    parser.add_argument("--prefetch", default="next", choices=["next", "all", "off"])
+    parser.add_argument("--eval-mode", default="text", choices=["text", "structured"])
+    parser.add_argument("--eval-queue", default="off", choices=["off", "memory", "sqlite"],
+                        help="evaluate answers on the background queue (eval_queue.py)")
+    parser.add_argument("--eval-workers", type=int, default=eval_queue.WORKERS)
+    parser.add_argument("--no-bank", action="store_true", help="disable the shared question bank")
+    parser.add_argument("--no-dedup", action="store_true", help="disable near-duplicate question rejection")
+    parser.add_argument("--assessment", default="fixed", choices=["fixed", "adaptive"])
+    parser.add_argument("--routing", action="store_true", help="route tasks to model tiers with failover (router.py)")
+    parser.add_argument("--model", action="append", metavar="NAME=LATENCY[:RATE_LIMIT_RATE]",
+                        help="fake latency and 429 share for one model (repeatable)")
+    parser.add_argument("--outage", metavar="START:DURATION", help="fake server answers 503 from START for DURATION seconds")
+    parser.add_argument("--breaker", action="store_true", help="fail fast while the API is down (breaker.py)")
+    parser.add_argument("--breaker-reset", type=float, default=2.0, help="seconds before an open circuit is probed")
+    parser.add_argument("--max-inflight", type=int, default=16)
+    parser.add_argument("--async", dest="use_async", action="store_true",
+                        help="use AsyncLLMGateway (one event loop) instead of the thread-based gateway")
+    parser.add_argument("--session-store", default="off", choices=["off", "sqlite", "file"],
+                        help="save every turn to a session store in a temporary directory")
+    args = parser.parse_args()
+
+    stats = None
+    base_url = args.base_url
+    if not base_url:
+        config = FakeConfig(args.latency, args.token_rate, args.error_rate, args.rate_limit_rate, args.retry_after,
+                            duplicate_rate=args.duplicate_rate, models=parse_model_overrides(args.model),
+                            outage=parse_outage(args.outage))
+        _, base_url, stats = start_server(config=config)
+
+    gateway_cls = async_llm.AsyncLLMGateway if args.use_async else llm.LLMGateway
+    gateway = gateway_cls(api_key="load-test", base_url=base_url, max_inflight=args.max_inflight,
+                          router=router.ModelRouter() if args.routing else None,
+                          breaker=breaker.CircuitBreaker(reset_after=args.breaker_reset) if args.breaker else None)
+    recorder = Recorder()
+    services = InterviewServices(
+        gateway, stream=args.stream, prefetch_mode=args.prefetch, question_mode=args.question_mode,
+        use_bank=not args.no_bank, eval_mode=args.eval_mode, use_dedup=not args.no_dedup,
+        assessment_mode=args.assessment, eval_queue_mode=args.eval_queue, on_error=recorder.on_error,
+    )
+    services.catalog = i18n.Catalog(path=None)  # start cold and leave the translation cache file alone
+    store_dir = tempfile.mkdtemp(prefix="talentscout-load-")
+    if args.eval_queue == "sqlite":
+        services.eval_queue = eval_queue.SQLiteEvaluationQueue(
+            services.run_deferred_evaluation, path=os.path.join(store_dir, "eval_queue.db"),
+            breaker=gateway.breaker, workers=args.eval_workers,
+        )
+    elif args.eval_queue == "memory":
+        services.eval_queue.workers = args.eval_workers
+    engine = InterviewEngine(services)
+    store = None
+    if args.session_store != "off":
+        store_path = os.path.join(store_dir, "sessions.db" if args.session_store == "sqlite" else "sessions")
+        store = session_store.from_env(args.session_store, store_path)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+        states = list(pool.map(lambda i: run_candidate(i, engine, recorder, args.think_time, store), range(args.candidates)))
+    elapsed = time.perf_counter() - started
+    services.pool.shutdown(wait=True)
+
+    all_turns = [t for turns in recorder.turns.values() for t in turns]
+    completed = sum(1 for s in states if s.phase == "completion")
+    print(f"{args.candidates} candidates ({completed} completed), concurrency {args.concurrency}, "
+          f"{len(all_turns)} turns in {elapsed:.2f}s")
+    print(f"throughput: {len(all_turns) / elapsed:,.1f} turns/s, {args.candidates / elapsed:,.2f} sessions/s, "
+          f"peak threads {recorder.peak_threads}")
+    print(f"{'phase':<22}{'turns':>7}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for phase, turns in [("all", all_turns), *sorted(recorder.turns.items())]:
+        print(f"{phase:<22}{len(turns):>7}{percentile(turns, 50) * 1000:>10.1f}"
+              f"{percentile(turns, 95) * 1000:>10.1f}{percentile(turns, 99) * 1000:>10.1f}")
+    if recorder.ttft:
+        print(f"time to first streamed token: p50 {percentile(recorder.ttft, 50) * 1000:.1f} ms, "
+              f"p95 {percentile(recorder.ttft, 95) * 1000:.1f} ms")
+    if args.outage:
+        start, duration = parse_outage(args.outage)
+        during = [t for at, t in recorder.timeline if start <= at < start + duration]
+        outside = [t for at, t in recorder.timeline if not start <= at < start + duration]
+        for label, turns in [("outside outage", outside), ("during outage", during)]:
+            print(f"{label:<22}{len(turns):>7}{percentile(turns, 50) * 1000:>10.1f}"
+                  f"{percentile(turns, 95) * 1000:>10.1f}{percentile(turns, 99) * 1000:>10.1f}")
+    if stats:
+        snap = stats.snapshot()
+        print(f"LLM requests/session: {snap['requests'] / args.candidates:.2f} "
+              f"(429s {snap['rate_limited']}, 5xx {snap['errors']}, 503 outage {snap['unavailable']}), "
+              f"tokens/session: {snap['prompt_tokens'] / args.candidates:.0f} prompt + "
+              f"{snap['completion_tokens'] / args.candidates:.0f} completion")
+    print(f"fallbacks/errors surfaced to candidates: {recorder.errors}")
+    for row in metrics.summary():
+        print(f"  {row['task']:<16}{row['calls']:>6} calls, {row['errors']} errors, {row['fallbacks']} fallbacks, "
+              f"mean {row['mean wall (s)'] * 1000:.0f} ms (ttft {row['mean ttft (s)'] * 1000:.0f} ms), ${row['cost ($)']:.5f}")
+    for row in metrics.tier_summary():
+        print(f"  {row['tier']:<6} {row['model']:<44}{row['calls']:>6} calls, {row['failovers']} via failover, "
+              f"mean ttft {row['mean ttft (s)'] * 1000:.0f} ms, ${row['cost/call ($)'] * 1000:.4f}/1k calls")
+    queued = services.eval_queue.stats()
+    if queued["queued"]:
+        started = time.perf_counter()
+        shown = sum(len(r.get("evaluation") or "") > 0 for s in states for r in s.technical_responses)
+        for s in states:
+            for future in s.pending_evaluations.values():
+                try:
+                    future.result(timeout=60)
+                except Exception:
+                    pass
+        late = sum(len(services.collect_evaluations(s)) for s in states)
+        queued = services.eval_queue.stats()
+        print(f"evaluation queue ({queued['backend']}, {queued['workers']} workers): {queued['queued']} answers queued, "
+              f"{shown} shown at the summary, {late} attached {time.perf_counter() - started:.1f}s after the last "
+              f"session; lag p50 {queued['lag_p50_s']} s, p95 {queued['lag_p95_s']} s, {queued['full']} rejected as full")
+    if gateway.breaker is not None:
+        print(f"degraded mode: breaker {gateway.breaker.stats()}, "
+              f"{services.question_pool.stats()['served']} offline pool questions")
+    print(f"memory/session (SessionState graph): {statistics.mean(deep_sizeof(s) for s in states) / 1024:.1f} KiB")
+    print(f"questions/session: {statistics.mean(len(s.technical_responses) for s in states):.2f}")
+    if args.eval_mode == "structured":
+        scored = sum(len(s.evaluations) for s in states)
+        print(f"structured evaluations: {scored}/{sum(len(s.technical_responses) for s in states)} answers scored")
+    if store is not None:
+        started = time.perf_counter()
+        resumed = [store.load(s.session_id, SessionState) for s in states]
+        assert all(r.phase == s.phase and len(r.technical_responses) == len(s.technical_responses)
+                   for r, s in zip(resumed, states))
+        print(f"session store ({args.session_store}): resume {(time.perf_counter() - started) / len(states) * 1000:.2f} ms/session")
+    if services.bank is not None:
+        bank = services.bank.stats()
+        print(f"question bank: hit rate {bank['hit_rate']:.0%}, Groq calls avoided {bank['groq_calls_avoided']}, "
+              f"paraphrases not banked {bank['duplicates']}")
+    catalog = services.catalog.stats()
+    print(f"string catalog: {len(catalog['languages'])} languages from {catalog['batches']} batched calls, "
+          f"{catalog['hits']} strings served from memory, {catalog['misses']} shown in English")
+    repeats = sum(
+        dedup.near_duplicate(q, [other for other in s.asked_questions if other != q]) is not None
+        for s in states for q in s.asked_questions
+    )
+    print(f"near-duplicate questions within sessions: {repeats}, rejected and replaced {dedup.stats()['rejected']}")
+
+
+if __name__ == "__main__":
+    main()
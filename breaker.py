@@ -0,0 +1,101 @@
+"""Circuit breaker in front of the Groq API.
+
+``LLMGateway`` asks ``allow`` before every call and reports each finished
+call back. After ``FAILURES`` consecutive failed calls the circuit opens:
+calls are refused at once with ``CircuitOpen`` instead of each one waiting
+out its retries and deadline. A failed call is one that ended on a 429, 5xx,
+connection error or timeout after the gateway's own retries and failover.
+After ``RESET_AFTER`` seconds the circuit is half-open and lets exactly one
+call through as a probe. If the probe succeeds the circuit closes; otherwise
+it opens for another ``RESET_AFTER``. A call that was let through but never
+sent (its deadline passed while it waited for a local slot) says nothing
+about the API: ``release`` hands the probe back without counting a failure.
+
+While the circuit is open, services serve questions from the offline pool
+(``question_pool``) and queue answers for evaluation later (``eval_queue``).
+"""
+
+import os
+import threading
+import time
+
+# Consecutive failed calls that open the circuit
+FAILURES = int(os.getenv("TALENTSCOUT_BREAKER_FAILURES", "5"))
+# Seconds the circuit stays open before one probe call is let through
+RESET_AFTER = float(os.getenv("TALENTSCOUT_BREAKER_RESET", "30"))
+
+
+class CircuitOpen(Exception):
+    """The Groq API is failing; the call was refused without being sent."""
+
+
+class CircuitBreaker:
+    def __init__(self, failures: int = FAILURES, reset_after: float = RESET_AFTER):
+        self.failures = failures
+        self.reset_after = reset_after
+        self._state = "closed"
+        self._consecutive = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+        self.counters = {"opened": 0, "rejected": 0, "probes": 0}
+
+    @classmethod
+    def from_env(cls):
+        """Breaker configured from ``TALENTSCOUT_BREAKER_*``, or None with ``TALENTSCOUT_BREAKER=0``."""
+        if os.getenv("TALENTSCOUT_BREAKER", "1") == "0":
+            return None
+        return cls()
+
+    def _ready(self) -> bool:
+        """Whether an open circuit may send its probe; called with the lock held."""
+        return time.monotonic() - self._opened_at >= self.reset_after
+
+    def allow(self) -> bool:
+        """Whether a call may go out now; in half-open state only the first caller gets True."""
+        with self._lock:
+            if self._state == "closed":
+                return True
+            if self._state == "open" and self._ready():
+                self._state = "half_open"
+            if self._state == "half_open" and not self._probing:
+                self._probing = True
+                self.counters["probes"] += 1
+                return True
+            self.counters["rejected"] += 1
+            return False
+
+    def is_open(self) -> bool:
+        """True while calls would be refused, so callers can skip straight to their fallback."""
+        with self._lock:
+            if self._state == "open":
+                return not self._ready()
+            return self._state == "half_open" and self._probing
+
+    def retry_in(self) -> float:
+        """Seconds until the next probe is allowed (0 when the circuit is closed)."""
+        with self._lock:
+            if self._state != "open":
+                return 0.0
+            return max(self._opened_at + self.reset_after - time.monotonic(), 0.0)
+
+    def release(self):
+        """A call that was allowed ended before reaching the API; only frees the probe."""
+        with self._lock:
+            self._probing = False
+
+    def success(self):
+        with self._lock:
+            self._state, self._consecutive, self._probing = "closed", 0, False
+
+    def failure(self):
+        with self._lock:
+            self._consecutive += 1
+            if self._state == "half_open" or (self._state == "closed" and self._consecutive >= self.failures):
+                if self._state == "closed":
+                    self.counters["opened"] += 1
+                self._state, self._opened_at, self._probing = "open", time.monotonic(), False
+
+    def stats(self) -> dict:
+        with self._lock:
+            return dict(self.counters, state=self._state, consecutive_failures=self._consecutive)
@@ -0,0 +1,142 @@
+"""Near-duplicate detection for generated questions.
+
+A question's signature is a MinHash over character 4-grams of its normalized
+text. The share of equal MinHash slots estimates the Jaccard similarity of two
+questions, so rewordings like "Explain how you would..." / "Describe how you
+would..." score high while different topics score low.
+
+``DedupIndex`` keeps the signatures of many questions in one flat
+``array('I')`` and finds candidates through LSH banding, so a lookup touches
+only a handful of entries. ``near_duplicate`` is the small-scale version for
+comparing a question against the few a session has already been asked.
+"""
+
+import os
+import random
+import re
+import threading
+import zlib
+from array import array
+from functools import lru_cache
+
+THRESHOLD = float(os.getenv("TALENTSCOUT_DEDUP_THRESHOLD", "0.6"))
+
+NUM_PERM = 64
+BANDS = 16  # 16 bands of 4 rows: ~99% recall at 0.7 similarity, ~2% candidates at 0.3
+ROWS = NUM_PERM // BANDS
+SHINGLE = 4
+
+_PRIME = (1 << 61) - 1
+_MASK = (1 << 32) - 1
+_rng = random.Random(0x5EED)  # fixed so signatures are stable across processes
+_PERMS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)]
+_NON_WORD = re.compile(r"[\W_]+")
+
+_lock = threading.Lock()
+_counters = {"rejected": 0}  # questions turned down as repeats within a session
+
+
+def normalize(text: str) -> str:
+    return " ".join(_NON_WORD.sub(" ", text.casefold()).split())
+
+
+def shingles(text: str) -> set:
+    text = normalize(text)
+    if len(text) <= SHINGLE:
+        return {zlib.crc32(text.encode())}
+    return {zlib.crc32(text[i:i + SHINGLE].encode()) for i in range(len(text) - SHINGLE + 1)}
+
+
+@lru_cache(maxsize=8192)
+def signature(text: str) -> array:
+    hashes = shingles(text)
+    return array("I", (min((a * x + b) % _PRIME for x in hashes) & _MASK for a, b in _PERMS))
+
+
+def similarity(sig_a, sig_b) -> float:
+    return sum(x == y for x, y in zip(sig_a, sig_b)) / NUM_PERM
+
+
+def near_duplicate(text: str, others, threshold: float = THRESHOLD) -> str | None:
+    """First of ``others`` at least ``threshold`` similar to ``text``, or None."""
+    sig = signature(text)
+    for other in others:
+        if other == text or similarity(sig, signature(other)) >= threshold:
+            return other
+    return None
+
+
+def count_rejected():
+    with _lock:
+        _counters["rejected"] += 1
+
+
+def stats() -> dict:
+    """Counters for the operator panel and benchmarks."""
+    with _lock:
+        return dict(_counters, signature_cache=signature.cache_info().currsize)
+
+
+class DedupIndex:
+    """MinHash signatures in a flat array with LSH buckets, scoped by a key.
+
+    Only entries with the same key (e.g. a question bank key) are compared.
+    Not thread-safe; the owner serializes access.
+    """
+
+    def __init__(self, threshold: float = THRESHOLD):
+        self.threshold = threshold
+        self._sigs = array("I")  # NUM_PERM slots per entry
+        self._entries = []  # (key, text) per entry, None once discarded
+        self._ids = {}  # (key, text) -> entry id
+        self._buckets = {}  # (key, band, band hash) -> [entry ids]
+        self._dead = 0
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def _bands(self, key, sig):
+        for band in range(BANDS):
+            yield key, band, hash(tuple(sig[band * ROWS:(band + 1) * ROWS]))
+
+    def add(self, key, text: str):
+        if (key, text) in self._ids:
+            return
+        sig = signature(text)
+        entry = len(self._entries)
+        self._sigs.extend(sig)
+        self._entries.append((key, text))
+        self._ids[(key, text)] = entry
+        for bucket in self._bands(key, sig):
+            self._buckets.setdefault(bucket, []).append(entry)
+
+    def find(self, key, text: str):
+        """Most similar indexed text under ``key`` at or above the threshold, or None."""
+        sig = signature(text)
+        candidates = set()
+        for bucket in self._bands(key, sig):
+            candidates.update(self._buckets.get(bucket, ()))
+        best, best_score = None, self.threshold
+        for entry in candidates:
+            if self._entries[entry] is None:
+                continue
+            offset = entry * NUM_PERM
+            score = similarity(sig, self._sigs[offset:offset + NUM_PERM])
+            if score >= best_score:
+                best, best_score = self._entries[entry][1], score
+        return best
+
+    def discard(self, key, text: str):
+        entry = self._ids.pop((key, text), None)
+        if entry is None:
+            return
+        self._entries[entry] = None
+        self._dead += 1
+        if self._dead > 1024 and self._dead * 2 > len(self._entries):
+            self._compact()
+
+    def _compact(self):
+        live = [entry for entry in self._entries if entry is not None]
+        self.__init__(self.threshold)
+        for key, text in live:
+            self.add(key, text)
@@ -0,0 +1,380 @@
+"""UI-independent interview flow.
+
+``InterviewEngine`` is the phase state machine that used to live inline in
+app.py. It reads and writes a plain ``SessionState`` and talks to the LLM only
+through an injected services object, so it can run without Streamlit: app.py
+renders its replies, and benchmarks drive it directly.
+
+``handle`` is a generator. It yields ``Busy`` before blocking work and a
+``Reply`` per assistant message. A reply's content is either a string or an
+iterable of streamed text chunks. Whoever renders a streamed reply sets
+``reply.text`` to the final text. Otherwise the engine collects it itself when
+it resumes, so a headless caller can just exhaust the generator.
+"""
+
+import random
+from dataclasses import dataclass, field
+from datetime import datetime
+
+import history
+import i18n
+import validation
+
+PHASES = [
+    "welcome",
+    "language_selection",
+    "consent",
+    "personal_info",
+    "professional_info",
+    "tech_stack",
+    "technical_assessment",
+    "summary",
+    "completion",
+]
+
+USER_AVATAR = "👤"
+
+
+@dataclass(slots=True)
+class SessionState:
+    phase: str = "welcome"
+    messages: history.MessageLog = field(default_factory=history.MessageLog)  # Store all chat messages
+    candidate: dict = field(default_factory=dict)
+    tech_questions: list = field(default_factory=list)
+    q_idx: int = 0
+    consent_given: bool = False
+    personal_step: str = "name"
+    current_question: str = ""
+    total_questions: int = 3
+    technical_responses: list = field(default_factory=list)
+    evaluations: list = field(default_factory=list)  # llm.Evaluation records in structured mode
+    ability: dict = field(default_factory=dict)  # adaptive mode: level estimate, see adaptive.py
+    user_language: str = "English"
+    asked_questions: set = field(default_factory=set)
+    session_id: str = ""  # key in the session store
+    # Runtime-only: futures for questions being generated in the background
+    prefetched_questions: dict = field(default_factory=dict)
+    # Runtime-only: futures for answers queued for evaluation, by question number
+    pending_evaluations: dict = field(default_factory=dict)
+    # Runtime-only: older messages still in the session store, and what has been saved
+    history_offset: int = 0
+    persisted: dict = field(default_factory=dict)
+
+
+@dataclass(slots=True)
+class Reply:
+    content: object  # str, or an iterable of text chunks to stream
+    prefix: str = ""
+    role: str = "assistant"
+    avatar: str | None = None
+    text: str | None = None
+
+    @property
+    def streamed(self) -> bool:
+        return not isinstance(self.content, str)
+
+    def collect(self) -> str:
+        """Final text without the prefix, consuming a stream nobody rendered."""
+        if self.text is None:
+            self.text = self.content if isinstance(self.content, str) else "".join(self.content).strip()
+        return self.text
+
+
+@dataclass(slots=True)
+class Busy:
+    message: str
+
+
+class OfflineServices:
+    """LLM-free services for simulations and profiling of the non-LLM paths."""
+
+    def detect_language(self, state, user_input):
+        return user_input.strip().title() or "English"
+
+    def parse_consent(self, state, user_input):
+        return validation.parse_yes_no(user_input)
+
+    def parse_tech_stack(self, state, user_input):
+        return validation.parse_tech_stack(user_input) or []
+
+    def load_language(self, state):
+        pass
+
+    def localize(self, state, string_id, **values):
+        return i18n.render(string_id, **values)
+
+    def prepare_questions(self, state):
+        pass
+
+    def question(self, state, question_num):
+        return f"Sample question {question_num} about {', '.join(state.candidate.get('tech_stack', [])) or 'software'}?"
+
+    def after_question(self, state):
+        pass
+
+    def before_evaluation(self, state):
+        pass
+
+    def evaluate(self, state, question, answer):
+        return "Technical accuracy: 5/10\nCompleteness: 5/10\nClarity: 5/10\nCorrectness: 5/10"
+
+    def plan_assessment(self, state):
+        pass
+
+    def after_evaluation(self, state, evaluation):
+        pass
+
+    def await_evaluations(self, state):
+        pass
+
+    def evaluations_ready(self, state):
+        return False
+
+    def collect_evaluations(self, state):
+        return []
+
+    def reset(self, state):
+        pass
+
+
+class InterviewEngine:
+    def __init__(self, services=None):
+        self.services = services or OfflineServices()
+        self._handlers = {phase: getattr(self, f"_on_{phase}", None) for phase in PHASES}
+
+    def record(self, state: SessionState, role: str, content: str, avatar: str | None = None):
+        state.messages.append(history.Message(role, content, avatar))
+
+    def _t(self, state, string_id, **values) -> str:
+        """Fixed string ``string_id`` in the session's language."""
+        return self.services.localize(state, string_id, **values)
+
+    def _say(self, state, content, prefix=""):
+        """Yield one assistant reply and record it once its text is known."""
+        reply = Reply(content, prefix=prefix)
+        yield reply
+        text = reply.collect()
+        self.record(state, reply.role, f"{prefix}{text}", reply.avatar)
+        return text
+
+    def start(self, state: SessionState):
+        """Display welcome on first load."""
+        if state.phase != "welcome":
+            return
+        yield from self._say(state, self._t(state, "welcome"))
+        yield from self._say(state, self._t(state, "intro"))
+        yield from self._say(
+            state, self._t(state, "consent_request", privacy_notice=self._t(state, "privacy_notice")),
+        )
+        state.phase = "consent"
+
+    def handle(self, state: SessionState, user_input: str):
+        """Process one user message, yielding Busy markers and assistant replies."""
+        self.record(state, "user", user_input, USER_AVATAR)
+        handler = self._handlers.get(state.phase)
+        if handler is None:
+            yield from self._on_other(state, user_input)
+        else:
+            yield from handler(state, user_input)
+
+    def run_turn(self, state: SessionState, user_input: str | None = None) -> list:
+        """Headless helper: run start() or handle() to completion and return reply texts."""
+        items = self.handle(state, user_input) if user_input is not None else self.start(state)
+        return [item.collect() for item in items if isinstance(item, Reply)]
+
+    # Consent phase
+    def _on_consent(self, state, user_input):
+        consent = self.services.parse_consent(state, user_input)
+        if consent is True:
+            state.consent_given = True
+            yield from self._say(state, self._t(state, "consent_given"))
+            state.phase = "personal_info"
+            state.personal_step = "name"
+
+        elif consent is False:
+            yield from self._say(state, self._t(state, "consent_declined"))
+            state.phase = "completion"
+
+        else:
+            yield from self._say(state, self._t(state, "consent_unclear"))
+
+    # Personal information
+    def _on_personal_info(self, state, user_input):
+        step = state.personal_step
+        cd = state.candidate
+
+        if step == "name":
+            cd["name"] = user_input.strip()
+            yield from self._say(state, self._t(state, "ask_email"))
+            state.personal_step = "email"
+
+        elif step == "email":
+            email = validation.parse_email(user_input)
+            if email:
+                cd["email"] = email
+                yield from self._say(state, self._t(state, "ask_phone"))
+                state.personal_step = "phone"
+            else:
+                yield from self._say(state, self._t(state, "invalid_email"))
+
+        elif step == "phone":
+            phone = validation.parse_phone(user_input)
+            if phone:
+                cd["phone"] = phone
+                yield from self._say(state, self._t(state, "ask_location"))
+                state.personal_step = "location"
+            else:
+                yield from self._say(state, self._t(state, "invalid_phone"))
+
+        elif step == "location":
+            cd["location"] = user_input.strip()
+            yield from self._say(state, self._t(state, "ask_experience"))
+            state.phase = "professional_info"
+            state.personal_step = "experience"
+
+    # Professional info
+    def _on_professional_info(self, state, user_input):
+        step = state.personal_step
+        cd = state.candidate
+
+        if step == "experience":
+            cd["experience"] = user_input.strip()
+            yield from self._say(state, self._t(state, "ask_position"))
+            state.personal_step = "position"
+
+        elif step == "position":
+            cd["position"] = user_input.strip()
+            yield from self._say(state, self._t(state, "ask_tech_stack"))
+            state.phase = "tech_stack"
+
+    # Tech stack phase
+    def _on_tech_stack(self, state, user_input):
+        techs = self.services.parse_tech_stack(state, user_input)
+        if techs:
+            state.candidate["tech_stack"] = techs
+            yield from self._say(state, self._t(state, "tech_stack_noted", tech_stack=", ".join(techs)))
+            yield from self._say(state, self._t(state, "ask_language"))
+            state.phase = "language_selection"
+        else:
+            yield from self._say(state, self._t(state, "tech_stack_missing"))
+
+    def _on_language_selection(self, state, user_input):
+        yield Busy(self._t(state, "busy_language"))
+        detected_language = self.services.detect_language(state, user_input)
+        state.user_language = detected_language
+        # Fixed strings in the new language, from one batched call the first time it is picked
+        self.services.load_language(state)
+        cd = state.candidate
+        cd["preferred_language"] = detected_language
+        cd["language_selection"] = detected_language
+        state.q_idx = 0
+        state.technical_responses = []  # Reset responses
+        state.evaluations = []
+        state.ability = {}
+        self.services.plan_assessment(state)
+
+        yield from self._say(state, self._t(state, "language_noted", language=detected_language))
+        ready = "assessment_ready_adaptive" if state.ability else "assessment_ready"
+        yield from self._say(state, self._t(state, ready, count=state.total_questions))
+
+        state.phase = "technical_assessment"
+        yield Busy(self._t(state, "busy_preparing"))
+        self.services.prepare_questions(state)
+        yield from self.ask_next_question(state)
+
+    # Technical Q&A
+    def _on_technical_assessment(self, state, user_input):
+        # Get the current question info
+        current_q_num = state.q_idx - 1
+        current_question = state.current_question
+
+        # Store response
+        state.technical_responses.append({
+            "question_number": current_q_num + 1,
+            "question": current_question,
+            "answer": user_input,
+            "timestamp": datetime.utcnow().isoformat()
+        })
+
+        # Lets the services start the next question before the evaluation blocks
+        self.services.before_evaluation(state)
+
+        # Evaluate the answer using AI
+        yield Busy(self._t(state, "busy_evaluating"))
+        evaluation = self.services.evaluate(state, current_question, user_input)
+        # A queued answer gets a short note now and its evaluation with the summary
+        queued = state.q_idx in state.pending_evaluations
+        header = "" if queued else self._t(state, "evaluation_header")
+        evaluation = yield from self._say(state, evaluation, prefix=header)
+        # Adaptive mode updates the ability estimate and may shorten the assessment
+        self.services.after_evaluation(state, evaluation)
+
+        # Move to next question or finish
+        if state.q_idx < state.total_questions:
+            yield from self.ask_next_question(state)
+        else:
+            yield from self.finish_technical(state)
+
+    # Fallback for completion
+    def _on_other(self, state, user_input):
+        yield from self.late_evaluations(state)
+        if state.phase == "completion":
+            yield from self._say(state, self._t(state, "session_complete"))
+        else:
+            yield from self._say(state, self._t(state, random.choice(i18n.FALLBACK_IDS)))
+
+    _on_summary = _on_other
+    _on_completion = _on_other
+
+    def ask_next_question(self, state):
+        idx = state.q_idx
+        total_q = state.total_questions
+
+        if idx >= total_q:
+            yield from self.finish_technical(state)
+            return
+
+        yield Busy(self._t(state, "busy_question"))
+        content = self.services.question(state, idx + 1)
+        question = yield from self._say(
+            state, content, prefix=self._t(state, "question_header", number=idx + 1, total=total_q),
+        )
+
+        state.current_question = question
+        state.asked_questions.add(question)
+        state.q_idx += 1
+        self.services.after_question(state)
+
+    def finish_technical(self, state):
+        yield from self._say(state, self._t(state, "assessment_done"))
+        state.phase = "summary"
+        yield from self.show_deferred_evaluations(state)
+        yield from self.build_summary(state)
+
+    def show_deferred_evaluations(self, state):
+        """Evaluations of queued answers, waiting a bounded time for those still running."""
+        if state.pending_evaluations:
+            yield Busy(self._t(state, "busy_collecting"))
+            self.services.await_evaluations(state)
+        yield from self._show_collected(state)
+        if state.pending_evaluations:
+            yield from self._say(state, self._t(state, "evaluations_pending", count=len(state.pending_evaluations)))
+
+    def late_evaluations(self, state):
+        """Evaluations of queued answers that finished after the summary; the app checks on every rerun."""
+        if state.phase in ("summary", "completion"):
+            yield from self._show_collected(state)
+
+    def _show_collected(self, state):
+        for number, text in self.services.collect_evaluations(state):
+            yield from self._say(state, text, prefix=self._t(state, "deferred_evaluation_header", number=number))
+
+    def build_summary(self, state):
+        cd = state.candidate
+        missing = self._t(state, "not_provided")
+        fields = {key: cd.get(key, missing) for key in ("name", "email", "experience", "position", "location")}
+        yield from self._say(
+            state, self._t(state, "summary", tech_stack=", ".join(cd.get("tech_stack", [])) or missing, **fields),
+        )
+        yield from self._say(state, self._t(state, "closing"))
+        state.phase = "completion"
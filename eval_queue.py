@@ -0,0 +1,263 @@
+"""Answer evaluations that finish after the candidate has moved on.
+
+Services put an answer here instead of evaluating it during the turn:
+
+- always, with ``TALENTSCOUT_EVAL_QUEUE=memory`` or ``sqlite``. The candidate
+  sees the next question right away, and the evaluations are shown with the
+  summary.
+- while the circuit breaker is open, in any mode. The candidate gets a short
+  "saved, evaluated later" note instead of waiting on a call that cannot
+  succeed.
+
+``WORKERS`` threads evaluate queued answers in order. At most ``MAX_DEPTH``
+answers wait at once. When the queue is full, ``submit`` raises
+``queue.Full`` and services evaluate the answer inline instead. While the
+circuit is open, a worker sleeps until the next probe is due and then tries
+again. Other failures are retried every ``RETRY_DELAY`` seconds, up to
+``MAX_ATTEMPTS`` times.
+
+Jobs are keyed by (session id, question number). Workers never touch session
+state. ``submit`` returns a Future that the session keeps in
+``SessionState.pending_evaluations``, and services attach the results on a
+later turn (``InterviewServices.collect_evaluations``). ``SQLiteEvaluationQueue``
+also writes each job and its result to a local database. Unfinished jobs are
+picked up again after a restart, and a resumed session finds its results by
+key. Queue depth and lag (enqueue to start, enqueue to result) go to
+``metrics``.
+"""
+
+import json
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, InvalidStateError
+
+import llm
+import metrics
+from breaker import CircuitOpen
+
+# "memory" or "sqlite" evaluates every answer in the background; "off" only during outages
+MODE = os.getenv("TALENTSCOUT_EVAL_QUEUE", "off").lower()
+WORKERS = int(os.getenv("TALENTSCOUT_EVAL_WORKERS", "8"))
+MAX_DEPTH = int(os.getenv("TALENTSCOUT_EVAL_QUEUE_SIZE", "1000"))
+QUEUE_PATH = os.getenv("TALENTSCOUT_EVAL_QUEUE_PATH", "talentscout_eval_queue.db")
+# Seconds between attempts at an evaluation that failed for a reason other than the open circuit
+RETRY_DELAY = float(os.getenv("TALENTSCOUT_EVAL_RETRY_DELAY", "5"))
+MAX_ATTEMPTS = int(os.getenv("TALENTSCOUT_EVAL_ATTEMPTS", "5"))
+# Shortest wait before asking an open circuit again
+POLL = 1.0
+# Recent lags kept for the percentiles in ``stats``
+LAG_SAMPLES = 1000
+
+
+class EvaluationQueue:
+    backend = "memory"
+
+    def __init__(self, evaluate, breaker=None, workers: int = WORKERS, max_depth: int = MAX_DEPTH,
+                 retry_delay: float = RETRY_DELAY, max_attempts: int = MAX_ATTEMPTS):
+        self._evaluate = evaluate  # job dict -> result, called on a worker thread
+        self.breaker = breaker
+        self.workers = workers
+        self.max_depth = max_depth
+        self.retry_delay = retry_delay
+        self.max_attempts = max_attempts
+        self._queue = queue.Queue()
+        self._futures = {}  # key -> Future, until the session collects it
+        self._threads = []
+        self._depth = 0  # queued or running
+        self._lags = deque(maxlen=LAG_SAMPLES)
+        self._lock = threading.Lock()
+        self.counters = {"queued": 0, "done": 0, "failed": 0, "retries": 0, "full": 0}
+
+    def submit(self, key: tuple, job: dict) -> Future:
+        """Queue one evaluation; raises ``queue.Full`` at ``max_depth``.
+
+        The Future resolves to the result, or to the last error after ``max_attempts``.
+        """
+        with self._lock:
+            if self._depth >= self.max_depth:
+                self.counters["full"] += 1
+                raise queue.Full
+            self._depth += 1
+            self.counters["queued"] += 1
+        job = dict(job, enqueued_at=time.time())
+        self._save(key, job)
+        return self._enqueue(key, job)
+
+    def _enqueue(self, key: tuple, job: dict) -> Future:
+        future = Future()
+        with self._lock:
+            self._futures[key] = future
+            while len(self._threads) < self.workers:
+                thread = threading.Thread(target=self._run, name=f"eval-queue-{len(self._threads)}", daemon=True)
+                self._threads.append(thread)
+                thread.start()
+        metrics.EVAL_QUEUE_DEPTH.set(self._depth, self.backend)
+        self._queue.put((key, job, future, 0))
+        return future
+
+    def lookup(self, key: tuple) -> Future | None:
+        """The Future for ``key``, or None if this queue never saw it or the job was lost."""
+        with self._lock:
+            return self._futures.get(key)
+
+    def forget(self, key: tuple):
+        """Drop a collected result."""
+        with self._lock:
+            self._futures.pop(key, None)
+
+    def _run(self):
+        while True:
+            key, job, future, attempts = self._queue.get()
+            if future.cancelled():
+                self._done(key, job, "cancelled")
+                continue
+            if not attempts:
+                metrics.EVAL_QUEUE_LAG.observe(time.time() - job["enqueued_at"], "wait")
+            try:
+                result = self._evaluate(job)
+            except CircuitOpen:
+                # Not the answer's fault: wait for the next probe and keep the attempt
+                time.sleep(max(self.breaker.retry_in() if self.breaker is not None else 0.0, POLL))
+                self._retry(key, job, future, attempts)
+            except Exception as error:
+                if attempts + 1 >= self.max_attempts:
+                    self._done(key, job, "failed")
+                    _resolve(future, error=error)
+                else:
+                    time.sleep(self.retry_delay)
+                    self._retry(key, job, future, attempts + 1)
+            else:
+                self._done(key, job, "done", result)
+                _resolve(future, result)
+
+    def _retry(self, key, job, future, attempts):
+        with self._lock:
+            self.counters["retries"] += 1
+        self._queue.put((key, job, future, attempts))
+
+    def _done(self, key, job, outcome: str, result=None):
+        lag = time.time() - job["enqueued_at"]
+        with self._lock:
+            self._depth -= 1
+            if outcome != "cancelled":
+                self.counters[outcome] += 1
+                self._lags.append(lag)
+        metrics.EVAL_QUEUE_DEPTH.set(self._depth, self.backend)
+        metrics.EVAL_QUEUE_JOBS.inc(self.backend, outcome)
+        if outcome != "cancelled":
+            metrics.EVAL_QUEUE_LAG.observe(lag, "result")
+        self._finish(key, outcome, result)
+
+    # Persistence hooks; the in-memory queue keeps nothing
+    def _save(self, key: tuple, job: dict):
+        pass
+
+    def _finish(self, key: tuple, outcome: str, result):
+        pass
+
+    def stats(self) -> dict:
+        with self._lock:
+            lags = sorted(self._lags)
+            return dict(self.counters, backend=self.backend, depth=self._depth, workers=len(self._threads),
+                        lag_p50_s=_percentile(lags, 50), lag_p95_s=_percentile(lags, 95))
+
+
+def _percentile(ordered: list, pct: float) -> float | None:
+    return round(ordered[min(len(ordered) - 1, int(pct / 100 * len(ordered)))], 3) if ordered else None
+
+
+def _encode(result) -> str:
+    if isinstance(result, llm.Evaluation):
+        return json.dumps({"evaluation": result.to_row()}, ensure_ascii=False)
+    return json.dumps({"text": result}, ensure_ascii=False)
+
+
+def _decode(body: str):
+    data = json.loads(body)
+    return llm.Evaluation(**data["evaluation"]) if "evaluation" in data else data["text"]
+
+
+class SQLiteEvaluationQueue(EvaluationQueue):
+    """Evaluation queue whose jobs and results survive a restart in a local SQLite file."""
+
+    backend = "sqlite"
+
+    def __init__(self, evaluate, path: str = QUEUE_PATH, **kwargs):
+        super().__init__(evaluate, **kwargs)
+        self._db_lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._db_lock, self._db:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS eval_jobs ("
+                "session_id TEXT NOT NULL, question_number INTEGER NOT NULL, job TEXT NOT NULL, "
+                "status TEXT NOT NULL, result TEXT, updated REAL NOT NULL, "
+                "PRIMARY KEY (session_id, question_number))"
+            )
+            rows = self._db.execute("SELECT session_id, question_number, job FROM eval_jobs WHERE status = 'queued'").fetchall()
+        # Jobs a previous process accepted but did not finish
+        for session_id, number, body in rows:
+            with self._lock:
+                self._depth += 1
+            self._enqueue((session_id, number), json.loads(body))
+
+    def _save(self, key, job):
+        with self._db_lock, self._db:
+            self._db.execute(
+                "INSERT OR REPLACE INTO eval_jobs (session_id, question_number, job, status, result, updated) "
+                "VALUES (?, ?, ?, 'queued', NULL, ?)",
+                (*key, json.dumps(job, ensure_ascii=False), time.time()),
+            )
+
+    def _finish(self, key, outcome, result):
+        body = _encode(result) if outcome == "done" else None
+        with self._db_lock, self._db:
+            self._db.execute(
+                "UPDATE eval_jobs SET status = ?, result = ?, updated = ? WHERE session_id = ? AND question_number = ?",
+                (outcome, body, time.time(), *key),
+            )
+
+    def lookup(self, key):
+        future = super().lookup(key)
+        if future is not None:
+            return future
+        with self._db_lock:
+            row = self._db.execute(
+                "SELECT status, result FROM eval_jobs WHERE session_id = ? AND question_number = ?", key,
+            ).fetchone()
+        if row is None:
+            return None
+        future = Future()
+        if row[0] == "queued":
+            return future  # another process is still on it; looked up again on the next rerun
+        if row[0] == "done":
+            future.set_result(_decode(row[1]))
+        else:
+            future.set_exception(RuntimeError(f"Evaluation {row[0]}"))
+        return future
+
+    def forget(self, key):
+        super().forget(key)
+        with self._db_lock, self._db:
+            self._db.execute("DELETE FROM eval_jobs WHERE session_id = ? AND question_number = ?", key)
+
+
+def from_env(evaluate, breaker=None, mode: str = MODE, path: str = QUEUE_PATH):
+    """The queue for ``mode``; outside background mode it only drains outage backlogs, with the same pool size."""
+    if mode == "sqlite":
+        return SQLiteEvaluationQueue(evaluate, path=path, breaker=breaker)
+    return EvaluationQueue(evaluate, breaker=breaker, workers=WORKERS)
+
+
+def _resolve(future: Future, result=None, error=None):
+    try:
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+    except InvalidStateError:
+        pass  # cancelled meanwhile (session reset)
@@ -0,0 +1,212 @@
+"""Session export as TXT, JSON or JSONL.
+
+Every format is a generator of text chunks, so a transcript is written as it
+is produced instead of being assembled into one string first. Messages can
+come from any iterable; ``SessionStore.iter_messages`` pages them out of the
+store (the file backend reads each session file once), so even very long
+sessions are never fully in memory. All formats carry the same data,
+including each answer's evaluation.
+
+``bulk_export`` streams many stored sessions into one gzip file, one session
+at a time, for batch handoff to an ATS:
+
+    python export.py --out sessions.jsonl.gz --since-hours 24
+"""
+
+import argparse
+import gzip
+import io
+import json
+import textwrap
+import time
+from datetime import datetime
+from functools import lru_cache
+
+import adaptive
+import session_store
+from engine import SessionState
+
+WIDTH = 60
+
+
+@lru_cache(maxsize=8)
+def _wrapper(width: int) -> textwrap.TextWrapper:
+    return textwrap.TextWrapper(width=width, break_long_words=False, break_on_hyphens=False)
+
+
+def wrap_right(text: str, width: int = WIDTH):
+    """Yield ``text`` wrapped at word boundaries, each line right-aligned to ``width``."""
+    for line in text.split("\n"):
+        for wrapped in _wrapper(width).wrap(line) or [""]:
+            yield wrapped.rjust(width)
+
+
+def _evaluations(state) -> dict:
+    return {evaluation.question_number: evaluation for evaluation in state.evaluations}
+
+
+def _candidate(state) -> dict:
+    return {key: ", ".join(value) if isinstance(value, list) else value for key, value in state.candidate.items()}
+
+
+def iter_txt(state, messages=None, exported_at: datetime | None = None):
+    """Plain-text transcript: candidate info, conversation, assessment summary."""
+    exported_at = exported_at or datetime.utcnow()
+    messages = state.messages if messages is None else messages
+    rule = "=" * WIDTH
+    yield f"{rule}\nTALENTSCOUT SESSION EXPORT\n{rule}\n"
+    yield f"Export Date: {exported_at.strftime('%Y-%m-%d %H:%M:%S UTC')}\nSession Phase: {state.phase.title()}\n\n"
+
+    if state.candidate:
+        yield "CANDIDATE INFORMATION:\n" + "-" * 25 + "\n"
+        for key, value in _candidate(state).items():
+            yield f"{key.replace('_', ' ').title()}: {value}\n"
+        yield "\n"
+
+    yield "CONVERSATION HISTORY:\n" + "-" * 25 + "\n"
+    for msg in messages:
+        role = msg.get("role", "unknown")
+        if role == "assistant":
+            yield f"🤖 AI Assistant:\n{msg.get('content', '')}\n\n"
+        elif role == "user":
+            yield f"{'👤 User:':>{WIDTH}}\n"
+            for line in wrap_right(msg.get("content", "")):
+                yield line + "\n"
+            yield "\n"
+
+    if state.technical_responses:
+        scored = _evaluations(state)
+        yield "TECHNICAL ASSESSMENT SUMMARY:\n" + "-" * 35 + "\n"
+        for i, response in enumerate(state.technical_responses, 1):
+            yield f"Question {i}:\nQ: {response.get('question', 'N/A')}\nA: {response.get('answer', 'N/A')}\n"
+            evaluation = scored.get(response.get("question_number"))
+            if evaluation is not None:
+                yield ("Scores (accuracy/completeness/clarity/correctness): "
+                       + " / ".join(str(score) for score in evaluation.scores) + "\n")
+                if evaluation.feedback:
+                    yield f"Feedback: {evaluation.feedback}\n"
+            elif response.get("evaluation"):
+                yield f"Evaluation:\n{response['evaluation']}\n"
+            yield "\n"
+
+    yield "SESSION METADATA:\n" + "-" * 20 + "\n"
+    yield f"Total Questions: {state.total_questions}\n"
+    yield f"Questions Answered: {len(state.technical_responses)}\n"
+    if state.ability:
+        yield f"Estimated Level: {adaptive.describe(state.ability)}\n"
+    yield f"Completion Status: {state.phase.title()}\n\n"
+    yield f"{rule}\nEND OF SESSION EXPORT\n{rule}\n"
+
+
+def _session_record(state, exported_at: datetime) -> dict:
+    return {
+        "session_id": state.session_id,
+        "exported_at": exported_at.isoformat(),
+        "phase": state.phase,
+        "language": state.user_language,
+        "total_questions": state.total_questions,
+        "questions_answered": len(state.technical_responses),
+        "candidate": _candidate(state),
+        "ability": {key: state.ability[key] for key in ("level", "sd", "techs")} if state.ability else None,
+    }
+
+
+def _message_record(msg: dict) -> dict:
+    return {"role": msg.get("role"), "content": msg.get("content", ""), "timestamp": msg.get("timestamp")}
+
+
+def _response_records(state):
+    scored = _evaluations(state)
+    for response in state.technical_responses:
+        record = dict(response)
+        evaluation = scored.get(response.get("question_number"))
+        if evaluation is not None:
+            record["evaluation"] = evaluation.to_row()
+        yield record
+
+
+def _dumps(value) -> str:
+    return json.dumps(value, ensure_ascii=False)
+
+
+def iter_json(state, messages=None, exported_at: datetime | None = None):
+    """One JSON document; messages are serialized one at a time."""
+    messages = state.messages if messages is None else messages
+    head = _dumps(_session_record(state, exported_at or datetime.utcnow()))
+    yield head[:-1] + ', "messages": ['
+    for i, msg in enumerate(messages):
+        yield ("," if i else "") + "\n  " + _dumps(_message_record(msg))
+    yield '\n], "technical_responses": ' + _dumps(list(_response_records(state))) + "}\n"
+
+
+def iter_jsonl(state, messages=None, exported_at: datetime | None = None):
+    """One JSON object per line, each tagged with ``record`` and ``session_id``."""
+    messages = state.messages if messages is None else messages
+    session_id = state.session_id
+    yield _dumps({"record": "session", **_session_record(state, exported_at or datetime.utcnow())}) + "\n"
+    for i, msg in enumerate(messages):
+        yield _dumps({"record": "message", "session_id": session_id, "index": i, **_message_record(msg)}) + "\n"
+    for response in _response_records(state):
+        yield _dumps({"record": "response", "session_id": session_id, **response}) + "\n"
+
+
+# format -> (writer, MIME type)
+FORMATS = {
+    "txt": (iter_txt, "text/plain"),
+    "json": (iter_json, "application/json"),
+    "jsonl": (iter_jsonl, "application/x-ndjson"),
+}
+
+
+def to_bytes(state, fmt: str = "txt", messages=None) -> bytes:
+    """One session encoded as UTF-8, for ``st.download_button`` (which holds the bytes in memory anyway)."""
+    writer, _ = FORMATS[fmt]
+    out = io.BytesIO()
+    for chunk in writer(state, messages):
+        out.write(chunk.encode("utf-8"))
+    return out.getvalue()
+
+
+def bulk_export(store, path: str, fmt: str = "jsonl", since: float | None = None, state_cls=SessionState) -> int:
+    """Stream every stored session (written since ``since``, epoch seconds) into a gzip file; returns the count.
+
+    JSONL and TXT sessions are concatenated; JSON sessions form one array.
+    """
+    writer, _ = FORMATS[fmt]
+    exported_at = datetime.utcnow()
+    count = 0
+    with gzip.open(path, "wt", encoding="utf-8") as out:
+        if fmt == "json":
+            out.write("[\n")
+        for session_id in store.session_ids(since):
+            state = store.load(session_id, state_cls, with_messages=False)
+            if state is None:
+                continue
+            if count and fmt == "json":
+                out.write(",\n")
+            out.writelines(writer(state, store.iter_messages(session_id), exported_at))
+            count += 1
+        if fmt == "json":
+            out.write("]\n")
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export stored sessions into one gzip file.")
+    parser.add_argument("--out", required=True, help="output file, e.g. sessions.jsonl.gz")
+    parser.add_argument("--format", default="jsonl", choices=sorted(FORMATS))
+    parser.add_argument("--since-hours", type=float, help="only sessions written in the last N hours")
+    parser.add_argument("--backend", default=session_store.BACKEND if session_store.BACKEND != "off" else "sqlite",
+                        choices=["sqlite", "file", "redis"])
+    parser.add_argument("--path", default=session_store.STORE_PATH, help="store path or Redis URL")
+    args = parser.parse_args()
+
+    store = session_store.from_env(args.backend, args.path)
+    since = time.time() - args.since_hours * 3600 if args.since_hours else None
+    started = time.perf_counter()
+    count = bulk_export(store, args.out, args.format, since)
+    print(f"{count} sessions written to {args.out} in {time.perf_counter() - started:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
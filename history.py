@@ -0,0 +1,193 @@
+"""Compact chat history kept in ``SessionState.messages``.
+
+Every session in the process holds its whole conversation, and evaluation
+texts run to a few kilobytes each. A ``Message`` is a ``__slots__`` record:
+role and avatar are interned, so all sessions share one copy of each value,
+and the timestamp is integer epoch seconds instead of an ISO string. Content
+is held as UTF-8 bytes when that is smaller than the ``str``. A single emoji,
+such as the one in the evaluation header, makes CPython store every character
+of the message in four bytes. For the
+code that still reads messages as dicts (``app.py``, ``export``),
+``message["role"]`` and ``message.get("timestamp")`` keep working, and
+``timestamp`` is the same UTC ISO string as before.
+
+``MessageLog`` is the list of a session's messages. With
+``TALENTSCOUT_HISTORY_COLD_AFTER`` set, only that many newest messages stay
+as records. Older ones are packed ``BLOCK`` at a time into zlib-compressed
+JSON blocks. A rerun renders only the newest messages, and the session
+store saves only new ones, so neither touches a cold block. Reading the
+cold part (the folded history, an export) decompresses one block at a time.
+
+Rows written to the session store keep the old dict layout (``to_row``), so
+stores and exports written before this module are still read.
+"""
+
+import itertools
+import json
+import os
+import sys
+import time
+import zlib
+from datetime import datetime, timezone
+
+# Newest messages kept uncompressed; older ones go to the cold tier (0 keeps everything)
+COLD_AFTER = int(os.getenv("TALENTSCOUT_HISTORY_COLD_AFTER", "0"))
+# Messages per compressed block
+BLOCK = 16
+
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def iso_timestamp(ts: int) -> str:
+    return datetime.fromtimestamp(ts, timezone.utc).replace(tzinfo=None).isoformat()
+
+
+def epoch(timestamp) -> int:
+    """Epoch seconds from an ISO string (naive means UTC) or a number; now if missing."""
+    if isinstance(timestamp, (int, float)):
+        return int(timestamp)
+    if not timestamp:
+        return int(time.time())
+    parsed = datetime.fromisoformat(timestamp)
+    return int((parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)).timestamp())
+
+
+class Message:
+    __slots__ = ("role", "_content", "avatar", "ts")
+
+    def __init__(self, role: str, content: str, avatar: str | None = None, ts: int | None = None):
+        self.role = _intern(role)
+        self.content = content
+        self.avatar = _intern(avatar)
+        self.ts = int(time.time()) if ts is None else ts
+
+    @property
+    def content(self) -> str:
+        content = self._content
+        return content.decode("utf-8") if isinstance(content, bytes) else content
+
+    @content.setter
+    def content(self, text: str):
+        if not text.isascii():
+            encoded = text.encode("utf-8")
+            if sys.getsizeof(encoded) < sys.getsizeof(text):
+                self._content = encoded
+                return
+        self._content = text
+
+    @property
+    def timestamp(self) -> str:
+        return iso_timestamp(self.ts)
+
+    # Read-only dict interface, for code written against the old message dicts
+    def __getitem__(self, key: str):
+        if key not in ("role", "content", "avatar", "timestamp"):
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def to_row(self) -> dict:
+        return {"role": self.role, "content": self.content, "avatar": self.avatar, "timestamp": self.timestamp}
+
+    @classmethod
+    def from_row(cls, row: dict) -> "Message":
+        return cls(row.get("role"), row.get("content", ""), row.get("avatar"), epoch(row.get("timestamp")))
+
+    def __repr__(self):
+        return f"Message({self.role!r}, {self.content[:40]!r}, ts={self.ts})"
+
+
+def to_row(message) -> dict:
+    """Store layout of a message, given as a ``Message`` or an old-style dict."""
+    return message.to_row() if isinstance(message, Message) else message
+
+
+def _record(message) -> Message:
+    return message if isinstance(message, Message) else Message.from_row(message)
+
+
+def _pack(messages: list) -> bytes:
+    rows = [[m.role, m.content, m.avatar, m.ts] for m in messages]
+    return zlib.compress(json.dumps(rows, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+
+def _unpack(block: bytes) -> list:
+    return [Message(*row) for row in json.loads(zlib.decompress(block))]
+
+
+class MessageLog:
+    """A session's messages, oldest first; supports the list operations the app uses."""
+
+    __slots__ = ("cold_after", "_blocks", "_cold", "_hot")
+
+    def __init__(self, messages=(), cold_after: int = COLD_AFTER):
+        self.cold_after = cold_after
+        self._blocks = []  # compressed blocks of BLOCK messages each
+        self._cold = 0  # messages in _blocks
+        self._hot = []
+        self.extend(messages)
+
+    def append(self, message):
+        self._hot.append(_record(message))
+        self._compact()
+
+    def extend(self, messages):
+        self._hot.extend(map(_record, messages))
+        self._compact()
+
+    def prepend(self, messages):
+        """Put older messages (from the session store) in front."""
+        everything = [*map(_record, messages), *self]
+        self._blocks, self._cold, self._hot = [], 0, []
+        self.extend(everything)
+
+    def _compact(self):
+        if self.cold_after <= 0:
+            return
+        while len(self._hot) >= self.cold_after + BLOCK:
+            self._blocks.append(_pack(self._hot[:BLOCK]))
+            del self._hot[:BLOCK]
+            self._cold += BLOCK
+
+    def __len__(self) -> int:
+        return self._cold + len(self._hot)
+
+    def _iter_from(self, start: int):
+        for number in range(start // BLOCK, len(self._blocks)):
+            block = _unpack(self._blocks[number])
+            yield from block[max(start - number * BLOCK, 0):]
+        yield from self._hot[max(start - self._cold, 0):]
+
+    def __iter__(self):
+        return self._iter_from(0)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            stop = max(stop, start) if step == 1 else stop
+            if step == 1 and start >= self._cold:
+                return self._hot[start - self._cold:stop - self._cold]
+            if step == 1:
+                return list(itertools.islice(self._iter_from(start), stop - start))
+            return list(self)[index]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("message index out of range")
+        if index >= self._cold:
+            return self._hot[index - self._cold]
+        return _unpack(self._blocks[index // BLOCK])[index % BLOCK]
+
+    def stats(self) -> dict:
+        return {"messages": len(self), "hot": len(self._hot), "cold": self._cold,
+                "cold_bytes": sum(map(len, self._blocks))}
+
+    def __repr__(self):
+        return f"MessageLog({len(self)} messages, {self._cold} cold)"
@@ -0,0 +1,261 @@
+"""Catalog of the assistant's fixed strings and their translations.
+
+``STRINGS`` holds every fixed message the interview shows, in English, by
+string id. Placeholders such as ``{language}`` are filled in after
+translation. A ``Catalog`` keeps the translations in memory, keyed by
+language and string id. It persists them to a JSON file
+(``TALENTSCOUT_TRANSLATION_CACHE``), so they survive restarts and are
+shared by every session in the process.
+
+A language is filled once, lazily: the first session to pick it makes one
+batched LLM call for all missing strings (``Catalog.load``). Sessions that
+pick the same language meanwhile wait for that call instead of sending
+their own. Afterwards ``Catalog.text`` is a dictionary lookup. Each entry
+stores a hash of its English source, so editing a string here gets it
+translated again. A translation that lost or invented a placeholder is
+dropped, and that string stays in English.
+"""
+
+import hashlib
+import json
+import os
+import string
+import threading
+import time
+from concurrent.futures import Future
+
+CACHE_PATH = os.getenv("TALENTSCOUT_TRANSLATION_CACHE", "talentscout_translations.json")  # or "off"
+# Seconds before a language whose batch call failed is tried again
+RETRY_AFTER = 60.0
+
+STRINGS = {
+    "welcome": "Hello! I'm **TalentScout**, your AI hiring assistant. 👋",
+    "intro": (
+        "This screening takes roughly *5–10 minutes* and uses **AI-powered questions** "
+        "tailored to your skills and background."
+    ),
+    "privacy_notice": (
+        "Your information will be used solely for recruitment purposes. "
+        "We comply with GDPR and data-protection regulations. "
+        "You can request data deletion at any time."
+        "Export Your Data as We will not store your Data after this session is over due to privacy "
+    ),
+    "consent_request": (
+        "Before we begin, **do you consent** to our privacy policy?\n\n> {privacy_notice}\n\n"
+        "Please respond with **yes** or **no**."
+    ),
+    "consent_given": "Excellent! Let's start with some basic information. What's your **full name**?",
+    "consent_declined": "I understand. Without consent we cannot proceed. Feel free to return when ready. 👋",
+    "consent_unclear": "Please reply **yes** or **no** regarding consent.",
+    "ask_email": "Great! What's your **email address**?",
+    "invalid_email": "That doesn't look like a valid email. Please try again.",
+    "ask_phone": "Thanks! What's your **phone number**?",
+    "invalid_phone": "That doesn't look like a valid phone number. Please include the country code if any.",
+    "ask_location": "And your **current location** (city, country)?",
+    "ask_experience": "Awesome. How many **years of experience** do you have in technology?",
+    "ask_position": "What **position(s)** are you interested in or currently seeking?",
+    "ask_tech_stack": (
+        "Great choice! Please list your **tech stack** (languages / frameworks / tools) separated by commas."
+    ),
+    "tech_stack_noted": "Impressive stack: {tech_stack}",
+    "ask_language": (
+        "**What language would you like to use for Questions?** 🌍\n\n"
+        "Please type your preferred language (e.g., English, Spanish, Hindi, French, etc.):"
+    ),
+    "tech_stack_missing": "Please provide at least one technology.",
+    "language_noted": "Perfect! I've noted that you prefer **{language}** for this Questions. 👍",
+    "assessment_ready": (
+        "Perfect! Now I'll generate **AI-powered technical questions** tailored to your skills. "
+        "Ready for {count} questions?"
+    ),
+    "assessment_ready_adaptive": (
+        "Perfect! Now I'll generate **AI-powered technical questions** tailored to your skills. "
+        "Ready for up to {count} questions?"
+    ),
+    "question_header": "**Question {number}/{total}**\n\n",
+    "evaluation_header": "**📊 Evaluation:**\n\n",
+    "assessment_done": "🎉 Excellent work – you've completed the technical assessment.",
+    "summary": (
+        "### Application Summary\n"
+        "**Name:** {name}  \n"
+        "**Email:** {email}  \n"
+        "**Experience:** {experience}  \n"
+        "**Position:** {position}  \n"
+        "**Location:** {location}  \n"
+        "**Tech-Stack:** {tech_stack}"
+    ),
+    "not_provided": "_Not provided_",
+    "closing": (
+        "Thank you for completing the screening! Our recruitment team will review "
+        "your responses within **2-3 business days** and contact you if there is a match."
+    ),
+    "session_complete": "The session is complete. Thank you for using TalentScout! 👋",
+    "fallback_1": "I didn't quite understand that 🤔  Could you please re-phrase?",
+    "fallback_2": "Let me try a different approach – can you give more detail?",
+    "fallback_3": "Hmm, I'm not sure I follow. Could you clarify?",
+    "fallback_4": "That's interesting! Can you elaborate a bit more?",
+    "fallback_5": "I want to be sure I understand – could you re-state that?",
+    "fallback_question": "Describe your experience working with {technology} in a production environment.",
+    "primary_technology": "your primary technology",
+    "evaluation_unavailable": "Unable to evaluate answer at this time. Thank you for your response!",
+    "evaluation_deferred": (
+        "Thank you! Your answer has been saved. Our evaluation service is busy right now, "
+        "so it will be scored shortly and included in your summary."
+    ),
+    "evaluation_queued": "Thanks, your answer has been recorded. You'll find its evaluation in your summary.",
+    "deferred_evaluation_header": "**📊 Evaluation of question {number}:**\n\n",
+    "evaluations_pending": (
+        "{count} of your answers are still being evaluated. The results will be added to your "
+        "application for our recruitment team."
+    ),
+    "busy_language": "🌍 Noting your language preference...",
+    "busy_preparing": "🤖 Preparing your technical questions...",
+    "busy_evaluating": "🤖 Evaluating your answer...",
+    "busy_question": "🤖 Generating your next question...",
+    "busy_collecting": "🤖 Collecting your evaluations...",
+}
+FALLBACK_IDS = [key for key in STRINGS if key.startswith("fallback_") and key[-1].isdigit()]
+
+
+def placeholders(text: str) -> set | None:
+    """Field names in a format string; None if its braces are malformed."""
+    try:
+        return {name for _, name, _, _ in string.Formatter().parse(text) if name}
+    except ValueError:
+        return None
+
+
+def source_hash(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:10]
+
+
+def language_key(language: str) -> str:
+    return (language or "english").strip().casefold()
+
+
+def render(string_id: str, /, **values) -> str:
+    """The English string, formatted."""
+    text = STRINGS[string_id]
+    return text.format(**values) if values else text
+
+
+class Catalog:
+    def __init__(self, path: str | None = CACHE_PATH, strings: dict | None = None):
+        self.path = None if path in (None, "", "off") else path
+        self.strings = STRINGS if strings is None else strings
+        self._hashes = {key: source_hash(text) for key, text in self.strings.items()}
+        self._languages = {}  # language key -> {string id: translated text}
+        self._loading = {}  # language key -> Future of the batch call in flight
+        self._failed = {}  # language key -> monotonic time of the last failed batch
+        self._lock = threading.Lock()
+        self.counters = {"hits": 0, "misses": 0, "batches": 0, "batch_errors": 0, "rejected": 0}
+        self._read()
+
+    def _read(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                stored = json.load(f)
+        except (OSError, ValueError):
+            return
+        for language, entries in stored.items():
+            self._languages[language] = {
+                key: text for key, (digest, text) in entries.items() if self._hashes.get(key) == digest
+            }
+
+    def _write(self):
+        """Save every language atomically; called with the lock held."""
+        if not self.path:
+            return
+        data = {
+            language: {key: [self._hashes[key], text] for key, text in entries.items()}
+            for language, entries in self._languages.items()
+        }
+        tmp = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=1)
+        os.replace(tmp, self.path)
+
+    def missing(self, language: str) -> dict:
+        """{string id: English text} not yet translated into ``language``."""
+        with self._lock:
+            have = self._languages.get(language_key(language), {})
+            return {key: text for key, text in self.strings.items() if key not in have}
+
+    def load(self, language: str, translate) -> bool:
+        """Make sure ``language`` is translated, calling ``translate(strings, language)`` at most once.
+
+        ``translate`` gets {id: English text} and returns {id: translation}.
+        Blocks while another thread fills the same language. Returns False if
+        the strings stay English (the batch failed, or failed recently).
+        """
+        key = language_key(language)
+        if key == "english":
+            return True
+        with self._lock:
+            future = self._loading.get(key)
+            owner = future is None
+            if owner:
+                failed_at = self._failed.get(key)
+                if failed_at is not None and time.monotonic() - failed_at < RETRY_AFTER:
+                    return False
+                if all(k in self._languages.get(key, {}) for k in self.strings):
+                    return True
+                future = self._loading[key] = Future()
+        if not owner:
+            return future.result()
+
+        todo = self.missing(language)
+        try:
+            translated = translate(todo, language)
+        except Exception:
+            translated = None
+        with self._lock:
+            self.counters["batches"] += 1
+            del self._loading[key]
+            if not translated:
+                self.counters["batch_errors"] += 1
+                self._failed[key] = time.monotonic()
+                future.set_result(False)
+                return False
+            entries = self._languages.setdefault(key, {})
+            for string_id, source in todo.items():
+                text = translated.get(string_id)
+                if isinstance(text, str) and text.strip() and placeholders(text) == placeholders(source):
+                    entries[string_id] = text
+                else:
+                    self.counters["rejected"] += 1
+                    entries[string_id] = source  # keep English rather than ask again every time
+            self._failed.pop(key, None)
+            try:
+                self._write()
+            except OSError:
+                pass  # still served from memory
+        future.set_result(True)
+        return True
+
+    def is_translated(self, string_id: str, language: str) -> bool:
+        """Whether ``string_id`` is shown in ``language`` rather than in English (English always is)."""
+        key = language_key(language)
+        if key == "english":
+            return True
+        with self._lock:
+            text = self._languages.get(key, {}).get(string_id)
+        return text is not None and text != self.strings[string_id]
+
+    def text(self, string_id: str, language: str, /, **values) -> str:
+        """The string in ``language`` if it is loaded, else in English; formatted with ``values``."""
+        key = language_key(language)
+        text = None
+        if key != "english":
+            with self._lock:
+                text = self._languages.get(key, {}).get(string_id)
+                self.counters["hits" if text is not None else "misses"] += 1
+        if text is None:
+            text = self.strings[string_id]
+        return text.format(**values) if values else text
+
+    def stats(self) -> dict:
+        with self._lock:
+            return dict(self.counters, languages=sorted(self._languages))
@@ -0,0 +1,139 @@
+"""Local language-name resolver with a process-wide cache.
+
+``resolve`` maps inputs such as "Spanish", "español", "es" or "हिंदी" to the
+English language name without a network call. Inputs it cannot resolve are
+sent to Groq by the caller, which hands the answer back through ``remember``
+so every Streamlit session in the process benefits from it.
+"""
+
+import os
+import re
+import threading
+import unicodedata
+from collections import OrderedDict
+
+CACHE_SIZE = int(os.getenv("TALENTSCOUT_LANGUAGE_CACHE_SIZE", "1024"))
+
+# English name -> ISO 639 codes followed by other names and native endonyms
+LANGUAGES = {
+    "English": ["en", "eng", "inglés", "ingles", "anglais", "englisch", "अंग्रेज़ी", "英语", "英語"],
+    "Spanish": ["es", "spa", "español", "espanol", "castellano", "castilian", "espagnol", "spanisch", "स्पेनिश"],
+    "French": ["fr", "fra", "fre", "français", "francais", "francés", "frances", "französisch", "फ़्रेंच"],
+    "German": ["de", "deu", "ger", "deutsch", "alemán", "aleman", "allemand", "जर्मन"],
+    "Italian": ["it", "ita", "italiano", "italien", "italienisch"],
+    "Portuguese": ["pt", "por", "português", "portugues", "portugués", "brazilian portuguese", "português do brasil"],
+    "Dutch": ["nl", "nld", "dut", "nederlands", "flemish", "vlaams"],
+    "Russian": ["ru", "rus", "русский", "русский язык"],
+    "Ukrainian": ["uk", "ukr", "українська"],
+    "Polish": ["pl", "pol", "polski"],
+    "Czech": ["cs", "ces", "cze", "čeština", "cestina"],
+    "Romanian": ["ro", "ron", "rum", "română", "romana"],
+    "Hungarian": ["hu", "hun", "magyar"],
+    "Greek": ["el", "ell", "gre", "ελληνικά"],
+    "Turkish": ["tr", "tur", "türkçe", "turkce"],
+    "Swedish": ["sv", "swe", "svenska"],
+    "Norwegian": ["nor", "nb", "nob", "norsk", "bokmål", "bokmal"],
+    "Danish": ["da", "dan", "dansk"],
+    "Finnish": ["fi", "fin", "suomi"],
+    "Arabic": ["ar", "ara", "العربية", "عربي"],
+    "Hebrew": ["he", "heb", "עברית"],
+    "Persian": ["fa", "fas", "per", "farsi", "فارسی"],
+    "Hindi": ["hi", "hin", "हिंदी", "हिन्दी"],
+    "Bengali": ["bn", "ben", "bangla", "বাংলা"],
+    "Urdu": ["ur", "urd", "اردو"],
+    "Punjabi": ["pa", "pan", "ਪੰਜਾਬੀ"],
+    "Marathi": ["mr", "mar", "मराठी"],
+    "Gujarati": ["gu", "guj", "ગુજરાતી"],
+    "Tamil": ["ta", "tam", "தமிழ்"],
+    "Telugu": ["te", "tel", "తెలుగు"],
+    "Kannada": ["kn", "kan", "ಕನ್ನಡ"],
+    "Malayalam": ["ml", "mal", "മലയാളം"],
+    "Chinese": ["zh", "zho", "chi", "mandarin", "中文", "汉语", "漢語", "普通话", "simplified chinese", "traditional chinese"],
+    "Cantonese": ["yue", "粵語", "广东话", "廣東話"],
+    "Japanese": ["ja", "jpn", "日本語", "nihongo"],
+    "Korean": ["ko", "kor", "한국어", "조선어"],
+    "Vietnamese": ["vi", "vie", "tiếng việt", "tieng viet"],
+    "Thai": ["th", "tha", "ไทย", "ภาษาไทย"],
+    "Indonesian": ["id", "ind", "bahasa indonesia"],
+    "Malay": ["ms", "msa", "may", "bahasa melayu"],
+    "Filipino": ["fil", "tl", "tgl", "tagalog"],
+    "Swahili": ["sw", "swa", "kiswahili"],
+}
+
+_STOPWORDS = {"in", "please", "language", "the", "i", "want", "would", "like", "to", "use", "prefer", "questions"}
+
+_lock = threading.Lock()
+_cache = OrderedDict()
+_counters = {"alias_hits": 0, "cache_hits": 0, "misses": 0}
+
+
+def normalize(text: str) -> str:
+    """Casefold, strip diacritics and collapse punctuation/whitespace."""
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    stripped = "".join(ch for ch in decomposed if unicodedata.category(ch) != "Mn")
+    return " ".join(re.sub(r"[^\w\s]", " ", stripped).split())
+
+
+def _build_alias_table():
+    table = {}
+    for name, aliases in LANGUAGES.items():
+        for alias in [name, *aliases]:
+            table.setdefault(normalize(alias), name)
+    return table
+
+
+ALIASES = _build_alias_table()
+# Codes are only trusted as the whole input, never as a word inside a sentence
+_WORD_ALIASES = {alias: name for alias, name in ALIASES.items() if len(alias) > 3 or not alias.isascii()}
+
+
+def resolve_local(text: str) -> str | None:
+    """Resolve a language name from the alias table alone."""
+    return _resolve_key(normalize(text))
+
+
+def _resolve_key(key: str) -> str | None:
+    if key in ALIASES:
+        return ALIASES[key]
+
+    words = [word for word in key.split() if word not in _STOPWORDS]
+    found = {_WORD_ALIASES[word] for word in words if word in _WORD_ALIASES}
+    # Two-word names such as "bahasa indonesia"
+    found.update(_WORD_ALIASES[pair] for pair in map(" ".join, zip(words, words[1:])) if pair in _WORD_ALIASES)
+    if len(found) == 1:
+        return found.pop()
+    return None
+
+
+def resolve(text: str) -> str | None:
+    """Resolve from the alias table, then from earlier Groq answers; None on a miss."""
+    key = normalize(text)
+    name = _resolve_key(key)
+    with _lock:
+        if name:
+            _counters["alias_hits"] += 1
+            return name
+        if key in _cache:
+            _cache.move_to_end(key)
+            _counters["cache_hits"] += 1
+            return _cache[key]
+        _counters["misses"] += 1
+    return None
+
+
+def remember(text: str, name: str) -> str:
+    """Cache a Groq answer for ``text`` and return its canonical spelling."""
+    name = resolve_local(name) or name.strip().strip(".").title()
+    key = normalize(text)
+    with _lock:
+        _cache[key] = name
+        _cache.move_to_end(key)
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+    return name
+
+
+def stats() -> dict:
+    """Hit/miss counters; every hit is one Groq call saved."""
+    with _lock:
+        return dict(_counters, cache_size=len(_cache))
@@ -0,0 +1,610 @@
+"""Groq request helpers.
+
+Nothing in here touches ``st.session_state`` or renders UI, so these functions
+can run on background worker threads. Error display and fallbacks stay with the
+callers in app.py. The ``client`` argument of the ``request_*`` helpers is an
+``LLMGateway`` in the app, but any Groq client works. Through a gateway every
+call is also recorded in ``metrics`` under its task and interview ``phase``.
+"""
+
+import email.utils
+import json
+import os
+import random
+import re
+import threading
+import time
+from dataclasses import asdict, dataclass, replace
+
+import httpx
+from groq import APIConnectionError, APIStatusError, Groq, RateLimitError
+
+import breaker
+import metrics
+import prompts
+import router
+
+MODEL = "meta-llama/llama-4-scout-17b-16e-instruct"
+
+
+class GatewayTimeout(Exception):
+    """The call could not finish (or even start) before its deadline."""
+
+
+def _retry_after(error) -> float | None:
+    """Seconds the server asked us to wait, from Retry-After(-ms) headers."""
+    response = getattr(error, "response", None)
+    if response is None:
+        return None
+    headers = response.headers
+    if headers.get("retry-after-ms"):
+        try:
+            return float(headers["retry-after-ms"]) / 1000
+        except ValueError:
+            pass
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        parsed = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None  # malformed header: the normal backoff applies
+    return max(0.0, parsed.timestamp() - time.time()) if parsed else None
+
+
+def _is_retryable(error) -> bool:
+    if isinstance(error, (RateLimitError, APIConnectionError)):  # includes APITimeoutError
+        return True
+    return isinstance(error, APIStatusError) and error.status_code >= 500
+
+
+def _usage_counts(usage) -> tuple:
+    if usage is None:
+        return 0, 0
+    return getattr(usage, "prompt_tokens", 0) or 0, getattr(usage, "completion_tokens", 0) or 0
+
+
+class _ReleasingStream:
+    """Streamed response that gives its concurrency slot back once consumed or dropped.
+
+    It also times the first chunk and picks the token usage Groq attaches to
+    the last chunk, and reports both through ``on_done`` when the stream ends.
+    """
+
+    def __init__(self, stream, release, started: float, on_done):
+        self._stream = stream
+        self._release = release
+        self._started = started
+        self._on_done = on_done
+        self._ttft = None
+        self._usage = None
+        self._outcome = "abandoned"
+
+    def __iter__(self):
+        try:
+            for chunk in self._stream:
+                if self._ttft is None:
+                    self._ttft = time.perf_counter() - self._started
+                x_groq = getattr(chunk, "x_groq", None)
+                usage = getattr(x_groq, "usage", None) or getattr(chunk, "usage", None)
+                if usage is not None:
+                    self._usage = usage
+                yield chunk
+            self._outcome = "ok"
+        except Exception:
+            self._outcome = "error"
+            raise
+        finally:
+            self.close()
+
+    def close(self):
+        if self._release is not None:
+            release, self._release = self._release, None
+            try:
+                self._stream.close()
+            finally:
+                release()
+                self._on_done(self._outcome, self._ttft, self._usage)
+
+    def __del__(self):
+        self.close()
+
+
+class _Call:
+    """One gateway call across its attempts: deadline, routing, breaker and metrics.
+
+    The sync and async gateways only differ in how they wait for a slot, send
+    a request and sleep; everything decided before and after that is here.
+    """
+
+    def __init__(self, gateway, deadline: float | None, task: str, phase: str, kwargs: dict):
+        self.gateway = gateway
+        self.task = task
+        self.phase = phase
+        self.kwargs = kwargs
+        self.started = time.perf_counter()
+        self.expires = time.monotonic() + (deadline or gateway.timeout)
+        self.attempt = 0
+        self.tier, self.alternates, self.route = gateway._plan(task, kwargs)
+        if not gateway._admit():
+            self.done("error", error="CircuitOpen")
+            raise breaker.CircuitOpen("Groq API is failing; call refused while the circuit is open")
+
+    def remaining(self) -> float:
+        return self.expires - time.monotonic()
+
+    def request_timeout(self) -> float:
+        return max(self.remaining(), 0.1)
+
+    def done(self, outcome, ttft=None, usage=None, error=None):
+        prompt_tokens, completion_tokens = _usage_counts(usage)
+        model = self.kwargs.get("model", "-")
+        metrics.record_call(self.task, self.phase, model, outcome, time.perf_counter() - self.started, ttft,
+                            prompt_tokens, completion_tokens, self.attempt + 1, error, self.tier, self.route)
+        self.gateway._observe(model, self.tier, outcome, ttft, completion_tokens, bool(self.kwargs.get("stream")))
+
+    def slot_timeout(self) -> "GatewayTimeout":
+        """Record a deadline that passed while waiting for a free slot; returns the error to raise.
+
+        Nothing was sent, so this is our own congestion, not an API failure for the breaker.
+        """
+        self.done("error", error="GatewayTimeout")
+        self.gateway._settle(failed=None)
+        return GatewayTimeout("LLM call deadline exceeded while waiting for a free slot")
+
+    def retry_delay(self, error) -> float | None:
+        """Seconds to wait before the next attempt after ``error`` (0 on failover), or None to give up."""
+        gateway = self.gateway
+        failover = gateway._failover(error, self.kwargs, self.alternates)
+        if failover:
+            self.route = failover
+            self.attempt += 1
+            return 0.0
+        if not _is_retryable(error) or self.attempt >= gateway.max_retries:
+            self.done("error", error=type(error).__name__)
+            gateway._settle(failed=_is_retryable(error))
+            return None
+        delay = gateway._backoff(self.attempt, error)
+        if time.monotonic() + delay >= self.expires:
+            self.done("error", error=type(error).__name__)
+            gateway._settle(failed=True)
+            return None
+        self.attempt += 1
+        return delay
+
+    def respond(self, response, release, stream_cls):
+        """Settle a successful attempt; streams keep their slot until read."""
+        self.gateway._settle(failed=False)
+        if self.kwargs.get("stream"):
+            return stream_cls(response, release, self.started, self.done)
+        release()
+        self.done("ok", time.perf_counter() - self.started, getattr(response, "usage", None))
+        return response
+
+
+class LLMGateway:
+    """One Groq client per process with deadlines, retries and a concurrency cap.
+
+    Exposes ``chat.completions.create`` so it can be passed anywhere a Groq
+    client is expected. Retryable failures (429, 5xx, connection errors and
+    timeouts) are retried with jittered exponential backoff that honors
+    Retry-After, all within one per-call deadline. A semaphore caps in-flight
+    requests across every session sharing the gateway; a streamed response
+    holds its slot until it has been read.
+
+    With a ``router`` (``router.ModelRouter``) the model is picked per task,
+    and a failed call moves straight on to the tier's next model. With a
+    ``breaker`` (``breaker.CircuitBreaker``) calls fail fast with
+    ``breaker.CircuitOpen`` while the API keeps failing.
+    """
+
+    def __init__(self, api_key: str | None = None, base_url: str | None = None, timeout: float = 30.0,
+                 max_retries: int = 3, max_inflight: int = 16, backoff_base: float = 0.5, backoff_cap: float = 8.0,
+                 router: "router.ModelRouter | None" = None, breaker: "breaker.CircuitBreaker | None" = None):
+        self.timeout = timeout
+        self.router = router
+        self.breaker = breaker
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self._connect(api_key, base_url, timeout, max_inflight)
+        self.chat = self
+        self.completions = self
+
+    def _connect(self, api_key, base_url, timeout: float, max_inflight: int):
+        """Create the in-flight cap, the HTTP client and the Groq client."""
+        self._slots = threading.BoundedSemaphore(max_inflight)
+        # Keep-alive connections are reused by every session and worker thread
+        self.http_client = httpx.Client(
+            limits=httpx.Limits(max_connections=max_inflight, max_keepalive_connections=max_inflight),
+            timeout=timeout,
+        )
+        self.client = Groq(api_key=api_key, base_url=base_url, http_client=self.http_client, max_retries=0, timeout=timeout)
+
+    @classmethod
+    def from_env(cls):
+        return cls(
+            api_key=os.getenv("GROQ_API_KEY"),
+            base_url=os.getenv("GROQ_BASE_URL") or None,
+            timeout=float(os.getenv("TALENTSCOUT_LLM_TIMEOUT", "30")),
+            max_retries=int(os.getenv("TALENTSCOUT_LLM_RETRIES", "3")),
+            max_inflight=int(os.getenv("TALENTSCOUT_LLM_MAX_INFLIGHT", "16")),
+            router=router.ModelRouter.from_env(),
+            breaker=breaker.CircuitBreaker.from_env(),
+        )
+
+    def _backoff(self, attempt: int, error) -> float:
+        delay = random.uniform(0, min(self.backoff_cap, self.backoff_base * 2 ** attempt))
+        retry_after = _retry_after(error)
+        return max(delay, retry_after) if retry_after is not None else delay
+
+    def _plan(self, task: str, kwargs: dict) -> tuple:
+        """Pick the model for this call; returns (tier, alternates left, route)."""
+        if self.router is None:
+            return "-", [], "-"
+        tier, models, route = self.router.plan(task, kwargs.get("model", "-"))
+        kwargs["model"] = models[0]
+        return tier, models[1:], route
+
+    def _failover(self, error, kwargs: dict, alternates: list) -> str | None:
+        """Cool the failed model down and switch ``kwargs`` to the next one; returns the new route."""
+        if self.router is None or not _is_retryable(error):
+            return None
+        reason = "rate_limited" if isinstance(error, RateLimitError) else "error"
+        self.router.mark_down(kwargs["model"], reason, _retry_after(error))
+        if not alternates:
+            return None
+        kwargs["model"] = alternates.pop(0)
+        return "failover_" + reason
+
+    def _admit(self) -> bool:
+        return self.breaker is None or self.breaker.allow()
+
+    def _settle(self, failed: bool | None):
+        """Tell the breaker how a call that was let through ended; None if it was never sent."""
+        if self.breaker is not None:
+            if failed is None:
+                self.breaker.release()
+            elif failed:
+                self.breaker.failure()
+            else:
+                self.breaker.success()
+
+    def _observe(self, model: str, tier: str, outcome: str, latency: float | None, completion_tokens: int,
+                 streamed: bool):
+        if self.router is not None and outcome == "ok" and latency is not None:
+            self.router.observe(model, tier, latency, completion_tokens, streamed)
+
+    def create(self, *, deadline: float | None = None, task: str = "-", phase: str = "-", **kwargs):
+        """``chat.completions.create`` with retries inside a per-call deadline (seconds).
+
+        ``task`` labels the call in ``metrics`` and picks its model tier when
+        routing; ``phase`` is only a label.
+        """
+        call = _Call(self, deadline, task, phase, kwargs)
+        while True:
+            remaining = call.remaining()
+            if remaining <= 0 or not self._slots.acquire(timeout=remaining):
+                raise call.slot_timeout()
+            try:
+                response = self.client.chat.completions.create(timeout=call.request_timeout(), **kwargs)
+            except Exception as error:
+                self._slots.release()
+                delay = call.retry_delay(error)
+                if delay is None:
+                    raise
+                if delay:
+                    time.sleep(delay)
+                continue
+            return call.respond(response, self._slots.release, _ReleasingStream)
+
+
+def _create(client, task: str, phase: str, **kwargs):
+    """Send one chat completion, labelling it for metrics when ``client`` is a gateway."""
+    if isinstance(client, LLMGateway):
+        return client.create(task=task, phase=phase, **kwargs)
+    return client.chat.completions.create(**kwargs)
+
+
+def parse_question_batch(text: str, count: int) -> list:
+    """Parse a batch response into ``count`` slots; unusable slots are None."""
+    questions = []
+    match = re.search(r"[\[{].*[\]}]", text or "", re.DOTALL)
+    if match:
+        try:
+            data = json.loads(match.group(0))
+        except ValueError:
+            data = None
+        if isinstance(data, dict):
+            data = data.get("questions")
+        if isinstance(data, list):
+            questions = data
+    
+    slots = []
+    for i in range(count):
+        item = questions[i] if i < len(questions) else None
+        if isinstance(item, dict):
+            item = item.get("question")
+        slots.append(item.strip() if isinstance(item, str) and item.strip() else None)
+    return slots
+
+
+SCORE_KEYS = ("technical_accuracy", "completeness", "clarity", "correctness")
+SCORE_LABELS = ("Technical accuracy", "Completeness", "Clarity", "Correctness")
+
+
+@dataclass(slots=True, frozen=True)
+class Evaluation:
+    """Parsed structured evaluation: four 0-10 scores and the feedback text."""
+    question_number: int
+    technical_accuracy: int
+    completeness: int
+    clarity: int
+    correctness: int
+    feedback: str
+    model: str | None = None  # the model that answered; routing may pick another than MODEL
+
+    @property
+    def scores(self) -> tuple:
+        return (self.technical_accuracy, self.completeness, self.clarity, self.correctness)
+
+    def to_row(self) -> dict:
+        """Flat dict, e.g. for ``pandas.DataFrame(e.to_row() for e in evaluations)``."""
+        return asdict(self)
+
+    def to_markdown(self) -> str:
+        lines = [f"{label}: {score}/10  " for label, score in zip(SCORE_LABELS, self.scores)]
+        return "\n".join(lines) + (f"\n\n{self.feedback}" if self.feedback else "")
+
+
+def _score(value) -> int | None:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, str):
+        value = value.strip().split("/")[0]
+        try:
+            value = float(value)
+        except ValueError:
+            return None
+    if isinstance(value, (int, float)) and 0 <= value <= 10:
+        return round(value)
+    return None
+
+
+def parse_evaluation(text: str, question_number: int) -> Evaluation | None:
+    """Parse a JSON-mode evaluation; None if any score is missing or out of range."""
+    match = re.search(r"\{.*\}", text or "", re.DOTALL)
+    if not match:
+        return None
+    try:
+        data = json.loads(match.group(0))
+    except ValueError:
+        return None
+    if not isinstance(data, dict):
+        return None
+    scores = [_score(data.get(key)) for key in SCORE_KEYS]
+    if None in scores:
+        return None
+    feedback = data.get("feedback")
+    return Evaluation(question_number, *scores, feedback.strip() if isinstance(feedback, str) else "")
+
+
+_TEXT_SCORE = re.compile(r"(\d+(?:\.\d+)?)\s*/\s*10\b")
+
+
+def parse_text_scores(text: str) -> tuple | None:
+    """The "n/10" scores of a free-text evaluation, in order (at most four), or None if there are none."""
+    scores = tuple(score for score in map(_score, _TEXT_SCORE.findall(text or "")[:4]) if score is not None)
+    return scores or None
+
+
+def parse_translations(text: str) -> dict:
+    """{id: translation} from a batch translation response; empty if unusable."""
+    match = re.search(r"\{.*\}", text or "", re.DOTALL)
+    try:
+        data = json.loads(match.group(0)) if match else {}
+    except ValueError:
+        data = {}
+    return {key: value for key, value in data.items() if isinstance(value, str)} if isinstance(data, dict) else {}
+
+
+def parse_consent(text: str) -> bool | None:
+    """True/False for a yes/no verdict, None for unclear or anything else."""
+    word = (text or "").strip().strip(".!\"'").lower()
+    return {"yes": True, "no": False}.get(word)
+
+
+def parse_tech_list(text: str) -> list:
+    """Technologies from a tech-stack extraction response; empty if unusable."""
+    match = re.search(r"\{.*\}", text or "", re.DOTALL)
+    try:
+        data = json.loads(match.group(0)) if match else {}
+    except ValueError:
+        data = {}
+    items = data.get("technologies") if isinstance(data, dict) else None
+    if not isinstance(items, list):
+        return []
+    return list(dict.fromkeys(item.strip() for item in items if isinstance(item, str) and item.strip()))
+
+
+# Request specs: the chat.completions.create arguments for each task. The sync
+# helpers below and their async twins in async_llm.py share them.
+def language_request(user_input: str) -> dict:
+    return dict(
+        model=MODEL,
+        messages=prompts.LANGUAGE.messages(user_input=user_input),
+        temperature=0.1,
+        max_completion_tokens=20,
+        top_p=1,
+        stream=False,
+    )
+
+
+def consent_request(user_input: str) -> dict:
+    return dict(
+        model=MODEL,
+        messages=prompts.CONSENT.messages(user_input=user_input),
+        temperature=0,
+        max_completion_tokens=3,
+        top_p=1,
+        stream=False,
+    )
+
+
+def tech_stack_request(user_input: str) -> dict:
+    return dict(
+        model=MODEL,
+        messages=prompts.TECH_STACK.messages(user_input=user_input),
+        temperature=0,
+        max_completion_tokens=120,
+        top_p=1,
+        response_format={"type": "json_object"},
+        stream=False,
+    )
+
+
+def question_request(tech_stack: list, experience, position: str, user_language: str, stream: bool = False) -> dict:
+    return dict(
+        model=MODEL,
+        messages=prompts.QUESTION.messages(
+            tech_stack=tech_stack, experience=experience, position=position, user_language=user_language,
+        ),
+        temperature=0.8,
+        max_completion_tokens=512,
+        top_p=1,
+        stream=stream,
+    )
+
+
+def question_batch_request(tech_stack: list, experience, position: str, user_language: str, count: int) -> dict:
+    return dict(
+        model=MODEL,
+        messages=prompts.QUESTION_BATCH.messages(
+            tech_stack=tech_stack, experience=experience, position=position, user_language=user_language, count=count,
+        ),
+        temperature=0.8,
+        max_completion_tokens=min(512 * count, 4096),
+        top_p=1,
+        response_format={"type": "json_object"},
+        stream=False,
+    )
+
+
+def translation_request(strings: dict, user_language: str) -> dict:
+    return dict(
+        model=MODEL,
+        messages=prompts.TRANSLATION.messages(
+            strings=json.dumps(strings, ensure_ascii=False), user_language=user_language,
+        ),
+        temperature=0.2,
+        max_completion_tokens=4096,
+        response_format={"type": "json_object"},
+        stream=False,
+    )
+
+
+def structured_evaluation_request(question: str, answer: str, tech_context: str, user_language: str) -> dict:
+    return dict(
+        model=MODEL,
+        messages=prompts.EVALUATION_JSON.messages(
+            question=question, answer=answer, tech_context=tech_context, user_language=user_language,
+        ),
+        temperature=0.3,
+        max_completion_tokens=512,
+        top_p=1,
+        response_format={"type": "json_object"},
+        stream=False,
+    )
+
+
+def evaluation_request(question: str, answer: str, tech_context: str, user_language: str, stream: bool = False) -> dict:
+    return dict(
+        model=MODEL,
+        messages=prompts.EVALUATION.messages(
+            question=question, answer=answer, tech_context=tech_context, user_language=user_language,
+        ),
+        temperature=0.3,
+        max_completion_tokens=512,
+        top_p=1,
+        stream=stream,
+    )
+
+
+def request_language(client, user_input: str, phase: str = "-") -> str:
+    """Ask Groq which language the user asked for. Raises on API errors."""
+    response = _create(client, "language", phase, **language_request(user_input))
+    return response.choices[0].message.content.strip()
+
+
+def request_consent(client, user_input: str, phase: str = "-") -> bool | None:
+    """Ask Groq whether an ambiguous consent reply means yes (True) or no (False). Raises on API errors."""
+    response = _create(client, "consent", phase, **consent_request(user_input))
+    return parse_consent(response.choices[0].message.content)
+
+
+def request_tech_stack(client, user_input: str, phase: str = "-") -> list:
+    """Ask Groq for the technologies in free-text input. Raises on API errors."""
+    response = _create(client, "tech_stack", phase, **tech_stack_request(user_input))
+    return parse_tech_list(response.choices[0].message.content)
+
+
+def request_question(client, tech_stack: list, experience, position: str, user_language: str, stream: bool = False, phase: str = "-"):
+    """Generate one technical question. Raises on API errors.
+
+    With ``stream=True`` the raw streamed response is returned.
+    """
+    response = _create(client, "question", phase, **question_request(tech_stack, experience, position, user_language, stream))
+    if stream:
+        return response
+    return response.choices[0].message.content.strip()
+
+
+def request_question_batch(client, tech_stack: list, experience, position: str, user_language: str, count: int, phase: str = "-") -> list:
+    """Generate ``count`` questions in one call. Raises on API errors.
+
+    Returns one slot per question; slots the model got wrong are None so the
+    caller can fall back to per-question generation for just those.
+    """
+    response = _create(
+        client, "question_batch", phase, **question_batch_request(tech_stack, experience, position, user_language, count),
+    )
+    return parse_question_batch(response.choices[0].message.content, count)
+
+
+def request_translation(client, strings: dict, user_language: str, phase: str = "-") -> dict:
+    """Translate {id: text} in one call; returns {id: translation}. Raises on API errors."""
+    response = _create(client, "translation", phase, **translation_request(strings, user_language))
+    return parse_translations(response.choices[0].message.content)
+
+
+def request_structured_evaluation(client, question: str, answer: str, tech_context: str, user_language: str,
+                                  question_number: int, retries: int = 1, phase: str = "-") -> Evaluation:
+    """Evaluate one answer in JSON mode. Raises on API errors.
+
+    Malformed output is asked for again up to ``retries`` times before
+    ``ValueError`` is raised.
+    """
+    request = structured_evaluation_request(question, answer, tech_context, user_language)
+    for _ in range(retries + 1):
+        response = _create(client, "evaluation", phase, **request)
+        evaluation = parse_evaluation(response.choices[0].message.content, question_number)
+        if evaluation is not None:
+            return replace(evaluation, model=getattr(response, "model", None) or request["model"])
+    raise ValueError("Model returned a malformed evaluation")
+
+
+def request_evaluation(client, question: str, answer: str, tech_context: str, user_language: str, stream: bool = False, phase: str = "-"):
+    """Evaluate one answer. Raises on API errors.
+
+    With ``stream=True`` the raw streamed response is returned.
+    """
+    response = _create(
+        client, "evaluation", phase, **evaluation_request(question, answer, tech_context, user_language, stream),
+    )
+    if stream:
+        return response
+    return response.choices[0].message.content.strip()
@@ -0,0 +1,267 @@
+"""Per-call LLM instrumentation.
+
+``LLMGateway`` reports every call here with its task, interview phase, model,
+wall time, time to first token, token usage and outcome, plus the model tier
+and route when ``router`` picked the model. The data goes to:
+
+- process-wide Prometheus-style counters and histograms, served as text on
+  ``TALENTSCOUT_METRICS_PORT`` when set,
+- an optional JSONL trace file (``TALENTSCOUT_TRACE_FILE``), one line per call,
+- small in-memory summaries per task and per tier and model, which app.py
+  shows in the operator sidebar panel.
+
+``eval_queue`` also reports the background evaluation queue's depth, job
+outcomes and lag here.
+"""
+
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+TRACE_FILE = os.getenv("TALENTSCOUT_TRACE_FILE")
+METRICS_PORT = os.getenv("TALENTSCOUT_METRICS_PORT")
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# USD per million (prompt, completion) tokens
+MODEL_PRICES = {
+    "meta-llama/llama-4-scout-17b-16e-instruct": (0.11, 0.34),
+    "llama-3.1-8b-instant": (0.05, 0.08),
+    "llama-3.3-70b-versatile": (0.59, 0.79),
+}
+
+
+def call_cost(model: str, prompt_tokens: int, completion_tokens: int) -> float:
+    prompt_price, completion_price = MODEL_PRICES.get(model, (0.0, 0.0))
+    return (prompt_tokens * prompt_price + completion_tokens * completion_price) / 1_000_000
+
+
+def _label_str(labels: tuple, values: tuple) -> str:
+    return ",".join(f'{name}="{value}"' for name, value in zip(labels, values))
+
+
+class Counter:
+    def __init__(self, name: str, help: str, labels: tuple = ()):
+        self.name, self.help, self.labels = name, help, labels
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values, amount: float = 1.0):
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0.0) + amount
+
+    def value(self, *label_values) -> float:
+        with self._lock:
+            return self._values.get(label_values, 0.0)
+
+    def render(self) -> list:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for values, total in sorted(self._values.items()):
+                lines.append(f"{self.name}{{{_label_str(self.labels, values)}}} {total:g}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name: str, help: str, labels: tuple = (), buckets: tuple = LATENCY_BUCKETS):
+        self.name, self.help, self.labels, self.buckets = name, help, labels, buckets
+        self._series = {}  # label values -> [bucket counts..., count, sum]
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values):
+        with self._lock:
+            series = self._series.setdefault(label_values, [0] * len(self.buckets) + [0, 0.0])
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[i] += 1
+            series[-2] += 1
+            series[-1] += value
+
+    def render(self) -> list:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for values, series in sorted(self._series.items()):
+                labels = _label_str(self.labels, values)
+                sep = "," if labels else ""
+                for bound, count in zip(self.buckets, series):
+                    lines.append(f'{self.name}_bucket{{{labels}{sep}le="{bound:g}"}} {count}')
+                lines.append(f'{self.name}_bucket{{{labels}{sep}le="+Inf"}} {series[-2]}')
+                lines.append(f"{self.name}_count{{{labels}}} {series[-2]}")
+                lines.append(f"{self.name}_sum{{{labels}}} {series[-1]:g}")
+        return lines
+
+
+class Gauge:
+    def __init__(self, name: str, help: str, labels: tuple = ()):
+        self.name, self.help, self.labels = name, help, labels
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def set(self, value: float, *label_values):
+        with self._lock:
+            self._values[label_values] = value
+
+    def render(self) -> list:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} gauge"]
+        with self._lock:
+            for values, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{{{_label_str(self.labels, values)}}} {value:g}")
+        return lines
+
+
+CALLS = Counter("talentscout_llm_calls_total", "LLM calls by task, phase, model and outcome.", ("task", "phase", "model", "outcome"))
+RETRIES = Counter("talentscout_llm_retries_total", "Retried LLM attempts.", ("task", "model"))
+TOKENS = Counter("talentscout_llm_tokens_total", "Tokens used by LLM calls.", ("task", "model", "kind"))
+COST = Counter("talentscout_llm_cost_usd_total", "Estimated LLM spend in USD.", ("task", "model"))
+WALL = Histogram("talentscout_llm_wall_seconds", "Wall time of LLM calls including retries.", ("task", "model"))
+TTFT = Histogram("talentscout_llm_ttft_seconds", "Time to first token of LLM calls.", ("task", "model"))
+ROUTES = Counter("talentscout_llm_routes_total", "Routed LLM calls by task, tier, model and route.",
+                 ("task", "tier", "model", "route"))
+
+EVAL_QUEUE_DEPTH = Gauge("talentscout_eval_queue_depth", "Answers queued or being evaluated in the background.",
+                         ("backend",))
+EVAL_QUEUE_JOBS = Counter("talentscout_eval_queue_jobs_total", "Background evaluations by outcome.",
+                          ("backend", "outcome"))
+EVAL_QUEUE_LAG = Histogram("talentscout_eval_queue_lag_seconds",
+                           "Seconds from queueing an answer until its evaluation starts (wait) or finishes (result).",
+                           ("stage",), buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 300.0))
+
+REGISTRY = [CALLS, RETRIES, TOKENS, COST, WALL, TTFT, ROUTES, EVAL_QUEUE_DEPTH, EVAL_QUEUE_JOBS, EVAL_QUEUE_LAG]
+
+_summary_lock = threading.Lock()
+_summary = {}  # task -> aggregate row for the operator panel
+_tiers = {}  # (tier, model) -> aggregate row for the operator panel
+_trace_lock = threading.Lock()
+
+
+def _write_trace(record: dict):
+    if not TRACE_FILE:
+        return
+    line = json.dumps(record, ensure_ascii=False)
+    with _trace_lock, open(TRACE_FILE, "a", encoding="utf-8") as trace:
+        trace.write(line + "\n")
+
+
+def record_call(task: str, phase: str, model: str, outcome: str, wall: float, ttft: float | None = None,
+                prompt_tokens: int = 0, completion_tokens: int = 0, attempts: int = 1, error: str | None = None,
+                tier: str = "-", route: str = "-"):
+    """Record one finished LLM call (``outcome`` is "ok" or "error")."""
+    cost = call_cost(model, prompt_tokens, completion_tokens)
+    CALLS.inc(task, phase, model, outcome)
+    if tier != "-":
+        ROUTES.inc(task, tier, model, route)
+    if attempts > 1:
+        RETRIES.inc(task, model, amount=attempts - 1)
+    TOKENS.inc(task, model, "prompt", amount=prompt_tokens)
+    TOKENS.inc(task, model, "completion", amount=completion_tokens)
+    COST.inc(task, model, amount=cost)
+    WALL.observe(wall, task, model)
+    if ttft is not None:
+        TTFT.observe(ttft, task, model)
+
+    with _summary_lock:
+        row = _summary.setdefault(task, {
+            "task": task, "calls": 0, "errors": 0, "fallbacks": 0, "wall_s": 0.0, "ttft_s": 0.0,
+            "prompt_tokens": 0, "completion_tokens": 0, "cost_usd": 0.0,
+        })
+        row["calls"] += 1
+        row["errors"] += outcome == "error"
+        row["wall_s"] += wall
+        row["ttft_s"] += ttft if ttft is not None else wall
+        row["prompt_tokens"] += prompt_tokens
+        row["completion_tokens"] += completion_tokens
+        row["cost_usd"] += cost
+        if tier != "-":
+            row = _tiers.setdefault((tier, model), {
+                "tier": tier, "model": model, "calls": 0, "errors": 0, "failovers": 0, "ttft_s": 0.0,
+                "cost_usd": 0.0,
+            })
+            row["calls"] += 1
+            row["errors"] += outcome == "error"
+            row["failovers"] += route.startswith("failover")
+            row["ttft_s"] += ttft if ttft is not None else wall
+            row["cost_usd"] += cost
+
+    _write_trace({
+        "ts": time.time(), "task": task, "phase": phase, "model": model, "outcome": outcome,
+        "wall_s": round(wall, 4), "ttft_s": round(ttft, 4) if ttft is not None else None,
+        "prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens,
+        "attempts": attempts, "cost_usd": cost, "error": error, "tier": tier, "route": route,
+    })
+
+
+def record_fallback(task: str, phase: str):
+    """A caller served its fallback text because the LLM call failed."""
+    CALLS.inc(task, phase, "-", "fallback")
+    with _summary_lock:
+        row = _summary.setdefault(task, {
+            "task": task, "calls": 0, "errors": 0, "fallbacks": 0, "wall_s": 0.0, "ttft_s": 0.0,
+            "prompt_tokens": 0, "completion_tokens": 0, "cost_usd": 0.0,
+        })
+        row["fallbacks"] += 1
+    _write_trace({"ts": time.time(), "task": task, "phase": phase, "outcome": "fallback"})
+
+
+def summary() -> list:
+    """Per-task rows with mean latencies, for the sidebar panel."""
+    with _summary_lock:
+        rows = []
+        for row in _summary.values():
+            calls = row["calls"] or 1
+            rows.append({
+                "task": row["task"], "calls": row["calls"], "errors": row["errors"], "fallbacks": row["fallbacks"],
+                "mean wall (s)": round(row["wall_s"] / calls, 3), "mean ttft (s)": round(row["ttft_s"] / calls, 3),
+                "prompt tok": row["prompt_tokens"], "completion tok": row["completion_tokens"],
+                "cost ($)": round(row["cost_usd"], 5),
+            })
+        return rows
+
+
+def tier_summary() -> list:
+    """Per tier and model rows of routed calls, to compare latency and cost."""
+    with _summary_lock:
+        return [
+            {
+                "tier": row["tier"], "model": row["model"], "calls": row["calls"], "errors": row["errors"],
+                "failovers": row["failovers"], "mean ttft (s)": round(row["ttft_s"] / (row["calls"] or 1), 3),
+                "cost ($)": round(row["cost_usd"], 5),
+                "cost/call ($)": round(row["cost_usd"] / (row["calls"] or 1), 7),
+            }
+            for row in sorted(_tiers.values(), key=lambda row: (row["tier"], -row["calls"]))
+        ]
+
+
+def render_prometheus() -> str:
+    return "\n".join(line for metric in REGISTRY for line in metric.render()) + "\n"
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        body = render_prometheus().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+_server = None
+_server_lock = threading.Lock()
+
+
+def serve(port: int | str | None = METRICS_PORT, host: str = "127.0.0.1"):
+    """Expose the metrics on ``http://host:port/metrics`` once per process."""
+    global _server
+    if not port:
+        return None
+    with _server_lock:
+        if _server is None:
+            _server = ThreadingHTTPServer((host, int(port)), _MetricsHandler)
+            _server.daemon_threads = True
+            threading.Thread(target=_server.serve_forever, name="metrics", daemon=True).start()
+    return _server
@@ -0,0 +1,182 @@
+"""Prompt templates for every Groq call.
+
+Each template is a fixed system message plus a short user message holding only
+the variable fields, longest field last. The system message is byte-for-byte
+identical across calls, so providers that cache prompt prefixes can reuse it,
+and the per-call part stays small. Every field has a token budget: oversized
+answers, tech stacks and similar free text are trimmed before sending.
+
+Token counts are estimated at ~4 characters per token; no tokenizer is needed.
+"""
+
+from dataclasses import dataclass, field
+
+ELLIPSIS = " […]"
+
+
+def count_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token)."""
+    return max(1, len(text) // 4) if text else 0
+
+
+def truncate(text: str, max_tokens: int) -> str:
+    """Cut ``text`` to roughly ``max_tokens`` at a word boundary."""
+    text = str(text)
+    if count_tokens(text) <= max_tokens:
+        return text
+    cut = text[:max(0, max_tokens * 4 - len(ELLIPSIS))]
+    if " " in cut:
+        cut = cut.rsplit(" ", 1)[0]
+    return cut.rstrip() + ELLIPSIS
+
+
+def truncate_list(items: list, max_tokens: int) -> str:
+    """Join as many whole items as fit in ``max_tokens``."""
+    kept, used = [], 0
+    for item in items:
+        cost = count_tokens(f"{item}, ")
+        if kept and used + cost > max_tokens:
+            kept.append("…")
+            break
+        kept.append(truncate(item, max_tokens))
+        used += cost
+    return ", ".join(kept)
+
+
+@dataclass(frozen=True, slots=True)
+class PromptTemplate:
+    name: str
+    system: str
+    user: str  # str.format template with the variable fields
+    budgets: dict = field(default_factory=dict)  # field -> max tokens
+
+    def fields(self, **values) -> dict:
+        """Apply the budgets; list values are joined with commas."""
+        fitted = {}
+        for name, value in values.items():
+            budget = self.budgets.get(name)
+            if isinstance(value, (list, tuple)):
+                value = truncate_list(value, budget) if budget else ", ".join(map(str, value))
+            elif budget:
+                value = truncate(value, budget)
+            fitted[name] = value
+        return fitted
+
+    def messages(self, **values) -> list:
+        return [
+            {"role": "system", "content": self.system},
+            {"role": "user", "content": self.user.format(**self.fields(**values))},
+        ]
+
+
+LANGUAGE = PromptTemplate(
+    "language",
+    system=(
+        "You identify which language a user wants to use for interview questions. "
+        "Reply with only the language name in English.\n\n"
+        "Examples:\n"
+        '- "Spanish" or "Español" → Spanish\n'
+        '- "Hindi" or "हिंदी" → Hindi\n'
+        '- "French" or "Français" → French\n'
+        '- "German" or "Deutsch" → German\n'
+        '- "Chinese" or "中文" → Chinese\n'
+        "- If unclear → English"
+    ),
+    user='The user said: "{user_input}"',
+    budgets={"user_input": 50},
+)
+
+CONSENT = PromptTemplate(
+    "consent",
+    system=(
+        "A candidate was asked whether they consent to their data being processed for this interview. "
+        "Decide whether their reply, in any language, means yes or no. "
+        "Reply with only yes, no or unclear."
+    ),
+    user='The candidate replied: "{user_input}"',
+    budgets={"user_input": 60},
+)
+
+TECH_STACK = PromptTemplate(
+    "tech_stack",
+    system=(
+        "List the programming languages, frameworks, databases and tools named or clearly implied in the "
+        "candidate's text, using their usual names. Return only a JSON object of the form "
+        '{"technologies": ["..."]}, with an empty list if there are none.'
+    ),
+    user="Text: {user_input}",
+    budgets={"user_input": 150},
+)
+
+QUESTION = PromptTemplate(
+    "question",
+    system=(
+        "You are a technical interviewer. Write 1 practical, real-world technical interview question "
+        "for the given role, technologies and level, answerable in one short line. Return only the "
+        "question without formatting, strictly in the requested language."
+    ),
+    user="Language: {user_language}\nLevel: {experience}/20\nRole: {position}\nTechnologies: {tech_stack}",
+    budgets={"user_language": 10, "experience": 10, "position": 30, "tech_stack": 80},
+)
+
+QUESTION_BATCH = PromptTemplate(
+    "question_batch",
+    system=(
+        "You are a technical interviewer. Write the requested number of different practical, "
+        "real-world technical interview questions for the given role, technologies and level, each "
+        "answerable in one short line, strictly in the requested language. "
+        'Return only a JSON object {"questions": ["question 1", "question 2", ...]} '
+        "with exactly that many plain-text questions."
+    ),
+    user="Number of questions: {count}\nLanguage: {user_language}\nLevel: {experience}/20\n"
+         "Role: {position}\nTechnologies: {tech_stack}",
+    budgets={"user_language": 10, "experience": 10, "position": 30, "tech_stack": 80},
+)
+
+_EVALUATION_ROLE = (
+    "You are an expert technical interviewer evaluating a candidate's response. "
+    "Your role is strictly limited to technical interview evaluation. "
+    "Stay focused on evaluating technical competency. "
+)
+
+EVALUATION = PromptTemplate(
+    "evaluation",
+    system=(
+        _EVALUATION_ROLE
+        + "Provide a brief evaluation covering:\n"
+        "1. Technical accuracy (0-10)\n"
+        "2. Completeness (0-10)\n"
+        "3. Clarity of explanation (0-10)\n"
+        "4. Correctness of explanation (0-10)\n"
+        "5. Brief constructive feedback\n"
+        "Keep the response concise and professional. "
+        "Strictly write the evaluation in the requested language."
+    ),
+    user="Language: {user_language}\nTechnology context: {tech_context}\nQuestion: {question}\n"
+         "Candidate's answer: {answer}",
+    budgets={"user_language": 10, "tech_context": 80, "question": 200, "answer": 600},
+)
+
+EVALUATION_JSON = PromptTemplate(
+    "evaluation_json",
+    system=(
+        _EVALUATION_ROLE
+        + "Score the answer with integers from 0 to 10 and give brief constructive feedback. "
+        "Return only a JSON object of the form "
+        '{"technical_accuracy": 0, "completeness": 0, "clarity": 0, "correctness": 0, "feedback": "..."} '
+        "with no additional text. Strictly write the feedback in the requested language."
+    ),
+    user=EVALUATION.user,
+    budgets=EVALUATION.budgets,
+)
+
+TRANSLATION = PromptTemplate(
+    "translation",
+    system=(
+        "Translate every value of the JSON object into the requested language for a job candidate. "
+        "Keep the keys, Markdown, emoji and {placeholders} in braces exactly as they are. "
+        "Return only the JSON object."
+    ),
+    user="Language: {user_language}\nStrings: {strings}",
+    budgets={"user_language": 10},  # the catalog is sent whole
+)
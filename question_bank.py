@@ -0,0 +1,179 @@
+"""Process-wide bank of generated questions shared between sessions.
+
+Questions are grouped by a normalized (position, tech stack, level, language)
+key. Buckets are evicted least-recently-used once ``max_keys`` is reached and
+individual questions expire after ``ttl`` seconds. With a ``db_path`` the bank
+is also written through to SQLite so it survives restarts.
+
+With ``dedup_threshold`` set, each bucket keeps only canonical questions: a
+new question that paraphrases one already banked under the same key is
+dropped, and ``draw`` skips near-duplicates of the questions in ``exclude``.
+"""
+
+import random
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+import dedup
+
+
+def experience_level(experience) -> str:
+    """Bucket free-text experience ("3", "5 years", "10+") into a level."""
+    match = re.search(r"\d+(\.\d+)?", str(experience or ""))
+    if not match:
+        return " ".join(str(experience or "").casefold().split()) or "unknown"
+    years = float(match.group(0))
+    if years < 2:
+        return "junior"
+    if years < 6:
+        return "mid"
+    return "senior"
+
+
+def make_key(position: str, tech_stack: list, experience, user_language: str, level: str | None = None) -> tuple:
+    """Bank key; ``level`` overrides the level bucketed from ``experience``."""
+    return (
+        " ".join((position or "").casefold().split()),
+        tuple(sorted({t.strip().casefold() for t in tech_stack if t.strip()})),
+        level or experience_level(experience),
+        (user_language or "English").strip().casefold(),
+    )
+
+
+def _key_str(key: tuple) -> str:
+    position, stack, level, lang = key
+    return "|".join([position, ",".join(stack), level, lang])
+
+
+class QuestionBank:
+    def __init__(self, max_keys: int = 512, max_per_key: int = 50, ttl: float = 7 * 24 * 3600,
+                 low_water: int = 5, db_path: str | None = None, dedup_threshold: float | None = None):
+        self.max_keys = max_keys
+        self.max_per_key = max_per_key
+        self.ttl = ttl
+        self.low_water = low_water
+        self._lock = threading.Lock()
+        self._buckets = OrderedDict()  # key -> {question: created_at}
+        self._refilling = set()
+        self._dedup = dedup.DedupIndex(dedup_threshold) if dedup_threshold else None
+        self._counters = {
+            "hits": 0, "misses": 0, "added": 0, "duplicates": 0, "top_ups": 0, "evicted_keys": 0, "expired": 0,
+        }
+        self._db = None
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS questions ("
+                "bank_key TEXT NOT NULL, question TEXT NOT NULL, created REAL NOT NULL, "
+                "PRIMARY KEY (bank_key, question))"
+            )
+            self._db.commit()
+
+    def _bucket(self, key: tuple) -> dict:
+        """Return the live bucket for ``key``, loading it from SQLite on first use. Caller holds the lock."""
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = {}
+            if self._db is not None:
+                rows = self._db.execute(
+                    "SELECT question, created FROM questions WHERE bank_key = ? AND created > ? "
+                    "ORDER BY created DESC LIMIT ?",
+                    (_key_str(key), time.time() - self.ttl, self.max_per_key),
+                )
+                bucket = dict(rows.fetchall())
+                if self._dedup is not None:
+                    for question in bucket:
+                        self._dedup.add(key, question)
+            self._buckets[key] = bucket
+            while len(self._buckets) > self.max_keys:
+                evicted_key, evicted = self._buckets.popitem(last=False)
+                self._forget(evicted_key, evicted)
+                self._counters["evicted_keys"] += 1
+        self._buckets.move_to_end(key)
+
+        cutoff = time.time() - self.ttl
+        expired = [q for q, created in bucket.items() if created <= cutoff]
+        for question in expired:
+            del bucket[question]
+        self._forget(key, expired)
+        self._counters["expired"] += len(expired)
+        return bucket
+
+    def _forget(self, key: tuple, questions):
+        """Drop questions that left the bank from the dedup index. Caller holds the lock."""
+        if self._dedup is not None:
+            for question in questions:
+                self._dedup.discard(key, question)
+
+    def draw(self, key: tuple, exclude=()) -> str | None:
+        """Return a banked question not in (or, with dedup, similar to any of) ``exclude``, or None on a miss."""
+        with self._lock:
+            available = [q for q in self._bucket(key) if q not in exclude]
+            if self._dedup is not None and exclude:
+                threshold = self._dedup.threshold
+                available = [q for q in available if dedup.near_duplicate(q, exclude, threshold) is None]
+            if not available:
+                self._counters["misses"] += 1
+                return None
+            self._counters["hits"] += 1
+            return random.choice(available)
+
+    def add(self, key: tuple, question: str):
+        question = (question or "").strip()
+        if not question:
+            return
+        now = time.time()
+        with self._lock:
+            bucket = self._bucket(key)
+            if question in bucket:
+                return
+            if self._dedup is not None:
+                if self._dedup.find(key, question) is not None:
+                    self._counters["duplicates"] += 1
+                    return
+                self._dedup.add(key, question)
+            bucket[question] = now
+            self._counters["added"] += 1
+            if len(bucket) > self.max_per_key:
+                oldest = min(bucket, key=bucket.get)
+                del bucket[oldest]
+                self._forget(key, [oldest])
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR IGNORE INTO questions (bank_key, question, created) VALUES (?, ?, ?)",
+                    (_key_str(key), question, now),
+                )
+                self._db.commit()
+
+    def claim_top_up(self, key: tuple) -> bool:
+        """True if ``key`` is running low and no other top-up for it is in flight."""
+        with self._lock:
+            if key in self._refilling or len(self._bucket(key)) >= self.low_water:
+                return False
+            self._refilling.add(key)
+            self._counters["top_ups"] += 1
+            return True
+
+    def top_up(self, key: tuple, generate):
+        """Run ``generate()`` and bank every question it returns; releases the claim."""
+        try:
+            for question in generate():
+                if question:
+                    self.add(key, question)
+        finally:
+            with self._lock:
+                self._refilling.discard(key)
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self._counters["hits"] + self._counters["misses"]
+            return dict(
+                self._counters,
+                groq_calls_avoided=self._counters["hits"],
+                hit_rate=self._counters["hits"] / lookups if lookups else 0.0,
+                keys=len(self._buckets),
+                questions=sum(len(b) for b in self._buckets.values()),
+            )
@@ -0,0 +1,183 @@
+"""Offline question pool, served while the Groq API is unavailable.
+
+The pool is a JSONL file with one ``{"technology", "level", "language",
+"question"}`` object per line. It is indexed by (technology, level,
+language). Levels are the junior/mid/senior bands of
+``question_bank.experience_level``. Technologies use the canonical names
+from ``validation.TECHNOLOGIES``, plus ``"general"`` for questions that fit
+any stack. A small hand-written English pool ships in
+``data/question_pool.jsonl``.
+
+The pool is built ahead of time, never during an interview. This command
+generates missing questions for every technology, level and language with
+the normal batch prompt, skipping near-duplicates of what the file already
+holds:
+
+    python question_pool.py --languages English,Spanish --per-level 5
+
+``draw`` rotates over the candidate's technologies by question number and
+skips questions the session was already asked. When nothing fits, it falls
+back from the candidate's level to the other levels, from the candidate's
+technologies to ``"general"``, and, unless ``fallback_language=None``, from
+the session's language to English. Services prefer the catalog's localized
+fallback question over an English pool question.
+"""
+
+import argparse
+import json
+import os
+import random
+import threading
+
+import dedup
+import i18n
+import llm
+import question_bank
+import validation
+
+POOL_PATH = os.getenv(
+    "TALENTSCOUT_QUESTION_POOL",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "question_pool.jsonl"),
+)
+LEVELS = ("junior", "mid", "senior")
+# Years of experience (the prompts' level) each band's questions are generated for
+LEVEL_YEARS = {"junior": 1, "mid": 4, "senior": 8}
+GENERAL = "general"
+
+
+def _tech_key(technology: str) -> str:
+    return " ".join((technology or "").casefold().split())
+
+
+class QuestionPool:
+    def __init__(self, path: str | None = POOL_PATH):
+        self.path = path
+        self._index = {}  # (technology key, level, language key) -> [question, ...]
+        self._names = {}  # technology key -> name as written in the file
+        self._lock = threading.Lock()
+        self.counters = {"served": 0, "misses": 0}
+        self._read()
+
+    def _read(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    self.add(record["technology"], record["level"], record["language"], record["question"])
+                except (ValueError, KeyError, TypeError):
+                    continue  # a damaged line costs one question, not the pool
+
+    def add(self, technology: str, level: str, language: str, question: str, check_duplicates: bool = False) -> bool:
+        """Index one question; with ``check_duplicates`` near-duplicates in its slot are dropped."""
+        question = (question or "").strip()
+        if not question or level not in LEVELS:
+            return False
+        key = (_tech_key(technology), level, i18n.language_key(language))
+        with self._lock:
+            bucket = self._index.setdefault(key, [])
+            if question in bucket or check_duplicates and dedup.near_duplicate(question, bucket) is not None:
+                return False
+            bucket.append(question)
+            self._names.setdefault(key[0], technology.strip())
+        return True
+
+    def count(self, technology: str, level: str, language: str) -> int:
+        with self._lock:
+            return len(self._index.get((_tech_key(technology), level, i18n.language_key(language)), ()))
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(map(len, self._index.values()))
+
+    def draw(self, tech_stack: list, experience, language: str, exclude=(), offset: int = 0,
+             fallback_language: str | None = "English") -> str | None:
+        """A question for this candidate not in ``exclude``, or None if the pool has nothing that fits."""
+        level = question_bank.experience_level(experience)
+        levels = [level] + [other for other in LEVELS if other != level] if level in LEVELS else ["mid", "junior", "senior"]
+        techs = [_tech_key(tech) for tech in tech_stack if tech.strip()]
+        if techs:
+            start = offset % len(techs)
+            techs = techs[start:] + techs[:start]
+        languages = dict.fromkeys([i18n.language_key(language), *([i18n.language_key(fallback_language)] if fallback_language else [])])
+        with self._lock:
+            for lang in languages:
+                for tech in dict.fromkeys([*techs, GENERAL]):
+                    for band in levels:
+                        fresh = [q for q in self._index.get((tech, band, lang), ()) if q not in exclude]
+                        if fresh:
+                            self.counters["served"] += 1
+                            return random.choice(fresh)
+            self.counters["misses"] += 1
+        return None
+
+    def records(self):
+        with self._lock:
+            items = [(key, list(bucket)) for key, bucket in self._index.items()]
+        for (tech, level, language), bucket in items:
+            for question in bucket:
+                yield {"technology": self._names.get(tech, tech), "level": level, "language": language.title(),
+                       "question": question}
+
+    def write(self, path: str | None = None):
+        """Save the whole pool atomically as JSONL."""
+        path = path or self.path
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            for record in self.records():
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+        os.replace(tmp, path)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return dict(self.counters, questions=sum(map(len, self._index.values())))
+
+
+def build(client, pool: QuestionPool, technologies: list, languages: list, per_level: int,
+          position: str = "Software Developer") -> int:
+    """Top every (technology, level, language) slot up to ``per_level`` questions; returns how many were added."""
+    added = 0
+    for language in languages:
+        for technology in [*technologies, GENERAL]:
+            for level in LEVELS:
+                missing = per_level - pool.count(technology, level, language)
+                if missing <= 0:
+                    continue
+                stack = [technology] if technology != GENERAL else ["general software engineering"]
+                try:
+                    questions = llm.request_question_batch(
+                        client, stack, LEVEL_YEARS[level], position, language, missing, phase="pool_build",
+                    )
+                except Exception as e:
+                    print(f"{language}/{technology}/{level}: {e}")
+                    continue
+                added += sum(pool.add(technology, level, language, q, check_duplicates=True) for q in questions if q)
+    return added
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate the offline question pool ahead of time.")
+    parser.add_argument("--out", default=POOL_PATH, help="pool file to extend (JSONL)")
+    parser.add_argument("--technologies", default=",".join(validation.TECHNOLOGIES),
+                        help="comma-separated technologies (default: every known one)")
+    parser.add_argument("--languages", default="English", help="comma-separated languages")
+    parser.add_argument("--per-level", type=int, default=5, help="questions per technology, level and language")
+    parser.add_argument("--position", default="Software Developer")
+    args = parser.parse_args()
+
+    pool = QuestionPool(args.out)
+    before = len(pool)
+    added = build(
+        llm.LLMGateway.from_env(), pool,
+        [t.strip() for t in args.technologies.split(",") if t.strip()],
+        [lang.strip() for lang in args.languages.split(",") if lang.strip()],
+        args.per_level, args.position,
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(args.out)), exist_ok=True)
+    pool.write(args.out)
+    print(f"{added} questions added to {args.out} ({before} -> {len(pool)})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,250 @@
+"""Re-score recorded answers offline with the current structured rubric.
+
+Answers are read from a JSONL export (``export.py --format jsonl``, gzipped
+or not) or straight from the session store. Each one is evaluated with
+``llm.request_structured_evaluation`` on a bounded worker pool, paced by a
+requests- and tokens-per-minute budget so a run stays under the Groq quota.
+429s that still happen are retried by ``LLMGateway``.
+
+Every result is appended to the output JSONL as soon as it arrives, and that
+file is the checkpoint: rerunning with the same ``--out`` skips answers that
+already have scores under the current rubric, so an interrupted run resumes
+where it stopped and a changed rubric re-scores everything.
+
+    python rescore.py --input sessions.jsonl.gz --out scores.jsonl --rpm 600 --tpm 200000
+    python rescore.py --store sqlite --since-hours 24 --out scores.jsonl
+    python rescore.py --input sessions.jsonl.gz --out scores.jsonl --base-url http://127.0.0.1:8900  # fake_groq.py
+"""
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import datetime
+
+from dotenv import load_dotenv
+
+import llm
+import prompts
+import session_store
+from engine import SessionState
+
+# Completion tokens assumed per evaluation when budgeting tokens per minute
+EST_COMPLETION_TOKENS = 150
+
+
+@dataclass(slots=True, frozen=True)
+class Answer:
+    session_id: str
+    question_number: int
+    question: str
+    answer: str
+    tech_context: str
+    user_language: str
+
+    @property
+    def key(self) -> tuple:
+        return self.session_id, self.question_number
+
+
+def rubric_id(model: str = llm.MODEL) -> str:
+    """Short hash of the evaluation prompt and ``model``; changes whenever the rubric does."""
+    text = prompts.EVALUATION_JSON.system + prompts.EVALUATION_JSON.user + model
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()[:12]
+
+
+def evaluation_models(client) -> list:
+    """Models ``client`` may send an evaluation to: the routed tier, or ``llm.MODEL``."""
+    router = getattr(client, "router", None)
+    if router is None:
+        return [llm.MODEL]
+    return router.tiers.get(router.task_tiers.get("evaluation"), [llm.MODEL])
+
+
+def _open_text(path: str, mode: str = "rt"):
+    return gzip.open(path, mode, encoding="utf-8") if path.endswith(".gz") else open(path, mode, encoding="utf-8")
+
+
+def iter_export_answers(path: str):
+    """Answers from a JSONL export; sessions are read one at a time."""
+    context = {}
+    with _open_text(path) as lines:
+        for line in lines:
+            record = json.loads(line)
+            kind = record.get("record")
+            if kind == "session":
+                candidate = record.get("candidate") or {}
+                context = {
+                    "session_id": record.get("session_id"),
+                    "tech_context": candidate.get("tech_stack", ""),
+                    "user_language": record.get("language") or "English",
+                }
+            elif kind == "response" and record.get("answer"):
+                same = context.get("session_id") == record.get("session_id")
+                yield Answer(
+                    record.get("session_id") or "", record.get("question_number") or 0,
+                    record.get("question") or "", record["answer"],
+                    context.get("tech_context", "") if same else "",
+                    context.get("user_language", "English") if same else "English",
+                )
+
+
+def iter_store_answers(store, since: float | None = None):
+    """Answers from every stored session (written since ``since``, epoch seconds)."""
+    for session_id in store.session_ids(since):
+        state = store.load(session_id, SessionState, with_messages=False)
+        if state is None:
+            continue
+        tech_context = ", ".join(state.candidate.get("tech_stack", []))
+        for response in state.technical_responses:
+            if response.get("answer"):
+                yield Answer(session_id, response.get("question_number") or 0, response.get("question") or "",
+                             response["answer"], tech_context, state.user_language)
+
+
+def load_checkpoint(path: str, rubrics: set) -> set:
+    """Keys of answers already scored under one of ``rubrics`` in an earlier run."""
+    done = set()
+    if not os.path.exists(path):
+        return done
+    with open(path, encoding="utf-8") as lines:
+        for line in lines:
+            try:
+                record = json.loads(line)
+            except ValueError:
+                continue  # a line cut short by an interrupted run
+            if record.get("rubric") in rubrics and "error" not in record:
+                done.add((record["session_id"], record["question_number"]))
+    return done
+
+
+class RateLimiter:
+    """Token buckets for requests and tokens per minute, shared by all workers.
+
+    ``acquire`` reserves capacity up front and sleeps off any deficit, so
+    concurrent callers queue fairly instead of polling.
+    """
+
+    def __init__(self, rpm: float, tpm: float | None = None):
+        self.rates = (rpm / 60, tpm / 60 if tpm else None)
+        self._levels = [rpm / 60, tpm / 60 if tpm else 0.0]  # one second of burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, tokens: int = 0):
+        with self._lock:
+            now = time.monotonic()
+            elapsed, self._updated = now - self._updated, now
+            wait_for = 0.0
+            for i, (rate, amount) in enumerate(zip(self.rates, (1, tokens))):
+                if not rate:
+                    continue
+                self._levels[i] = min(self._levels[i] + elapsed * rate, rate) - amount
+                wait_for = max(wait_for, -self._levels[i] / rate)
+        if wait_for > 0:
+            time.sleep(wait_for)
+
+
+def score(client, answer: Answer, limiter: RateLimiter | None, parse_retries: int = 1) -> dict:
+    """Evaluate one answer; returns its output record (with ``error`` on failure).
+
+    The record's rubric is that of the model that served the call.
+    """
+    record = {"session_id": answer.session_id, "question_number": answer.question_number, "rubric": rubric_id()}
+    if limiter is not None:
+        request = llm.structured_evaluation_request(answer.question, answer.answer, answer.tech_context, answer.user_language)
+        limiter.acquire(sum(prompts.count_tokens(m["content"]) for m in request["messages"]) + EST_COMPLETION_TOKENS)
+    try:
+        evaluation = llm.request_structured_evaluation(
+            client, answer.question, answer.answer, answer.tech_context, answer.user_language,
+            question_number=answer.question_number, retries=parse_retries, phase="rescore",
+        )
+    except Exception as e:
+        record["error"] = f"{type(e).__name__}: {e}"
+        return record
+    model = evaluation.model or llm.MODEL
+    record.update(evaluation.to_row(), model=model, rubric=rubric_id(model), scored_at=datetime.utcnow().isoformat())
+    return record
+
+
+def run(answers, out_path: str, client, workers: int = 16, limiter: RateLimiter | None = None,
+        parse_retries: int = 1, progress_every: float = 10.0) -> dict:
+    """Score every answer not already in ``out_path``; returns counters."""
+    done = load_checkpoint(out_path, {rubric_id(model) for model in evaluation_models(client)})
+    counts = {"scored": 0, "errors": 0, "skipped": 0}
+    started = last_report = time.perf_counter()
+    pending = set()
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="rescore") as pool, \
+            open(out_path, "a", encoding="utf-8") as out:
+        if out.tell():
+            with open(out_path, "rb") as tail:
+                tail.seek(-1, os.SEEK_END)
+                if tail.read(1) != b"\n":
+                    out.write("\n")  # end the line an interrupted run cut short
+
+        def drain(block_until: int):
+            nonlocal pending, last_report
+            while len(pending) > block_until:
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    record = future.result()
+                    out.write(json.dumps(record, ensure_ascii=False) + "\n")
+                    counts["errors" if "error" in record else "scored"] += 1
+                out.flush()
+            if progress_every and time.perf_counter() - last_report >= progress_every:
+                last_report = time.perf_counter()
+                rate = counts["scored"] / (last_report - started) * 3600
+                print(f"{counts['scored']} scored, {counts['errors']} errors, {counts['skipped']} skipped, "
+                      f"{rate:,.0f} answers/hour", flush=True)
+
+        for answer in answers:
+            if answer.key in done:
+                counts["skipped"] += 1
+                continue
+            done.add(answer.key)  # the same answer twice in the input is scored once
+            pending.add(pool.submit(score, client, answer, limiter, parse_retries))
+            drain(workers * 2)  # bounded backlog: the input is read only as fast as it is scored
+        drain(0)
+    counts["seconds"] = time.perf_counter() - started
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Re-score recorded answers with the current structured rubric.")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--input", help="JSONL export (.jsonl or .jsonl.gz) from export.py")
+    source.add_argument("--store", choices=["sqlite", "file", "redis"], help="read the session store instead")
+    parser.add_argument("--store-path", default=session_store.STORE_PATH, help="store path or Redis URL")
+    parser.add_argument("--since-hours", type=float, help="with --store, only sessions written in the last N hours")
+    parser.add_argument("--out", required=True, help="score JSONL; also the checkpoint for resuming")
+    parser.add_argument("--workers", type=int, default=16)
+    parser.add_argument("--rpm", type=float, default=500.0, help="requests per minute (0 for no limit)")
+    parser.add_argument("--tpm", type=float, default=0.0, help="estimated tokens per minute (0 for no limit)")
+    parser.add_argument("--retries", type=int, default=int(os.getenv("TALENTSCOUT_LLM_RETRIES", "3")))
+    parser.add_argument("--parse-retries", type=int, default=1)
+    parser.add_argument("--base-url", default=os.getenv("GROQ_BASE_URL"), help="e.g. a local benchmarks/fake_groq.py")
+    args = parser.parse_args()
+
+    load_dotenv()
+    if args.input:
+        answers = iter_export_answers(args.input)
+    else:
+        since = time.time() - args.since_hours * 3600 if args.since_hours else None
+        answers = iter_store_answers(session_store.from_env(args.store, args.store_path), since)
+    client = llm.LLMGateway(
+        api_key=os.getenv("GROQ_API_KEY"), base_url=args.base_url or None,
+        timeout=float(os.getenv("TALENTSCOUT_LLM_TIMEOUT", "30")), max_retries=args.retries, max_inflight=args.workers,
+    )
+    limiter = RateLimiter(args.rpm, args.tpm) if args.rpm or args.tpm else None
+    counts = run(answers, args.out, client, args.workers, limiter, args.parse_retries)
+    print(f"done in {counts['seconds']:.1f}s: {counts['scored']} scored, {counts['errors']} errors, "
+          f"{counts['skipped']} already scored (rubric {rubric_id()})")
+
+
+if __name__ == "__main__":
+    main()
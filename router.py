@@ -0,0 +1,144 @@
+"""Per-task model routing with latency SLOs and failover.
+
+Every LLM task belongs to a tier. Short, cheap tasks (language detection,
+consent, tech-stack extraction, translation) go to the ``small`` tier, and
+question generation and evaluation stay on ``large``. A tier is an ordered
+list of models: the first is the primary, the rest are alternates.
+
+``LLMGateway`` asks ``plan`` which model to call and reports every outcome
+back. A model is put on cool-down, and its tier's calls go to the next
+model, when:
+
+- it answers 429 (for at least its Retry-After),
+- it fails with a 5xx, connection error or timeout, or
+- its moving-average latency over at least ``MIN_SAMPLES`` calls exceeds
+  the tier's SLO. Latency is time to first token for streams and wall time
+  otherwise. A non-streamed call that generated more than
+  ``SLO_MAX_TOKENS`` tokens (a full catalog translation, a question batch)
+  is not counted, because its wall time measures output length rather
+  than how responsive the model is.
+
+Routing is opt-in (``TALENTSCOUT_ROUTING=1``). A failed call is retried on the next model right away instead of backing
+off. When the cool-down ends, the primary gets traffic again and its latency
+is measured afresh. Each call's tier and route ("primary",
+"failover_rate_limited", "failover_error" or "failover_slow") are recorded in
+``metrics``, so latency and cost can be compared per tier and model.
+"""
+
+import os
+import threading
+import time
+
+# Comma-separated models per tier, primary first (llm.MODEL is the large primary)
+TIERS = {
+    "small": os.getenv("TALENTSCOUT_MODELS_SMALL", "llama-3.1-8b-instant,meta-llama/llama-4-scout-17b-16e-instruct"),
+    "large": os.getenv("TALENTSCOUT_MODELS_LARGE", "meta-llama/llama-4-scout-17b-16e-instruct,llama-3.3-70b-versatile"),
+}
+# Latency SLO per tier, in seconds
+SLOS = {
+    "small": float(os.getenv("TALENTSCOUT_SLO_SMALL_MS", "1000")) / 1000,
+    "large": float(os.getenv("TALENTSCOUT_SLO_LARGE_MS", "4000")) / 1000,
+}
+TASK_TIERS = {
+    "language": "small",
+    "consent": "small",
+    "tech_stack": "small",
+    "translation": "small",
+    "question": "large",
+    "question_batch": "large",
+    "evaluation": "large",
+}
+# Seconds a failing or slow model is skipped for
+COOLDOWN = float(os.getenv("TALENTSCOUT_FAILOVER_COOLDOWN", "30"))
+# Weight of the newest latency in a model's moving average
+SMOOTHING = 0.3
+# Calls a model's average needs before it is held to the SLO, so one outlier does not fail it over
+MIN_SAMPLES = 3
+# Output tokens beyond which a non-streamed call's wall time is not held to the SLO
+SLO_MAX_TOKENS = int(os.getenv("TALENTSCOUT_SLO_MAX_TOKENS", "256"))
+
+
+def parse_task_tiers(value: str) -> dict:
+    """``"translation=large,evaluation=small"`` -> {task: tier}."""
+    pairs = (item.split("=", 1) for item in value.split(",") if "=" in item)
+    return {task.strip(): tier.strip() for task, tier in pairs}
+
+
+class ModelRouter:
+    def __init__(self, tiers: dict | None = None, task_tiers: dict | None = None, slos: dict | None = None,
+                 cooldown: float = COOLDOWN, smoothing: float = SMOOTHING):
+        tiers = tiers or TIERS
+        self.tiers = {
+            tier: [m.strip() for m in models.split(",") if m.strip()] if isinstance(models, str) else list(models)
+            for tier, models in tiers.items()
+        }
+        self.task_tiers = dict(TASK_TIERS if task_tiers is None else task_tiers)
+        self.slos = dict(SLOS if slos is None else slos)
+        self.cooldown = cooldown
+        self.smoothing = smoothing
+        self._health = {}  # model -> {"latency": moving average, "samples": int, "until": monotonic, "reason": str}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls):
+        """Router configured from ``TALENTSCOUT_*``, or None unless ``TALENTSCOUT_ROUTING=1``."""
+        if os.getenv("TALENTSCOUT_ROUTING", "0") == "0":
+            return None
+        return cls(task_tiers={**TASK_TIERS, **parse_task_tiers(os.getenv("TALENTSCOUT_TASK_TIERS", ""))})
+
+    def _state(self, model: str) -> dict:
+        return self._health.setdefault(model, {"latency": None, "samples": 0, "until": 0.0, "reason": ""})
+
+    def plan(self, task: str, model: str) -> tuple:
+        """(tier, models to try in order, route) for one call; untiered tasks keep ``model``."""
+        tier = self.task_tiers.get(task)
+        chain = self.tiers.get(tier)
+        if not chain:
+            return "-", [model], "-"
+        now = time.monotonic()
+        with self._lock:
+            until = {m: self._state(m)["until"] for m in chain}
+            ready = [m for m in chain if until[m] <= now]
+            # Cooling models stay as a last resort, the one back soonest first
+            models = ready + sorted((m for m in chain if until[m] > now), key=until.get)
+            route = "primary" if models[0] == chain[0] else "failover_" + self._health[chain[0]]["reason"]
+        return tier, models, route
+
+    def mark_down(self, model: str, reason: str, seconds: float | None = None):
+        """Skip ``model`` for ``seconds`` (at least the cool-down); ``reason`` ends up in routes."""
+        with self._lock:
+            state = self._state(model)
+            state["until"] = max(state["until"], time.monotonic() + max(seconds or 0.0, self.cooldown))
+            state["reason"] = reason
+            state["latency"], state["samples"] = None, 0  # measured afresh once it is back
+
+    def observe(self, model: str, tier: str, latency: float, completion_tokens: int = 0, streamed: bool = True):
+        """Fold a successful call's latency into ``model``'s average; cool it down past the SLO.
+
+        ``latency`` is time to first token for a stream and wall time otherwise.
+        """
+        if not streamed and completion_tokens > SLO_MAX_TOKENS:
+            return
+        slo = self.slos.get(tier)
+        with self._lock:
+            state = self._state(model)
+            average = latency if state["latency"] is None else (
+                self.smoothing * latency + (1 - self.smoothing) * state["latency"])
+            state["latency"] = average
+            state["samples"] += 1
+            breached = slo and average > slo and state["samples"] >= MIN_SAMPLES
+        if breached and len(self.tiers.get(tier, ())) > 1:
+            self.mark_down(model, "slow")
+
+    def stats(self) -> dict:
+        """Per-model moving latency and remaining cool-down."""
+        now = time.monotonic()
+        with self._lock:
+            return {
+                model: {
+                    "latency_s": round(state["latency"], 3) if state["latency"] is not None else None,
+                    "cooling_s": round(max(state["until"] - now, 0.0), 1),
+                    "reason": state["reason"],
+                }
+                for model, state in self._health.items()
+            }
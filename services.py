@@ -0,0 +1,618 @@
+"""Groq-backed services for the interview engine.
+
+One ``InterviewServices`` instance is shared by every session in the process.
+It owns the question-generation worker pool and the question bank. With an
+``AsyncLLMGateway`` client, background generation runs as coroutines on the
+gateway's event loop instead of occupying pool threads. Per-session
+state (prefetched futures, asked questions) lives on the ``SessionState`` that
+is passed in. Errors are reported through ``on_error``, which app.py points at
+``st.error``, and every fallback served instead of an LLM answer is counted in
+``metrics``.
+
+Generated questions are checked against the ones the session has already
+been asked; near-duplicates are rejected and regenerated (see ``dedup``).
+Questions streamed live are shown as they arrive and cannot be checked.
+
+In the adaptive assessment mode each question's level and technology come
+from the candidate's ability estimate (see ``adaptive``), and the assessment
+ends as soon as the estimate is confident.
+
+With ``TALENTSCOUT_EVAL_QUEUE`` set, answers are evaluated in the background
+on ``eval_queue`` and the next question is shown at once. Results are
+attached to ``technical_responses`` as they finish and shown with the
+summary. While the gateway's circuit breaker is open (see ``breaker``), no
+call is attempted in any mode: questions come from the offline pool
+(``question_pool``), and answers wait on the same queue until the API is back.
+"""
+
+import functools
+import os
+import queue
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+
+import adaptive
+import async_llm
+import dedup
+import eval_queue
+import i18n
+import language
+import llm
+import metrics
+import question_bank
+import question_pool
+import session_store
+import validation
+
+# Stream question/evaluation tokens into the chat as they arrive (set to 0 to disable)
+STREAM_RESPONSES = os.getenv("TALENTSCOUT_STREAM", "1") != "0"
+
+# Generate upcoming questions in the background: "next", "all" or "off"
+PREFETCH_MODE = os.getenv("TALENTSCOUT_PREFETCH", "next").lower()
+PREFETCH_WORKERS = int(os.getenv("TALENTSCOUT_PREFETCH_WORKERS", "8"))
+
+# "batch" asks for the whole question set in one call, "single" generates one per turn
+QUESTION_MODE = os.getenv("TALENTSCOUT_QUESTION_MODE", "single").lower()
+
+# Generate the next question while the current answer is being evaluated (set to 0 to disable)
+CONCURRENT_TURN = os.getenv("TALENTSCOUT_CONCURRENT_TURN", "1") != "0"
+
+# Shared question bank: reuse questions generated for other candidates with the same profile
+QUESTION_BANK = os.getenv("TALENTSCOUT_QUESTION_BANK", "1") != "0"
+QUESTION_BANK_DB = os.getenv("TALENTSCOUT_QUESTION_BANK_DB")  # optional SQLite file
+QUESTION_BANK_TTL = float(os.getenv("TALENTSCOUT_QUESTION_BANK_TTL", str(7 * 24 * 3600)))
+QUESTION_BANK_TOP_UP = int(os.getenv("TALENTSCOUT_QUESTION_BANK_TOP_UP", "5"))
+
+# Reject near-duplicate questions within a session and keep only canonical questions in the bank
+DEDUP = os.getenv("TALENTSCOUT_DEDUP", "1") != "0"
+DEDUP_RETRIES = int(os.getenv("TALENTSCOUT_DEDUP_RETRIES", "2"))
+
+# "structured" asks for JSON scores that are kept on state.evaluations, "text" for free-form prose
+EVAL_MODE = os.getenv("TALENTSCOUT_EVAL_MODE", "text").lower()
+EVAL_PARSE_RETRIES = int(os.getenv("TALENTSCOUT_EVAL_PARSE_RETRIES", "1"))
+
+# "adaptive" picks each question's level and technology from the scores so far and stops once confident
+ASSESSMENT_MODE = os.getenv("TALENTSCOUT_ASSESSMENT", "fixed").lower()
+ADAPTIVE_MIN_QUESTIONS = int(os.getenv("TALENTSCOUT_ADAPTIVE_MIN_QUESTIONS", "2"))
+ADAPTIVE_MAX_QUESTIONS = int(os.getenv("TALENTSCOUT_ADAPTIVE_MAX_QUESTIONS", "5"))
+ADAPTIVE_CONFIDENCE = float(os.getenv("TALENTSCOUT_ADAPTIVE_CONFIDENCE", "1.6"))  # level standard deviation
+# Largest RMS residual (0-1 score units) at which the scores still count as consistent with the estimate
+ADAPTIVE_MAX_RESIDUAL = float(os.getenv("TALENTSCOUT_ADAPTIVE_MAX_RESIDUAL", str(adaptive.MAX_RESIDUAL)))
+ADAPTIVE_BAND = int(os.getenv("TALENTSCOUT_ADAPTIVE_BAND", "3"))  # levels per question bank entry
+
+# Seconds the summary waits for answers still being evaluated in the background
+SUMMARY_WAIT = float(os.getenv("TALENTSCOUT_EVAL_SUMMARY_WAIT", "2"))
+
+
+def _ignore(message):
+    pass
+
+
+class InterviewServices:
+    def __init__(self, client, stream: bool = STREAM_RESPONSES, prefetch_mode: str = PREFETCH_MODE,
+                 question_mode: str = QUESTION_MODE, concurrent_turn: bool = CONCURRENT_TURN,
+                 use_bank: bool = QUESTION_BANK, workers: int = PREFETCH_WORKERS, eval_mode: str = EVAL_MODE,
+                 use_dedup: bool = DEDUP, assessment_mode: str = ASSESSMENT_MODE,
+                 eval_queue_mode: str = eval_queue.MODE, on_error=_ignore):
+        self.client = client
+        self.stream = stream
+        self.prefetch_mode = prefetch_mode
+        self.question_mode = question_mode
+        self.concurrent_turn = concurrent_turn
+        self.eval_mode = eval_mode
+        self.dedup = use_dedup
+        self.adaptive = assessment_mode == "adaptive"
+        self.on_error = on_error
+        self.is_async = isinstance(client, async_llm.AsyncLLMGateway)
+        # Worker pool shared by all sessions for background question generation
+        self.pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="question-prefetch")
+        self.bank = question_bank.QuestionBank(
+            ttl=QUESTION_BANK_TTL,
+            low_water=QUESTION_BANK_TOP_UP,
+            db_path=QUESTION_BANK_DB,
+            dedup_threshold=dedup.THRESHOLD if use_dedup else None,
+        ) if use_bank else None
+        self.catalog = i18n.Catalog()
+        self.question_pool = question_pool.QuestionPool()
+        self.background_eval = eval_queue_mode in ("memory", "sqlite")
+        self.eval_queue = eval_queue.from_env(
+            self.run_deferred_evaluation, breaker=getattr(client, "breaker", None), mode=eval_queue_mode,
+        )
+
+    def degraded(self) -> bool:
+        """True while the circuit breaker refuses LLM calls."""
+        breaker = getattr(self.client, "breaker", None)
+        return breaker is not None and breaker.is_open()
+
+    # Language
+    def detect_language(self, state, user_input):
+        return self.detect_language_with_groq(user_input, state.phase)
+
+    def detect_language_with_groq(self, user_input, phase: str = "-"):
+        """Resolve the user's language preference locally, asking Groq only for unknown input."""
+        detected = language.resolve(user_input)
+        if detected:
+            return detected
+        try:
+            return language.remember(user_input, llm.request_language(self.client, user_input, phase=phase))
+        except Exception as e:
+            self.on_error(f"Error processing language: {str(e)}")
+            metrics.record_fallback("language", phase)
+            return "English"
+
+    # Input validation
+    def parse_consent(self, state, user_input):
+        """Yes/no consent, read locally; only ambiguous replies go to Groq. None if still unclear."""
+        answer = validation.parse_yes_no(user_input)
+        if answer is not None:
+            return answer
+        try:
+            return llm.request_consent(self.client, user_input, phase=state.phase)
+        except Exception as e:
+            self.on_error(f"Error reading consent: {str(e)}")
+            metrics.record_fallback("consent", state.phase)
+            return None
+
+    def parse_tech_stack(self, state, user_input):
+        """Canonical technologies from the candidate's stack; prose naming none we know is sent to Groq."""
+        techs = validation.parse_tech_stack(user_input)
+        if techs is not None:
+            return techs
+        try:
+            return llm.request_tech_stack(self.client, user_input, phase=state.phase)
+        except Exception as e:
+            self.on_error(f"Error reading tech stack: {str(e)}")
+            metrics.record_fallback("tech_stack", state.phase)
+            return []
+
+    # Fixed strings
+    def load_language(self, state):
+        """Translate the string catalog into the session's language once per process (and cache file)."""
+        self.catalog.load(state.user_language, lambda strings, language: self.translate_strings(strings, language, state.phase))
+
+    def translate_strings(self, strings: dict, language: str, phase: str = "-") -> dict:
+        try:
+            return llm.request_translation(self.client, strings, language, phase=phase)
+        except Exception as e:
+            self.on_error(f"Error translating messages: {str(e)}")
+            metrics.record_fallback("translation", phase)
+            raise
+
+    def localize(self, state, string_id, **values):
+        return self.catalog.text(string_id, state.user_language, **values)
+
+    # Streaming
+    def iter_stream_text(self, response):
+        """Yield the content deltas of a streamed Groq chat completion."""
+        try:
+            for chunk in response:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    yield delta
+        except Exception as e:
+            self.on_error(f"Response stream interrupted: {str(e)}")
+
+    # Questions
+    def question_args(self, state):
+        """Arguments for llm.request_question built from the candidate profile.
+
+        In adaptive mode the level and technology come from the ability estimate.
+        """
+        cd = state.candidate
+        tech_stack, experience = cd.get("tech_stack", []), cd.get("experience")
+        if state.ability:
+            experience, tech = adaptive.next_target(state.ability, tech_stack)
+            tech_stack = [tech] if tech else tech_stack
+        return (
+            self.client,
+            tech_stack,
+            experience,
+            cd.get("position", "Software Developer"),
+            state.user_language,
+        )
+
+    def question_bank_key(self, state):
+        _, tech_stack, experience, position, user_language = self.question_args(state)
+        # Adaptive levels share a bank entry per band of ADAPTIVE_BAND levels
+        level = f"levels {(experience - 1) // ADAPTIVE_BAND * ADAPTIVE_BAND + 1}+" if state.ability else None
+        return question_bank.make_key(position, tech_stack, experience, user_language, level=level)
+
+    def generate_ai_question(self, state, question_num: int, stream: bool = False):
+        """Generate a technical question using Groq AI based on candidate's tech stack and position.
+
+        With ``stream=True`` an iterator of text chunks is returned instead of a string.
+        """
+        try:
+            if stream:
+                return self.iter_stream_text(
+                    llm.request_question(*self.question_args(state), stream=True, phase=state.phase)
+                )
+            return self.unique_question(
+                state.asked_questions,
+                lambda: llm.request_question(*self.question_args(state), phase=state.phase),
+            )
+        except Exception as e:
+            self.on_error(f"Error generating question: {str(e)}")
+            fallback_msg = self.offline_question(state, question_num)
+            return iter([fallback_msg]) if stream else fallback_msg
+
+    def unique_question(self, asked, generate) -> str:
+        """Call ``generate()`` again while it returns a near-duplicate of ``asked``.
+
+        After ``DEDUP_RETRIES`` regenerations the last question is kept.
+        """
+        question = generate()
+        for _ in range(DEDUP_RETRIES if self.dedup and asked else 0):
+            if dedup.near_duplicate(question, asked) is None:
+                break
+            dedup.count_rejected()
+            question = generate()
+        return question
+
+    def is_repeat(self, state, question) -> bool:
+        """True if ``question`` paraphrases one this session was already asked."""
+        if not self.dedup or not question:
+            return False
+        # Questions drawn from the bank are recorded as asked when drawn
+        asked = [q for q in state.asked_questions if q != question]
+        if dedup.near_duplicate(question, asked) is None:
+            return False
+        dedup.count_rejected()
+        return True
+
+    def offline_question(self, state, question_num: int) -> str:
+        """A question from the offline pool, or the catalog's fallback question; makes no LLM call."""
+        metrics.record_fallback("question", state.phase)
+        _, tech_stack, experience, _, user_language = self.question_args(state)
+        draw = functools.partial(
+            self.question_pool.draw, tech_stack, experience, exclude=state.asked_questions, offset=question_num - 1,
+        )
+        question = draw(user_language, fallback_language=None)
+        # A generic question in the candidate's language beats a pool question in English
+        if question is None and not self.catalog.is_translated("fallback_question", user_language):
+            question = draw("English")
+        return question or self.fallback_question_text(state)
+
+    def fallback_question_text(self, state) -> str:
+        """Fallback question from the string catalog, so the failure path makes no further LLM call."""
+        tech_stack = state.candidate.get("tech_stack", [])
+        technology = tech_stack[0] if tech_stack else self.localize(state, "primary_technology")
+        return self.localize(state, "fallback_question", technology=technology)
+
+    def prepare_questions(self, state):
+        """In batch mode, fill ``state.tech_questions`` with one batched LLM call."""
+        # Adaptive questions depend on the previous answer, so they cannot be batched
+        if self.question_mode != "batch" or state.ability:
+            return
+        total_q = state.total_questions
+        try:
+            questions = llm.request_question_batch(*self.question_args(state), total_q, phase=state.phase)
+        except Exception as e:
+            self.on_error(f"Error generating questions: {str(e)}")
+            metrics.record_fallback("question_batch", state.phase)
+            questions = [None] * total_q
+        # Missing slots are generated one by one when they come up
+        state.tech_questions = questions
+        if self.bank is not None:
+            key = self.question_bank_key(state)
+            for question in questions:
+                self.bank.add(key, question)
+
+    def take_batched_question(self, state, question_num: int):
+        """Return the batch-generated question for this slot, or None."""
+        questions = state.tech_questions
+        if question_num <= len(questions):
+            return questions[question_num - 1]
+        return None
+
+    def draw_banked_question(self, state):
+        """Draw a question this session has not been asked yet from the shared bank."""
+        if self.bank is None:
+            return None
+        key = self.question_bank_key(state)
+        question = self.bank.draw(key, exclude=state.asked_questions)
+        if question:
+            state.asked_questions.add(question)
+
+        # Keep the bank stocked for the next candidates with this profile. Adaptive
+        # keys are per technology and level band, and the next question's level
+        # depends on this answer, so a batch for them is rarely drawn from.
+        if self.degraded() or state.ability or not self.bank.claim_top_up(key):
+            return question
+        if self.is_async:
+            future = self.client.submit(
+                async_llm.request_question_batch(*self.question_args(state), QUESTION_BANK_TOP_UP, phase=state.phase)
+            )
+            future.add_done_callback(lambda f: self.bank.top_up(key, lambda: self.future_result(f) or []))
+        else:
+            self.pool.submit(
+                self.bank.top_up, key,
+                lambda args=self.question_args(state), phase=state.phase:
+                    llm.request_question_batch(*args, QUESTION_BANK_TOP_UP, phase=phase),
+            )
+        return question
+
+    @staticmethod
+    def future_result(future):
+        """Result of a finished background call, or None if it failed or was cancelled."""
+        if future.cancelled() or future.exception() is not None:
+            return None
+        return future.result()
+
+    def generate_banked_question(self, key, phase, asked, *args):
+        """Worker-thread job: generate one question not similar to ``asked`` and deposit it in the bank."""
+        def generate():
+            question = llm.request_question(*args, phase=phase)
+            if self.bank is not None:
+                self.bank.add(key, question)
+            return question
+        return self.unique_question(asked, generate)
+
+    async def agenerate_banked_question(self, key, phase, asked, *args):
+        """Event-loop twin of ``generate_banked_question``."""
+        question = None
+        for attempt in range(DEDUP_RETRIES + 1 if self.dedup and asked else 1):
+            if attempt:
+                dedup.count_rejected()
+            question = await async_llm.request_question(*args, phase=phase)
+            if self.bank is not None:
+                self.bank.add(key, question)
+            if dedup.near_duplicate(question, asked) is None:
+                break
+        return question
+
+    def submit_question(self, state, question_num: int):
+        """Queue generation of one question on the worker pool unless it is already available."""
+        pending = state.prefetched_questions
+        if question_num in pending or self.take_batched_question(state, question_num):
+            return
+
+        banked = self.draw_banked_question(state)
+        if banked:
+            pending[question_num] = Future()
+            pending[question_num].set_result(banked)
+            return
+
+        key = self.question_bank_key(state) if self.bank is not None else None
+        # Snapshot: the worker must not read session state
+        asked = tuple(state.asked_questions)
+        if self.is_async:
+            pending[question_num] = self.client.submit(
+                self.agenerate_banked_question(key, state.phase, asked, *self.question_args(state))
+            )
+            return
+        pending[question_num] = self.pool.submit(
+            self.generate_banked_question, key, state.phase, asked, *self.question_args(state)
+        )
+
+    def take_prefetched_question(self, state, question_num: int):
+        """Return a prefetched question, waiting for it if still in flight, or None."""
+        future = state.prefetched_questions.pop(question_num, None)
+        if future is None or future.cancelled():
+            return None
+        try:
+            return future.result()
+        except Exception as e:
+            self.on_error(f"Error generating question: {str(e)}")
+            return None
+
+    def question(self, state, question_num: int):
+        """Next question text, or a stream of chunks when it has to be generated live."""
+        if state.ability:
+            # Remember what this question targets; the evaluation updates the estimate for it
+            _, tech_stack, experience, _, _ = self.question_args(state)
+            state.ability = dict(state.ability, current=[experience, tech_stack[0] if len(tech_stack) == 1 else None])
+        question = self.take_batched_question(state, question_num)
+        if not question:
+            question = self.take_prefetched_question(state, question_num)
+        if self.is_repeat(state, question):
+            question = None
+        if not question:
+            question = self.draw_banked_question(state)
+        if question:
+            return question
+        if self.degraded():
+            return self.offline_question(state, question_num)
+        return self.generate_ai_question(state, question_num, stream=self.stream)
+
+    def after_question(self, state):
+        """Start generating the upcoming question(s) on the worker pool.
+
+        Futures are kept in ``state.prefetched_questions`` keyed by question
+        number; worker threads never touch session state themselves.
+        """
+        # An adaptive question depends on the answer before it
+        if self.prefetch_mode == "off" or state.ability or self.degraded():
+            return
+
+        shown = state.q_idx
+        last = state.total_questions if self.prefetch_mode == "all" else min(shown + 1, state.total_questions)
+        for question_num in range(shown + 1, last + 1):
+            self.submit_question(state, question_num)
+
+    def before_evaluation(self, state):
+        # The next question does not depend on the evaluation, so start it first
+        # and let it run on the worker pool while the answer is evaluated.
+        if self.concurrent_turn and not state.ability and state.q_idx < state.total_questions and not self.degraded():
+            self.submit_question(state, state.q_idx + 1)
+
+    def reset(self, state):
+        """Cancel queued question generation and evaluations, and drop any in-flight results."""
+        for future in state.prefetched_questions.values():
+            future.cancel()
+        for number, future in state.pending_evaluations.items():
+            future.cancel()
+            self.eval_queue.forget((state.session_id, number))
+        state.prefetched_questions = {}
+        state.pending_evaluations = {}
+
+    # Adaptive assessment
+    def plan_assessment(self, state):
+        """In adaptive mode, start the ability estimate from the stated experience."""
+        if self.adaptive:
+            state.ability = adaptive.initial(state.candidate.get("experience"))
+            state.total_questions = ADAPTIVE_MAX_QUESTIONS
+
+    def after_evaluation(self, state, evaluation: str):
+        """Update the ability estimate from the scores; end the assessment once it is confident."""
+        if not state.ability or not state.ability.get("current"):
+            return
+        latest = state.evaluations[-1] if state.evaluations else None
+        if latest is not None and latest.question_number == state.q_idx:
+            scores = latest.scores
+        else:
+            scores = llm.parse_text_scores(evaluation)
+        if not scores:
+            return  # the fallback message carries no scores
+        difficulty, tech = state.ability["current"]
+        state.ability = adaptive.update(state.ability, sum(scores) / len(scores) / 10, difficulty, tech)
+        if state.q_idx >= ADAPTIVE_MIN_QUESTIONS and adaptive.is_confident(
+            state.ability, ADAPTIVE_CONFIDENCE, ADAPTIVE_MAX_RESIDUAL,
+        ):
+            state.total_questions = state.q_idx
+
+    # Evaluation
+    def evaluate(self, state, question, answer):
+        tech_context = ", ".join(state.candidate.get("tech_stack", []))
+        # Adaptive mode needs the scores before it can pick the next question
+        if (self.background_eval and not state.ability) or self.degraded():
+            note = self.defer_evaluation(state, question, answer, tech_context)
+            if note is not None:
+                return note
+        if self.eval_mode == "structured":
+            return self.evaluate_structured(state, question, answer, tech_context)
+        return self.evaluate_answer(state, question, answer, tech_context, stream=self.stream)
+
+    def evaluate_structured(self, state, question: str, answer: str, tech_context: str) -> str:
+        """Score the answer in JSON mode, keep the record on ``state.evaluations`` and return it as text."""
+        try:
+            evaluation = llm.request_structured_evaluation(
+                self.client, question, answer, tech_context, state.user_language,
+                question_number=state.q_idx, retries=EVAL_PARSE_RETRIES, phase=state.phase,
+            )
+        except Exception as e:
+            self.on_error(f"Error evaluating answer: {str(e)}")
+            return self.defer_evaluation(state, question, answer, tech_context, failed=True)
+        state.evaluations.append(evaluation)
+        return evaluation.to_markdown()
+
+    def evaluate_answer(self, state, question: str, answer: str, tech_context: str, stream: bool = False):
+        """Evaluate candidate's answer using Groq AI.
+
+        With ``stream=True`` an iterator of text chunks is returned instead of a string.
+        """
+        try:
+            response = llm.request_evaluation(self.client, question, answer, tech_context, state.user_language,
+                                              stream=stream, phase=state.phase)
+            if stream:
+                return self.iter_stream_text(response)
+            return response
+        except Exception as e:
+            self.on_error(f"Error evaluating answer: {str(e)}")
+            fallback_msg = self.defer_evaluation(state, question, answer, tech_context, failed=True)
+            return iter([fallback_msg]) if stream else fallback_msg
+
+    # Background and deferred evaluation
+    def defer_evaluation(self, state, question: str, answer: str, tech_context: str, failed: bool = False):
+        """Queue the answer on the evaluation queue; returns the note shown instead.
+
+        With ``failed`` (the inline call just failed) a full queue yields the
+        "unavailable" message; otherwise it returns None and the caller
+        evaluates inline.
+        """
+        number = state.q_idx
+        if not state.session_id:
+            state.session_id = session_store.new_session_id()  # jobs are keyed by session
+        try:
+            future = self.eval_queue.submit((state.session_id, number), {
+                "question": question,
+                "answer": answer,
+                "tech_context": tech_context,
+                "user_language": state.user_language,
+                "question_number": number,
+                "structured": self.eval_mode == "structured",
+            })
+        except queue.Full:
+            if not failed:
+                return None
+            metrics.record_fallback("evaluation", state.phase)
+            return self.localize(state, "evaluation_unavailable")
+        state.pending_evaluations[number] = future
+        for response in state.technical_responses:
+            if response.get("question_number") == number:
+                response["evaluation_pending"] = True  # saved with this turn, so a resumed session looks it up
+        if failed or self.degraded():
+            metrics.record_fallback("evaluation", state.phase)
+            return self.localize(state, "evaluation_deferred")
+        return self.localize(state, "evaluation_queued")
+
+    def run_deferred_evaluation(self, job: dict):
+        """Worker-thread job: evaluate one queued answer; returns an ``llm.Evaluation`` or text."""
+        args = (self.client, job["question"], job["answer"], job["tech_context"], job["user_language"])
+        if job["structured"]:
+            return llm.request_structured_evaluation(
+                *args, question_number=job["question_number"], retries=EVAL_PARSE_RETRIES, phase="background",
+            )
+        return llm.request_evaluation(*args, phase="background")
+
+    def pending_futures(self, state) -> dict:
+        """{question number: Future} for every answer still waiting, including those of a resumed session."""
+        pending = dict(state.pending_evaluations)
+        for response in state.technical_responses:
+            number = response.get("question_number")
+            if response.get("evaluation_pending") and number not in pending:
+                pending[number] = self.eval_queue.lookup((state.session_id, number))
+        return pending
+
+    def evaluations_ready(self, state) -> bool:
+        """Whether a queued evaluation of this session can be collected now."""
+        return any(future is None or future.done() for future in self.pending_futures(state).values())
+
+    def await_evaluations(self, state, timeout: float = SUMMARY_WAIT):
+        """Wait up to ``timeout`` seconds for queued evaluations, so the summary can show them."""
+        if self.degraded():
+            return
+        futures = [f for f in self.pending_futures(state).values() if f is not None]
+        wait(futures, timeout=timeout)
+
+    def collect_evaluations(self, state) -> list:
+        """Attach finished queued evaluations to the session; returns [(question number, text)].
+
+        Structured results also go to ``state.evaluations``. An evaluation that
+        failed for good, or whose job was lost with an in-memory queue, is
+        attached as the "unavailable" message.
+        """
+        finished = {}
+        for number, future in self.pending_futures(state).items():
+            if future is not None and not future.done():
+                continue
+            state.pending_evaluations.pop(number, None)
+            self.eval_queue.forget((state.session_id, number))
+            result = self.future_result(future) if future is not None else None
+            if isinstance(result, llm.Evaluation):
+                state.evaluations.append(result)
+                result = result.to_markdown()
+            finished[number] = result or self.localize(state, "evaluation_unavailable")
+        if finished:
+            # A new list, so the session store saves the changed responses again
+            state.technical_responses = [
+                {**{k: v for k, v in response.items() if k != "evaluation_pending"},
+                 "evaluation": finished[response["question_number"]]}
+                if response.get("question_number") in finished else response
+                for response in state.technical_responses
+            ]
+        return sorted(finished.items())
+
+    def stats(self) -> dict:
+        return {
+            "language": language.stats(),
+            "dedup": dedup.stats(),
+            "validation": validation.stats(),
+            "catalog": self.catalog.stats(),
+            "router": self.client.router.stats() if getattr(self.client, "router", None) else {},
+            "breaker": self.client.breaker.stats() if getattr(self.client, "breaker", None) else {},
+            "question_pool": self.question_pool.stats(),
+            "evaluation_queue": self.eval_queue.stats(),
+            "question_bank": self.bank.stats() if self.bank is not None else {},
+        }
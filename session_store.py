@@ -0,0 +1,397 @@
+"""Durable interview sessions.
+
+``SessionStore.save`` is called after every turn and writes only what changed
+since the last save: new chat messages, new technical responses and
+evaluations, and the small state fields whose value changed. Nothing is ever
+rewritten. ``load`` replays the field deltas and fetches only the newest
+messages; older history stays in the store until ``load_history`` is asked
+for it.
+
+Backends:
+
+- ``SQLiteSessionStore`` (default): one database file, safe to share between
+  worker processes on one host.
+- ``FileSessionStore``: two JSONL files per session in a directory.
+- ``RedisSessionStore``: any client with the redis-py list API (``rpush``,
+  ``lrange``, ``llen``, ``expire``, ``delete``), for sharing sessions between
+  replicas.
+
+Sessions not written to for ``ttl`` seconds are purged. No backend is
+enabled by default (``TALENTSCOUT_SESSION_STORE=off``).
+"""
+
+import itertools
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+
+import history
+import llm
+
+# sqlite, file, redis or off. Off by default: a store keeps candidate data after the session
+# ends, which the privacy notice shown at consent has to allow for before it is turned on.
+BACKEND = os.getenv("TALENTSCOUT_SESSION_STORE", "off").lower()
+STORE_PATH = os.getenv("TALENTSCOUT_SESSION_STORE_PATH")
+SESSION_TTL = float(os.getenv("TALENTSCOUT_SESSION_TTL", str(24 * 3600)))
+
+# Scalar and small fields saved whole whenever their value changes
+FIELDS = (
+    "phase", "q_idx", "consent_given", "personal_step", "current_question", "total_questions",
+    "user_language", "candidate", "tech_questions", "ability",
+)
+# Lists saved as appended items; a list that was replaced is saved from index 0
+LISTS = ("technical_responses", "evaluations")
+
+
+def new_session_id() -> str:
+    return uuid.uuid4().hex
+
+
+def _field_value(state, name):
+    value = getattr(state, name)
+    return dict(value) if isinstance(value, dict) else list(value) if isinstance(value, list) else value
+
+
+def _list_item(name, item):
+    return item.to_row() if name == "evaluations" else item
+
+
+def _restore_item(name, item):
+    return llm.Evaluation(**item) if name == "evaluations" else item
+
+
+class SessionStore:
+    """Shared delta logic; subclasses implement the storage calls."""
+
+    def __init__(self, ttl: float = SESSION_TTL):
+        self.ttl = ttl
+
+    # Backend interface
+    def _append(self, session_id: str, delta: dict | None, messages: list, first_index: int):
+        raise NotImplementedError
+
+    def _deltas(self, session_id: str) -> list:
+        raise NotImplementedError
+
+    def message_count(self, session_id: str) -> int:
+        raise NotImplementedError
+
+    def messages(self, session_id: str, start: int, stop: int) -> list:
+        raise NotImplementedError
+
+    def delete(self, session_id: str):
+        raise NotImplementedError
+
+    def session_ids(self, since: float | None = None):
+        """Iterate over stored session ids, optionally only those written since ``since`` (epoch seconds)."""
+        raise NotImplementedError
+
+    def iter_messages(self, session_id: str, page: int = 500):
+        """Yield a session's messages, fetched ``page`` at a time."""
+        total = self.message_count(session_id)
+        for start in range(0, total, page):
+            yield from self.messages(session_id, start, min(start + page, total))
+
+    # Delta logic
+    def save(self, state):
+        """Write what changed since the last save or load of ``state``."""
+        if not state.session_id:
+            state.session_id = new_session_id()
+        cursor = state.persisted
+        saved_fields = cursor.setdefault("fields", {})
+
+        delta = {}
+        fields = {}
+        for name in FIELDS:
+            value = _field_value(state, name)
+            if name not in saved_fields or saved_fields[name] != value:
+                fields[name] = saved_fields[name] = value
+        asked = sorted(state.asked_questions)
+        if cursor.get("asked") != asked:
+            fields["asked_questions"] = cursor["asked"] = asked
+        if fields:
+            delta["fields"] = fields
+
+        for name in LISTS:
+            items = getattr(state, name)
+            seen = cursor.get(name)
+            # A list that was replaced (e.g. reset) is resent whole
+            start = seen[1] if seen is not None and seen[0] is items and seen[1] <= len(items) else 0
+            if start < len(items) or (start == 0 and seen is not None and seen[1]):
+                delta[name] = [start, [_list_item(name, item) for item in items[start:]]]
+            cursor[name] = (items, len(items))
+
+        saved_messages = cursor.get("messages", 0)
+        new_messages = [history.to_row(m) for m in state.messages[saved_messages - state.history_offset:]]
+        cursor["messages"] = state.history_offset + len(state.messages)
+
+        if delta or new_messages:
+            self._append(state.session_id, delta or None, new_messages, saved_messages)
+
+    def load(self, session_id: str, state_cls, tail: int = 20, with_messages: bool = True):
+        """Rebuild a session with only its newest ``tail`` messages (0 loads all), or None.
+
+        With ``with_messages=False`` no messages are fetched; use ``iter_messages``.
+        """
+        deltas = self._deltas(session_id)
+        if not deltas:
+            return None
+        state = state_cls(session_id=session_id)
+        for delta in deltas:
+            for name, value in delta.get("fields", {}).items():
+                setattr(state, name, set(value) if name == "asked_questions" else value)
+            for name in LISTS:
+                if name in delta:
+                    start, items = delta[name]
+                    getattr(state, name)[start:] = [_restore_item(name, item) for item in items]
+
+        total = self.message_count(session_id)
+        start = max(total - tail, 0) if tail else 0
+        if not with_messages:
+            start = total
+        state.messages = history.MessageLog(self.messages(session_id, start, total))
+        state.history_offset = start
+
+        cursor = state.persisted
+        cursor["fields"] = {name: _field_value(state, name) for name in FIELDS}
+        cursor["asked"] = sorted(state.asked_questions)
+        for name in LISTS:
+            items = getattr(state, name)
+            cursor[name] = (items, len(items))
+        cursor["messages"] = total
+        return state
+
+    def load_history(self, state):
+        """Prepend the messages ``load`` left in the store."""
+        if state.history_offset:
+            state.messages.prepend(self.messages(state.session_id, 0, state.history_offset))
+            state.history_offset = 0
+
+
+class SQLiteSessionStore(SessionStore):
+    def __init__(self, path: str = "talentscout_sessions.db", ttl: float = SESSION_TTL):
+        super().__init__(ttl)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, timeout=30)
+        with self._lock, self._db:
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute("PRAGMA synchronous=NORMAL")  # durable across app crashes; fsync at checkpoints
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS session_deltas ("
+                "session_id TEXT NOT NULL, seq INTEGER PRIMARY KEY AUTOINCREMENT, body TEXT NOT NULL, created REAL NOT NULL)"
+            )
+            self._db.execute("CREATE INDEX IF NOT EXISTS session_deltas_id ON session_deltas (session_id, seq)")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS session_messages ("
+                "session_id TEXT NOT NULL, idx INTEGER NOT NULL, body TEXT NOT NULL, PRIMARY KEY (session_id, idx))"
+            )
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS sessions (session_id TEXT PRIMARY KEY, updated REAL NOT NULL)"
+            )
+        self.purge()
+
+    def _append(self, session_id, delta, messages, first_index):
+        now = time.time()
+        with self._lock, self._db:
+            if delta:
+                self._db.execute(
+                    "INSERT INTO session_deltas (session_id, body, created) VALUES (?, ?, ?)",
+                    (session_id, json.dumps(delta, ensure_ascii=False), now),
+                )
+            self._db.executemany(
+                "INSERT OR REPLACE INTO session_messages (session_id, idx, body) VALUES (?, ?, ?)",
+                [(session_id, first_index + i, json.dumps(m, ensure_ascii=False)) for i, m in enumerate(messages)],
+            )
+            self._db.execute("INSERT OR REPLACE INTO sessions (session_id, updated) VALUES (?, ?)", (session_id, now))
+
+    def _deltas(self, session_id):
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT body FROM session_deltas WHERE session_id = ? ORDER BY seq", (session_id,)
+            ).fetchall()
+        return [json.loads(body) for (body,) in rows]
+
+    def message_count(self, session_id):
+        with self._lock:
+            return self._db.execute(
+                "SELECT COUNT(*) FROM session_messages WHERE session_id = ?", (session_id,)
+            ).fetchone()[0]
+
+    def messages(self, session_id, start, stop):
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT body FROM session_messages WHERE session_id = ? AND idx >= ? AND idx < ? ORDER BY idx",
+                (session_id, start, stop),
+            ).fetchall()
+        return [json.loads(body) for (body,) in rows]
+
+    def delete(self, session_id):
+        with self._lock, self._db:
+            for table in ("session_deltas", "session_messages", "sessions"):
+                self._db.execute(f"DELETE FROM {table} WHERE session_id = ?", (session_id,))
+
+    def session_ids(self, since=None):
+        last = ""
+        while True:
+            with self._lock:
+                rows = self._db.execute(
+                    "SELECT session_id FROM sessions WHERE session_id > ? AND updated >= ? ORDER BY session_id LIMIT 1000",
+                    (last, since or 0),
+                ).fetchall()
+            if not rows:
+                return
+            for (session_id,) in rows:
+                yield session_id
+            last = rows[-1][0]
+
+    def purge(self):
+        """Drop sessions that have not been written to within the TTL."""
+        cutoff = time.time() - self.ttl
+        with self._lock:
+            expired = [sid for (sid,) in self._db.execute("SELECT session_id FROM sessions WHERE updated < ?", (cutoff,))]
+        for session_id in expired:
+            self.delete(session_id)
+
+
+class FileSessionStore(SessionStore):
+    def __init__(self, directory: str = "talentscout_sessions", ttl: float = SESSION_TTL):
+        super().__init__(ttl)
+        self.directory = directory
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        self.purge()
+
+    def _path(self, session_id, kind):
+        if not session_id.isalnum():
+            raise ValueError("invalid session id")
+        return os.path.join(self.directory, f"{session_id}.{kind}.jsonl")
+
+    def _lines(self, session_id, kind):
+        """Yield the file's non-empty lines through one handle, up to its size when opened.
+
+        A line an ``_append`` is still writing is past that size, so it is never read half-written.
+        """
+        with self._lock:
+            try:
+                f = open(self._path(session_id, kind), "rb")
+            except FileNotFoundError:
+                return
+            size = os.fstat(f.fileno()).st_size
+        with f:
+            read = 0
+            for line in f:
+                read += len(line)
+                if read > size:
+                    break
+                if line.strip():
+                    yield line
+
+    def _read(self, session_id, kind):
+        return [json.loads(line) for line in self._lines(session_id, kind)]
+
+    def _append(self, session_id, delta, messages, first_index):
+        with self._lock:
+            if delta:
+                with open(self._path(session_id, "state"), "a", encoding="utf-8") as f:
+                    f.write(json.dumps(delta, ensure_ascii=False) + "\n")
+            if messages:
+                with open(self._path(session_id, "messages"), "a", encoding="utf-8") as f:
+                    f.writelines(json.dumps(m, ensure_ascii=False) + "\n" for m in messages)
+
+    def _deltas(self, session_id):
+        return self._read(session_id, "state")
+
+    def message_count(self, session_id):
+        return sum(1 for _ in self._lines(session_id, "messages"))
+
+    def messages(self, session_id, start, stop):
+        lines = itertools.islice(self._lines(session_id, "messages"), start, max(stop, start))
+        return [json.loads(line) for line in lines]
+
+    def iter_messages(self, session_id, page=500):
+        """Yield a session's messages in one pass over its file."""
+        for line in self._lines(session_id, "messages"):
+            yield json.loads(line)
+
+    def delete(self, session_id):
+        with self._lock:
+            for kind in ("state", "messages"):
+                try:
+                    os.remove(self._path(session_id, kind))
+                except FileNotFoundError:
+                    pass
+
+    def session_ids(self, since=None):
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(".messages.jsonl") and (since is None or entry.stat().st_mtime >= since):
+                    yield entry.name.split(".", 1)[0]
+
+    def purge(self):
+        cutoff = time.time() - self.ttl
+        for name in os.listdir(self.directory):
+            path = os.path.join(self.directory, name)
+            if name.endswith(".jsonl") and os.path.getmtime(path) < cutoff:
+                os.remove(path)
+
+
+class RedisSessionStore(SessionStore):
+    def __init__(self, client, prefix: str = "talentscout:session:", ttl: float = SESSION_TTL):
+        super().__init__(ttl)
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str, ttl: float = SESSION_TTL):
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError("TALENTSCOUT_SESSION_STORE=redis needs the redis package") from e
+        return cls(redis.Redis.from_url(url), ttl=ttl)
+
+    def _key(self, session_id, kind):
+        return f"{self.prefix}{session_id}:{kind}"
+
+    def _append(self, session_id, delta, messages, first_index):
+        ttl = int(self.ttl)
+        for kind, items in (("state", [delta] if delta else []), ("messages", messages)):
+            if items:
+                key = self._key(session_id, kind)
+                self.client.rpush(key, *(json.dumps(item, ensure_ascii=False) for item in items))
+                self.client.expire(key, ttl)
+
+    def _deltas(self, session_id):
+        return [json.loads(item) for item in self.client.lrange(self._key(session_id, "state"), 0, -1)]
+
+    def message_count(self, session_id):
+        return self.client.llen(self._key(session_id, "messages"))
+
+    def messages(self, session_id, start, stop):
+        if stop <= start:
+            return []
+        return [json.loads(item) for item in self.client.lrange(self._key(session_id, "messages"), start, stop - 1)]
+
+    def delete(self, session_id):
+        self.client.delete(self._key(session_id, "state"), self._key(session_id, "messages"))
+
+    def session_ids(self, since=None):
+        # Every write resets the TTL, so the remaining TTL dates the last write
+        cutoff = None if since is None else self.ttl - (time.time() - since)
+        for key in self.client.scan_iter(match=f"{self.prefix}*:state"):
+            key = key.decode() if isinstance(key, bytes) else key
+            if cutoff is None or self.client.ttl(key) >= cutoff:
+                yield key[len(self.prefix):-len(":state")]
+
+
+def from_env(backend: str = BACKEND, path: str | None = STORE_PATH):
+    """Store selected by TALENTSCOUT_SESSION_STORE, or None when it is "off"."""
+    if backend == "sqlite":
+        return SQLiteSessionStore(path or "talentscout_sessions.db")
+    if backend == "file":
+        return FileSessionStore(path or "talentscout_sessions")
+    if backend == "redis":
+        return RedisSessionStore.from_url(path or "redis://localhost:6379/0")
+    return None
@@ -0,0 +1,35 @@
+import pytest
+
+import adaptive
+
+
+def answer(scores, experience="5"):
+    ability = adaptive.initial(experience)
+    for score in scores:
+        difficulty, _ = adaptive.next_target(ability, [])
+        ability = adaptive.update(ability, score, difficulty, None)
+    return ability
+
+
+@pytest.mark.parametrize("scores", [[1.0, 0.0], [0.0, 1.0]])
+def test_contradictory_answers_keep_the_assessment_going(scores):
+    ability = answer(scores)
+    assert ability["sd"] <= 1.6  # the standard deviation alone would stop here
+    assert adaptive.residual(ability) > adaptive.MAX_RESIDUAL
+    assert not adaptive.is_confident(ability, 1.6)
+
+
+@pytest.mark.parametrize("scores", [[0.5, 0.55], [0.7, 0.65], [0.2, 0.25]])
+def test_consistent_answers_stop(scores):
+    assert adaptive.is_confident(answer(scores), 1.6)
+
+
+def test_level_follows_the_scores():
+    assert answer([0.9, 0.9])["level"] > answer([0.5, 0.5])["level"] > answer([0.1, 0.1])["level"]
+
+
+def test_estimate_records_scores_and_techs():
+    ability = adaptive.update(adaptive.initial("3"), 0.8, 3, "Python")
+    assert ability["answered"] == 1
+    assert ability["scores"] == [[3, 0.8]]
+    assert ability["techs"] == {"Python": [1, 0.8]}
@@ -0,0 +1,126 @@
+import functools
+import threading
+
+import pytest
+
+import eval_queue
+import i18n
+from engine import InterviewEngine, Reply, SessionState
+from services import InterviewServices
+
+
+class GatedEvaluate:
+    """Evaluation job that blocks until ``release()``, then answers with the question number."""
+
+    def __init__(self):
+        self.gate = threading.Event()
+
+    def __call__(self, job):
+        self.gate.wait(5)
+        return f"Evaluation of answer {job['question_number']}"
+
+    def release(self):
+        self.gate.set()
+
+
+@pytest.fixture
+def evaluate():
+    evaluate = GatedEvaluate()
+    yield evaluate
+    evaluate.release()
+
+
+def make_services(queue):
+    services = InterviewServices(None, stream=False, use_bank=False, eval_queue_mode="memory")
+    services.eval_queue = queue
+    return services
+
+
+def answered(phase="summary", number=1):
+    state = SessionState(session_id="session-1", phase=phase, q_idx=number)
+    state.technical_responses = [{"question_number": number, "question": "Q?", "answer": "A."}]
+    return state
+
+
+def replies(items):
+    return [item.collect() for item in items if isinstance(item, Reply)]
+
+
+def test_late_evaluation_is_attached_without_another_message(evaluate):
+    queue = eval_queue.EvaluationQueue(evaluate, workers=1)
+    services = make_services(queue)
+    engine = InterviewEngine(services)
+    state = answered()
+    services.defer_evaluation(state, "Q?", "A.", "Python")
+    future = state.pending_evaluations[1]
+    assert replies(engine.late_evaluations(state)) == []
+    assert not services.evaluations_ready(state)
+
+    evaluate.release()
+    future.result(5)
+    assert services.evaluations_ready(state)
+    shown = replies(engine.late_evaluations(state))
+    assert shown == ["Evaluation of answer 1"]
+    assert state.technical_responses[0]["evaluation"] == "Evaluation of answer 1"
+    assert "evaluation_pending" not in state.technical_responses[0]
+    assert state.pending_evaluations == {}
+    assert queue.lookup(("session-1", 1)) is None  # forgotten once collected
+
+
+def test_late_evaluations_wait_for_the_summary(evaluate):
+    services = make_services(eval_queue.EvaluationQueue(evaluate, workers=1))
+    state = answered(phase="technical_assessment")
+    services.defer_evaluation(state, "Q?", "A.", "Python")
+    evaluate.release()
+    state.pending_evaluations[1].result(5)
+    assert replies(InterviewEngine(services).late_evaluations(state)) == []
+    assert 1 in state.pending_evaluations
+
+
+def test_job_still_queued_elsewhere_is_not_dropped(evaluate, tmp_path):
+    path = str(tmp_path / "eval.db")
+    resumed = eval_queue.SQLiteEvaluationQueue(evaluate, path=path, workers=1)  # the replica the candidate returns to
+    worker = eval_queue.SQLiteEvaluationQueue(evaluate, path=path, workers=1)
+    future = worker.submit(("session-1", 1), {"question_number": 1})
+    services = make_services(resumed)
+    state = answered()
+    state.technical_responses[0]["evaluation_pending"] = True
+
+    assert services.collect_evaluations(state) == []
+    assert not resumed.lookup(("session-1", 1)).done()
+    assert state.technical_responses[0]["evaluation_pending"]
+
+    evaluate.release()
+    future.result(5)  # the row is written before the Future resolves
+    assert services.collect_evaluations(state) == [(1, "Evaluation of answer 1")]
+    assert resumed.lookup(("session-1", 1)) is None
+
+
+def summary(services, state):
+    services.await_evaluations = functools.partial(services.await_evaluations, timeout=0.05)
+    return replies(InterviewEngine(services).finish_technical(state))
+
+
+def test_summary_shows_evaluations_that_finished(evaluate):
+    services = make_services(eval_queue.EvaluationQueue(evaluate, workers=1))
+    state = answered(phase="technical_assessment")
+    services.defer_evaluation(state, "Q?", "A.", "Python")
+    evaluate.release()
+    shown = summary(services, state)
+    assert "Evaluation of answer 1" in shown
+    assert i18n.render("evaluations_pending", count=1) not in shown
+    assert state.phase == "completion" and state.pending_evaluations == {}
+
+
+def test_summary_promises_evaluations_still_running(evaluate):
+    services = make_services(eval_queue.EvaluationQueue(evaluate, workers=1))
+    state = answered(phase="technical_assessment")
+    services.defer_evaluation(state, "Q?", "A.", "Python")
+    shown = summary(services, state)
+    assert i18n.render("evaluations_pending", count=1) in shown
+    assert "Evaluation of answer 1" not in shown
+
+    evaluate.release()
+    state.pending_evaluations[1].result(5)
+    assert replies(InterviewEngine(services).late_evaluations(state)) == ["Evaluation of answer 1"]
+    assert state.technical_responses[0]["evaluation"] == "Evaluation of answer 1"
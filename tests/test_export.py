@@ -0,0 +1,65 @@
+import gzip
+import json
+
+import pytest
+
+import export
+import llm
+import session_store
+from engine import InterviewEngine, SessionState
+
+SCRIPT = [
+    "yes", "Ada Lovelace", "ada@example.com", "+44 20 7946 0000", "London, UK",
+    "5", "Backend Developer", "Python, Django", "English",
+    "A decorator wraps a function.", "Lists are mutable.",
+]
+
+
+def interview(script=SCRIPT):
+    state = SessionState()
+    engine = InterviewEngine()
+    engine.run_turn(state)
+    for user_input in script:
+        engine.run_turn(state, user_input)
+    return state
+
+
+@pytest.fixture(params=["sqlite", "file"])
+def store(request, tmp_path):
+    path = tmp_path / ("sessions.db" if request.param == "sqlite" else "sessions")
+    return session_store.from_env(request.param, str(path))
+
+
+def test_txt_carries_evaluations():
+    state = interview()
+    state.evaluations = [llm.Evaluation(1, 7, 6, 8, 7, "Clear, but no example.")]
+    state.technical_responses[1]["evaluation"] = "Queued evaluation text."
+    text = export.to_bytes(state, "txt").decode("utf-8")
+    assert "Scores (accuracy/completeness/clarity/correctness): 7 / 6 / 8 / 7" in text
+    assert "Feedback: Clear, but no example." in text
+    assert "Evaluation:\nQueued evaluation text." in text
+    records = json.loads(export.to_bytes(state, "json"))["technical_responses"]
+    assert records[0]["evaluation"]["feedback"] == "Clear, but no example."
+    assert records[1]["evaluation"] == "Queued evaluation text."
+
+
+@pytest.mark.parametrize("fmt", ["jsonl", "json", "txt"])
+def test_bulk_export_streams_every_session(store, tmp_path, fmt):
+    states = [interview(), interview(SCRIPT[:4])]
+    for state in states:
+        store.save(state)
+    path = tmp_path / f"sessions.{fmt}.gz"
+    assert export.bulk_export(store, str(path), fmt) == 2
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        data = f.read()
+    if fmt == "jsonl":
+        records = [json.loads(line) for line in data.splitlines()]
+        for state in states:
+            messages = [r for r in records if r["record"] == "message" and r["session_id"] == state.session_id]
+            assert [m["content"] for m in messages] == [m["content"] for m in state.messages]
+    elif fmt == "json":
+        sessions = {session["session_id"]: session for session in json.loads(data)}
+        for state in states:
+            assert len(sessions[state.session_id]["messages"]) == len(state.messages)
+    else:
+        assert data.count("END OF SESSION EXPORT") == 2
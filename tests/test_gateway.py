@@ -0,0 +1,120 @@
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from groq import APIStatusError
+
+import async_llm
+import breaker
+import llm
+import router
+
+
+def unavailable():
+    request = httpx.Request("POST", "http://groq.test/chat/completions")
+    return APIStatusError("unavailable", response=httpx.Response(503, request=request), body=None)
+
+
+def reply(text="ok"):
+    return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=text))], usage=None)
+
+
+class FakeCompletions:
+    """Fails ``failures`` times with a 503, then answers; records the model of every attempt."""
+
+    def __init__(self, failures=0, is_async=False):
+        self.failures = failures
+        self.is_async = is_async
+        self.models = []
+
+    def _answer(self, kwargs):
+        self.models.append(kwargs.get("model"))
+        if len(self.models) <= self.failures:
+            raise unavailable()
+        return reply()
+
+    def create(self, timeout=None, **kwargs):
+        if self.is_async:
+            async def answer():
+                return self._answer(kwargs)
+            return answer()
+        return self._answer(kwargs)
+
+
+def make_gateway(gateway_cls, failures=0, **kwargs):
+    gateway = gateway_cls(api_key="test", backoff_base=0.001, backoff_cap=0.001, **kwargs)
+    completions = FakeCompletions(failures, is_async=gateway_cls is async_llm.AsyncLLMGateway)
+    gateway.client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return gateway, completions
+
+
+GATEWAYS = [llm.LLMGateway, async_llm.AsyncLLMGateway]
+
+
+@pytest.mark.parametrize("gateway_cls", GATEWAYS)
+def test_retries_until_the_call_succeeds(gateway_cls):
+    gateway, completions = make_gateway(gateway_cls, failures=2, max_retries=3)
+    response = gateway.create(task="question", model="m", messages=[])
+    assert response.choices[0].message.content == "ok"
+    assert len(completions.models) == 3
+
+
+@pytest.mark.parametrize("gateway_cls", GATEWAYS)
+def test_gives_up_after_max_retries_and_tells_the_breaker(gateway_cls):
+    circuit = breaker.CircuitBreaker(failures=1, reset_after=60)
+    gateway, completions = make_gateway(gateway_cls, failures=10, max_retries=1, breaker=circuit)
+    with pytest.raises(APIStatusError):
+        gateway.create(task="question", model="m", messages=[])
+    assert len(completions.models) == 2
+    assert circuit.is_open()
+    with pytest.raises(breaker.CircuitOpen):
+        gateway.create(task="question", model="m", messages=[])
+    assert len(completions.models) == 2
+
+
+@pytest.mark.parametrize("gateway_cls", GATEWAYS)
+def test_fails_over_to_the_next_model(gateway_cls):
+    routes = router.ModelRouter(tiers={"large": ["primary", "backup"]}, task_tiers={"question": "large"})
+    gateway, completions = make_gateway(gateway_cls, failures=1, router=routes)
+    gateway.create(task="question", model="-", messages=[])
+    assert completions.models == ["primary", "backup"]
+
+
+def test_async_gateway_shares_the_base_setup():
+    gateway, _ = make_gateway(async_llm.AsyncLLMGateway, max_retries=5, timeout=7.0)
+    assert (gateway.max_retries, gateway.timeout, gateway.chat) == (5, 7.0, gateway)
+    assert isinstance(gateway._slots, asyncio.Semaphore)
+    assert gateway.submit(gateway.acreate(task="question", model="m", messages=[])).result().usage is None
+
+
+def test_deadline_spent_waiting_for_a_slot_is_not_an_api_failure():
+    circuit = breaker.CircuitBreaker(failures=1, reset_after=60)
+    gateway, completions = make_gateway(llm.LLMGateway, breaker=circuit, max_inflight=1)
+    gateway._slots.acquire()  # another call holds the only slot
+    with pytest.raises(llm.GatewayTimeout):
+        gateway.create(task="question", model="m", messages=[], deadline=0.05)
+    assert completions.models == []
+    assert circuit.stats()["state"] == "closed" and circuit.stats()["consecutive_failures"] == 0
+
+
+def test_released_probe_lets_the_next_call_probe():
+    circuit = breaker.CircuitBreaker(failures=1, reset_after=0)
+    circuit.failure()
+    assert circuit.allow() and not circuit.allow()
+    circuit.release()
+    assert circuit.allow()
+
+
+@pytest.mark.parametrize("headers, expected", [
+    ({"retry-after": "3"}, 3.0),
+    ({"retry-after-ms": "1500"}, 1.5),
+    ({"retry-after": "Thu, 01 Jan 1970 00:00:00 GMT"}, 0.0),
+    ({"retry-after": "soon"}, None),
+    ({"retry-after": "Mon, 99 Foo 2024"}, None),
+    ({}, None),
+])
+def test_retry_after_headers(headers, expected):
+    request = httpx.Request("POST", "http://groq.test/chat/completions")
+    error = APIStatusError("busy", response=httpx.Response(429, request=request, headers=headers), body=None)
+    assert llm._retry_after(error) == expected
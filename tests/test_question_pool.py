@@ -0,0 +1,26 @@
+import i18n
+import question_pool
+
+
+def make_pool():
+    pool = question_pool.QuestionPool(path=None)
+    pool.add("Python", "mid", "English", "What does a decorator do?")
+    return pool
+
+
+def test_draw_falls_back_to_english_by_default():
+    assert make_pool().draw(["Python"], 5, "Spanish") == "What does a decorator do?"
+
+
+def test_draw_stays_in_the_session_language_without_fallback():
+    pool = make_pool()
+    assert pool.draw(["Python"], 5, "Spanish", fallback_language=None) is None
+    assert pool.draw(["Python"], 5, "English", fallback_language=None) == "What does a decorator do?"
+
+
+def test_catalog_reports_translated_strings():
+    catalog = i18n.Catalog(path=None)
+    assert catalog.is_translated("fallback_question", "English")
+    assert not catalog.is_translated("fallback_question", "Spanish")
+    catalog.load("Spanish", lambda strings, language: {key: f"[es] {text}" for key, text in strings.items()})
+    assert catalog.is_translated("fallback_question", "Spanish")
@@ -0,0 +1,94 @@
+import json
+import threading
+import time
+from types import SimpleNamespace
+
+import llm
+import rescore
+import router
+
+EVALUATION = json.dumps({
+    "technical_accuracy": 7, "completeness": 6, "clarity": 8, "correctness": 7, "feedback": "Solid.",
+})
+
+
+class FakeClient:
+    """Chat client answering every evaluation, as ``served_by`` when set (a routed failover)."""
+
+    def __init__(self, served_by=None, router=None):
+        self.served_by = served_by
+        self.router = router
+        self.calls = 0
+        self._lock = threading.Lock()
+        self.chat = SimpleNamespace(completions=self)
+
+    def create(self, **kwargs):
+        with self._lock:
+            self.calls += 1
+        return SimpleNamespace(
+            model=self.served_by or kwargs["model"],
+            choices=[SimpleNamespace(message=SimpleNamespace(content=EVALUATION))], usage=None,
+        )
+
+
+def answers(count, session_id="s1"):
+    return [rescore.Answer(session_id, number, f"Q{number}?", f"A{number}.", "Python", "English")
+            for number in range(1, count + 1)]
+
+
+def write_export(path, lines):
+    path.write_text("".join(json.dumps(line) + "\n" for line in lines), encoding="utf-8")
+    return str(path)
+
+
+def test_response_before_any_session_record(tmp_path):
+    path = write_export(tmp_path / "export.jsonl", [
+        {"record": "response", "question_number": 1, "question": "Q?", "answer": "A."},
+        {"record": "session", "session_id": "s1", "candidate": {"tech_stack": "Go"}, "language": "Spanish"},
+        {"record": "response", "session_id": "s1", "question_number": 1, "question": "Q?", "answer": "A."},
+    ])
+    orphan, answer = rescore.iter_export_answers(path)
+    assert (orphan.tech_context, orphan.user_language) == ("", "English")
+    assert (answer.tech_context, answer.user_language) == ("Go", "Spanish")
+
+
+def test_resumes_from_the_checkpoint(tmp_path):
+    out = str(tmp_path / "scores.jsonl")
+    client = FakeClient()
+    first = rescore.run(answers(3), out, client, workers=2, progress_every=0)
+    assert (first["scored"], first["skipped"]) == (3, 0)
+    with open(out, "a", encoding="utf-8") as f:
+        f.write('{"session_id": "s1", "question_nu')  # cut short by an interrupted run
+    second = rescore.run(answers(5), out, client, workers=2, progress_every=0)
+    assert (second["scored"], second["skipped"]) == (2, 3)
+    assert client.calls == 5
+    assert len(rescore.load_checkpoint(out, {rescore.rubric_id()})) == 5
+
+
+def test_rubric_follows_the_model_that_served_the_call(tmp_path):
+    out = str(tmp_path / "scores.jsonl")
+    routes = router.ModelRouter(tiers={"large": [llm.MODEL, "backup"]}, task_tiers={"evaluation": "large"})
+    client = FakeClient(served_by="backup", router=routes)
+    rescore.run(answers(2), out, client, workers=1, progress_every=0)
+    with open(out, encoding="utf-8") as f:
+        records = [json.loads(line) for line in f]
+    assert {(r["model"], r["rubric"]) for r in records} == {("backup", rescore.rubric_id("backup"))}
+    assert rescore.run(answers(2), out, client, workers=1, progress_every=0)["skipped"] == 2
+    # Without routing only the primary's rubric counts, so the backup's scores are redone
+    assert rescore.run(answers(2), out, FakeClient(), workers=1, progress_every=0)["scored"] == 2
+
+
+def test_rate_limiter_paces_requests():
+    limiter = rescore.RateLimiter(rpm=600)  # 10 per second, one second of burst
+    started = time.monotonic()
+    for _ in range(15):
+        limiter.acquire()
+    assert 0.4 <= time.monotonic() - started < 1.5
+
+
+def test_rate_limiter_paces_tokens():
+    limiter = rescore.RateLimiter(rpm=60000, tpm=60000)  # 1000 tokens per second
+    started = time.monotonic()
+    for _ in range(3):
+        limiter.acquire(tokens=500)
+    assert 0.4 <= time.monotonic() - started < 1.5
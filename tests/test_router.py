@@ -0,0 +1,36 @@
+import router
+
+TIERS = {"small": ["fast", "backup"], "large": ["big"]}
+
+
+def make_router():
+    return router.ModelRouter(tiers=TIERS, slos={"small": 1.0, "large": 4.0})
+
+
+def test_long_non_streamed_calls_are_not_held_to_the_slo():
+    routes = make_router()
+    for _ in range(router.MIN_SAMPLES + 2):
+        routes.observe("fast", "small", 2.6, completion_tokens=3000, streamed=False)
+    assert routes.plan("translation", "-")[1][0] == "fast"
+
+
+def test_slow_short_calls_fail_over():
+    routes = make_router()
+    for _ in range(router.MIN_SAMPLES):
+        routes.observe("fast", "small", 2.0, completion_tokens=5, streamed=False)
+    tier, models, route = routes.plan("consent", "-")
+    assert (tier, models[0], route) == ("small", "backup", "failover_slow")
+
+
+def test_slow_streams_fail_over_whatever_their_length():
+    routes = make_router()
+    for _ in range(router.MIN_SAMPLES):
+        routes.observe("fast", "small", 2.0, completion_tokens=3000, streamed=True)
+    assert routes.plan("consent", "-")[1][0] == "backup"
+
+
+def test_routing_is_opt_in(monkeypatch):
+    monkeypatch.delenv("TALENTSCOUT_ROUTING", raising=False)
+    assert router.ModelRouter.from_env() is None
+    monkeypatch.setenv("TALENTSCOUT_ROUTING", "1")
+    assert isinstance(router.ModelRouter.from_env(), router.ModelRouter)
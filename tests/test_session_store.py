@@ -0,0 +1,115 @@
+import pytest
+
+import session_store
+from engine import InterviewEngine, SessionState
+
+SCRIPT = [
+    "yes", "Ada Lovelace", "ada@example.com", "+44 20 7946 0000", "London, UK",
+    "5", "Backend Developer", "Python, Django", "English",
+    "A decorator wraps a function.", "Lists are mutable.",
+]
+
+
+@pytest.fixture(params=["sqlite", "file"])
+def store(request, tmp_path):
+    path = tmp_path / ("sessions.db" if request.param == "sqlite" else "sessions")
+    return session_store.from_env(request.param, str(path))
+
+
+def rows(messages):
+    return [(m["role"], m["content"], m["avatar"], m["timestamp"]) for m in messages]
+
+
+def play(store, state, inputs, engine=InterviewEngine()):
+    for user_input in inputs:
+        engine.run_turn(state, user_input)
+        store.save(state)
+
+
+def started(store):
+    state = SessionState()
+    InterviewEngine().run_turn(state)
+    store.save(state)
+    return state
+
+
+def test_load_replays_deltas(store):
+    state = started(store)
+    play(store, state, SCRIPT)
+    loaded = store.load(state.session_id, SessionState, tail=0)
+    for name in session_store.FIELDS:
+        assert getattr(loaded, name) == getattr(state, name), name
+    assert loaded.asked_questions == state.asked_questions
+    assert loaded.technical_responses == state.technical_responses
+    assert rows(loaded.messages) == rows(state.messages)
+    assert loaded.history_offset == 0
+
+
+def test_load_tail_and_history(store):
+    state = started(store)
+    play(store, state, SCRIPT)
+    total = len(state.messages)
+    loaded = store.load(state.session_id, SessionState, tail=5)
+    assert loaded.history_offset == total - 5
+    assert rows(loaded.messages) == rows(state.messages[-5:])
+    store.load_history(loaded)
+    assert loaded.history_offset == 0
+    assert rows(loaded.messages) == rows(state.messages)
+
+
+def test_resumed_session_saves_only_new_turns(store):
+    state = started(store)
+    play(store, state, SCRIPT[:-1])
+    resumed = store.load(state.session_id, SessionState, tail=3)
+    play(store, resumed, SCRIPT[-1:])
+    InterviewEngine().run_turn(state, SCRIPT[-1])  # the same turn on the original, unsaved
+    assert store.message_count(state.session_id) == len(state.messages)
+    again = store.load(state.session_id, SessionState, tail=0)
+    assert [m["content"] for m in again.messages] == [m["content"] for m in state.messages]
+    assert again.technical_responses == resumed.technical_responses
+    assert again.q_idx == resumed.q_idx
+
+
+def test_replaced_list_is_saved_whole(store):
+    state = started(store)
+    play(store, state, SCRIPT)
+    state.technical_responses = state.technical_responses[:1]
+    store.save(state)
+    assert store.load(state.session_id, SessionState).technical_responses == state.technical_responses
+
+
+def test_unknown_session_and_off(store):
+    assert store.load("missing", SessionState) is None
+    assert session_store.from_env("off") is None
+
+
+def test_pages_and_iteration(store):
+    state = started(store)
+    play(store, state, SCRIPT)
+    assert rows(store.messages(state.session_id, 3, 7)) == rows(state.messages[3:7])
+    assert store.messages(state.session_id, 7, 3) == []
+    assert rows(store.iter_messages(state.session_id, page=4)) == rows(state.messages)
+
+
+def test_file_store_iterates_in_one_pass(tmp_path, monkeypatch):
+    store = session_store.FileSessionStore(str(tmp_path))
+    state = started(store)
+    play(store, state, SCRIPT)
+    opened = []
+    real_open = open
+
+    def counting_open(path, *args, **kwargs):
+        opened.append(path)
+        return real_open(path, *args, **kwargs)
+
+    monkeypatch.setattr("builtins.open", counting_open)
+    assert len(list(store.iter_messages(state.session_id, page=2))) == len(state.messages)
+    assert len(opened) == 1
+
+
+def test_delete(store):
+    state = started(store)
+    play(store, state, SCRIPT[:3])
+    store.delete(state.session_id)
+    assert store.load(state.session_id, SessionState) is None
+    assert store.message_count(state.session_id) == 0
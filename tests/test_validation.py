@@ -0,0 +1,74 @@
+import pytest
+
+import validation
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("yes", True), ("Yes please", True), ("y", True), ("sure", True), ("Of course!", True), ("I agree", True),
+    ("Yes I agree to the policy", True), ("Sí", True), ("oui", True), ("да", True), ("はい", True), ("네", True),
+    ("no", False), ("n", False), ("nope", False), ("No thanks", False), ("no thank you", False), ("nein", False),
+    ("нет", False), ("いいえ", False), ("不要", False),
+    # affirmative idioms built from a negation
+    ("no problem", None), ("No problem!", None), ("why not", None), ("sure, no problem", None),
+    ("pourquoi pas", None), ("no worries", None),
+    # a negation inside a longer reply is not read as "no"
+    ("I do not consent", None), ("no, I don't want to", None),
+    ("yeah no", None), ("not sure", None), ("of course not", None), ("maybe later", None), ("what data?", None),
+    ("", None),
+])
+def test_parse_yes_no(text, expected):
+    assert validation.parse_yes_no(text) is expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Python, Django, PostgreSQL", ["Python", "Django", "PostgreSQL"]),
+    ("js, react/redux and node", ["JavaScript", "React", "Redux", "Node.js"]),
+    ("ruby on rails & postgres", ["Ruby on Rails", "PostgreSQL"]),
+    ("I know python and some golang", ["Python", "Go"]),
+    ("C#, asp.net core, SQL Server", ["C#", ".NET", "SQL Server"]),
+    ("k8s; terraform | aws", ["Kubernetes", "Terraform", "AWS"]),
+    ("Elixir, Phoenix", ["Elixir", "Phoenix"]),
+    ("some elixir and more", ["elixir"]),
+    # prose around known technologies is dropped; product-like names are kept
+    ("I have experience in React and Go", ["React", "Go"]),
+    ("I mainly do data science with pandas", ["Pandas"]),
+    ("React with GraphQL and Apache Beam", ["React", "GraphQL", "Apache Beam"]),
+    ("python and d3.js", ["Python", "d3.js"]),
+    # aliases that are everyday words count in lists, not inside sentences
+    ("Python, Go", ["Python", "Go"]), ("Python Go Rust", ["Python", "Go", "Rust"]),
+    ("I go to work with python", ["Python"]), ("Python for the rest of it", ["Python"]),
+    ("python, and next I want to learn rust", ["Python", "Rust"]), ("Next.js and rest api", ["Next.js", "REST"]),
+    ("c, c++ and r", ["C", "C++", "R"]),
+    # no stack at all
+    ("n/a", []), ("None", []), ("nothing", []), ("N/A.", []),
+    # prose naming no known technology is left for Groq
+    ("mostly backend things in the JVM world", None),
+    ("React, Python, I also enjoy hiking on weekends", None),
+    ("", None),
+])
+def test_parse_tech_stack(text, expected):
+    assert validation.parse_tech_stack(text) == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("ada@example.com", "ada@example.com"),
+    ("it's Ada.L+jobs@mail.co.uk.", "Ada.L+jobs@mail.co.uk"),
+    ("first.last@sub.example.org", "first.last@sub.example.org"),
+    ("a@b", None), ("ada at example dot com", None), ("", None),
+])
+def test_parse_email(text, expected):
+    assert validation.parse_email(text) == expected
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("+44 20 7946 0000", "+44 20 7946 0000"),
+    ("(555) 123-4567", "(555) 123-4567"),
+    ("555.123.4567", "555.123.4567"),
+    ("+91 98765 43210", "+91 98765 43210"),
+    ("+1 555 1234", "+1 555 1234"),
+    ("born 2024-01-01, call +44 20 7946 0000", "+44 20 7946 0000"),
+    ("2024-01-01", None), ("01/02/2024", None), ("1.2.24", None),
+    ("555-1234", None), ("12345", None), ("call me", None), ("", None),
+])
+def test_parse_phone(text, expected):
+    assert validation.parse_phone(text) == expected
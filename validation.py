@@ -0,0 +1,340 @@
+"""Local validation and normalization of candidate input.
+
+Everything here runs without a network call:
+
+- ``parse_email`` and ``parse_phone`` use precompiled patterns and also
+  accept an address or number inside a sentence ("it's ada@example.com").
+- ``parse_yes_no`` reads consent replies from multilingual yes/no lexicons.
+- ``parse_tech_stack`` splits a stack on commas, slashes, "and" and the like,
+  and maps aliases to canonical names ("JS", "javascript" -> "JavaScript")
+  with a word trie, so multi-word names like "ruby on rails" or "node js"
+  match as one. Aliases that are also everyday words ("go", "rest",
+  "next") only count in a list, not inside a sentence ("I go to work").
+
+The yes/no and tech-stack parsers return None when the input is ambiguous
+("yeah no", "why not", a sentence naming no known technology). Services then
+ask Groq for just those inputs. A reply is only read as "no" when it is short
+or a known refusal, because "no" ends the session. Words around known
+technologies are dropped unless they look like product names ("Elixir",
+"GraphQL", "d3.js"), so prose never comes back as a technology.
+"""
+
+import re
+import threading
+
+from language import normalize
+
+EMAIL = re.compile(
+    r"(?<![\w.+-])[A-Za-z0-9!#$%&'*+/=?^_`{|}~-]+(?:\.[A-Za-z0-9!#$%&'*+/=?^_`{|}~-]+)*"
+    r"@(?:[A-Za-z0-9](?:[A-Za-z0-9-]{0,61}[A-Za-z0-9])?\.)+[A-Za-z]{2,63}(?![\w-])"
+)
+# Optional +country code, then digits in groups separated by spaces, dots, dashes or parentheses
+PHONE = re.compile(r"(?<![\w+])\+?\(?\d[\d\s().-]{5,22}\d(?!\w)")
+PHONE_DIGITS = (7, 15)  # E.164 allows at most 15 digits
+PHONE_LOCAL_DIGITS = 8  # fewest digits without a leading +
+# 2024-01-01, 01/02/2024, 1.2.24
+DATE = re.compile(r"\d{4}[-/.]\d{1,2}[-/.]\d{1,2}|\d{1,2}[-/.]\d{1,2}[-/.]\d{2,4}")
+
+YES = {
+    "y", "yes", "yeah", "yea", "yep", "yup", "sure", "ok", "okay", "of course", "certainly", "absolutely",
+    "agree", "i agree", "consent", "i consent", "accept", "i accept", "go ahead", "proceed", "affirmative",
+    "si", "claro", "vale", "de acuerdo", "acepto", "oui", "d accord", "j accepte", "ja", "jawohl", "einverstanden",
+    "sim", "claro que sim", "concordo", "certo", "va bene", "accetto", "да", "конечно", "согласен", "согласна",
+    "tak", "evet", "kabul", "ano", "igen", "nai", "ναι", "haan", "han", "ha", "हा", "जी", "जी हा", "ठीक है",
+    "はい", "ええ", "同意", "是", "是的", "好", "好的", "可以", "对", "네", "예", "동의", "نعم", "أوافق", "כן",
+    "ya", "iya", "setuju", "vâng", "co", "ndiyo",
+}
+NO = {
+    "n", "no", "nope", "nah", "not", "never", "no thanks", "no thank you", "disagree", "i disagree", "decline",
+    "i decline", "refuse", "reject", "don t", "do not", "dont", "not really",
+    "non", "pas d accord", "je refuse", "nein", "nicht", "nao", "não", "nunca", "no acepto", "нет", "не",
+    "nie", "hayir", "hayır", "ne", "nem", "ochi", "όχι", "nahi", "nahin", "नही", "नहि", "いいえ", "いや",
+    "不", "不是", "不要", "不同意", "아니요", "아니", "لا", "לא", "tidak", "khong", "không", "hapana",
+}
+# Affirmative idioms built from a negation; their replies are left for Groq
+NEGATED_YES = {
+    "no problem", "not a problem", "no worries", "why not", "no objection", "no objections", "don t mind",
+    "dont mind", "pourquoi pas", "pas de probleme", "por que no", "sin problema", "ningun problema",
+    "warum nicht", "kein problem", "perche no", "nessun problema", "sem problema", "por que nao",
+}
+# Words in a reply that may still be read as a plain "no"
+NO_MAX_WORDS = 2
+_YES = {normalize(word) for word in YES}
+_NO = {normalize(word) for word in NO}
+
+# Canonical name -> aliases; names and aliases are matched case-insensitively as word sequences
+TECHNOLOGIES = {
+    "Python": ["py", "python3", "python 3", "cpython"],
+    "JavaScript": ["js", "javascript", "java script", "ecmascript", "es6", "vanilla js"],
+    "TypeScript": ["ts", "typescript"],
+    "Java": ["java"],
+    "Kotlin": ["kotlin"],
+    "Scala": ["scala"],
+    "Go": ["go", "golang"],
+    "Rust": ["rust"],
+    "C": ["c"],
+    "C++": ["c++", "cpp", "cplusplus"],
+    "C#": ["c#", "csharp", "c sharp"],
+    ".NET": [".net", "dotnet", "dot net", ".net core", "asp.net", "asp.net core"],
+    "PHP": ["php"],
+    "Ruby": ["ruby"],
+    "Ruby on Rails": ["rails", "ror", "ruby on rails"],
+    "Swift": ["swift"],
+    "Objective-C": ["objective-c", "objective c", "objc"],
+    "Dart": ["dart"],
+    "Flutter": ["flutter"],
+    "R": ["r"],
+    "SQL": ["sql"],
+    "Bash": ["bash", "shell", "shell scripting", "sh"],
+    "HTML": ["html", "html5"],
+    "CSS": ["css", "css3"],
+    "Sass": ["sass", "scss"],
+    "Tailwind CSS": ["tailwind", "tailwindcss", "tailwind css"],
+    "React": ["react", "reactjs", "react.js", "react js"],
+    "React Native": ["react native", "react-native"],
+    "Next.js": ["next", "nextjs", "next.js", "next js"],
+    "Vue.js": ["vue", "vuejs", "vue.js", "vue js"],
+    "Nuxt": ["nuxt", "nuxtjs", "nuxt.js"],
+    "Angular": ["angular", "angularjs", "angular.js"],
+    "Svelte": ["svelte", "sveltekit"],
+    "Redux": ["redux"],
+    "Node.js": ["node", "nodejs", "node.js", "node js"],
+    "Express": ["express", "expressjs", "express.js"],
+    "NestJS": ["nest", "nestjs", "nest.js"],
+    "Django": ["django"],
+    "Flask": ["flask"],
+    "FastAPI": ["fastapi", "fast api"],
+    "Spring": ["spring", "spring framework"],
+    "Spring Boot": ["spring boot", "springboot"],
+    "Laravel": ["laravel"],
+    "Pandas": ["pandas"],
+    "NumPy": ["numpy"],
+    "scikit-learn": ["sklearn", "scikit-learn", "scikit learn"],
+    "TensorFlow": ["tensorflow", "tf"],
+    "PyTorch": ["pytorch", "torch"],
+    "Spark": ["spark", "apache spark", "pyspark"],
+    "Hadoop": ["hadoop"],
+    "PostgreSQL": ["postgres", "postgresql", "psql", "pg"],
+    "MySQL": ["mysql"],
+    "MariaDB": ["mariadb"],
+    "SQLite": ["sqlite", "sqlite3"],
+    "SQL Server": ["sql server", "mssql", "ms sql"],
+    "Oracle": ["oracle", "oracle db", "plsql", "pl/sql"],
+    "MongoDB": ["mongo", "mongodb"],
+    "Redis": ["redis"],
+    "Cassandra": ["cassandra"],
+    "Elasticsearch": ["elasticsearch", "elastic search", "elastic", "opensearch"],
+    "DynamoDB": ["dynamodb", "dynamo"],
+    "Kafka": ["kafka", "apache kafka"],
+    "RabbitMQ": ["rabbitmq", "rabbit mq", "rabbit"],
+    "GraphQL": ["graphql", "graph ql"],
+    "REST": ["rest", "rest api", "restful", "rest apis"],
+    "gRPC": ["grpc"],
+    "Docker": ["docker", "containers"],
+    "Kubernetes": ["kubernetes", "k8s", "kube"],
+    "Helm": ["helm"],
+    "Terraform": ["terraform", "tf cloud"],
+    "Ansible": ["ansible"],
+    "AWS": ["aws", "amazon web services"],
+    "Azure": ["azure", "microsoft azure"],
+    "GCP": ["gcp", "google cloud", "google cloud platform"],
+    "Linux": ["linux", "unix"],
+    "Git": ["git", "github", "gitlab"],
+    "CI/CD": ["ci/cd", "cicd", "ci", "cd"],
+    "Jenkins": ["jenkins"],
+    "GitHub Actions": ["github actions", "gh actions"],
+    "Nginx": ["nginx"],
+    "Android": ["android"],
+    "iOS": ["ios"],
+    "Unity": ["unity", "unity3d"],
+    "Figma": ["figma"],
+}
+
+# One-word aliases that are also everyday words; kept only when nothing but technologies surrounds them
+AMBIGUOUS = {
+    "go", "rest", "next", "node", "express", "spring", "shell", "sh", "elastic", "rabbit", "nest", "swift",
+    "unity", "containers", "torch", "r", "c", "ci", "cd", "tf", "pg",
+}
+# Replies saying the candidate has no stack to list
+NO_TECH = {
+    "none", "n a", "na", "nothing", "nil", "no", "not applicable", "nothing yet", "none yet", "no tech",
+    "ninguno", "ninguna", "nada", "aucun", "aucune", "rien", "keine", "nichts", "nenhum", "nenhuma", "nessuno",
+}
+
+# Leftover words that are not technologies ("I know python and some go")
+_FILLER = {
+    "i", "im", "i m", "am", "my", "and", "or", "also", "with", "in", "on", "of", "the", "a", "an", "some", "bit",
+    "know", "use", "used", "using", "work", "worked", "working", "experience", "experienced", "years", "year",
+    "mostly", "mainly", "plus", "etc", "like", "good", "basic", "advanced", "familiar", "skills", "stack", "tech",
+    "frameworks", "framework", "languages", "language", "tools", "databases", "database", "e", "y", "und", "et",
+    "more", "other", "others", "stuff", "things", "lot", "lots",
+}
+# Product-name shapes among leftover words: an inner capital, a digit, or + # .
+_PRODUCT_SHAPE = re.compile(r".+[A-Z]|.*[\d+#.]")
+
+_SEPARATORS = re.compile(r"\s*(?:[,;|\n]|\s(?:and|&|und|y|et|e|plus)\s)\s*", re.IGNORECASE)
+_TECH_TOKEN = re.compile(r"[\w+#.-]+")
+
+_lock = threading.Lock()
+_counters = {"yes_no_local": 0, "yes_no_ambiguous": 0, "tech_stack_local": 0, "tech_stack_ambiguous": 0}
+_NO_TECH = {normalize(word) for word in NO_TECH}
+
+
+def _count(name: str):
+    with _lock:
+        _counters[name] += 1
+
+
+def _tech_tokens(text: str) -> list:
+    """(normalized, original) word pairs; dots, pluses, hashes and hyphens stay inside words."""
+    tokens = []
+    for match in _TECH_TOKEN.finditer(text):
+        word = match.group(0)
+        word = word.rstrip(".-") if word.startswith(".") else word.strip(".-")  # keep the dot in ".net"
+        if word:
+            tokens.append((word.casefold(), word))
+    return tokens
+
+
+def _build_trie():
+    trie = {}
+    for name, aliases in TECHNOLOGIES.items():
+        for alias in [name, *aliases]:
+            node = trie
+            for word, _ in _tech_tokens(alias):
+                node = node.setdefault(word, {})
+            node[None] = name  # None marks the end of an alias
+    return trie
+
+
+TECH_TRIE = _build_trie()
+
+
+def parse_email(text: str) -> str | None:
+    match = EMAIL.search(text or "")
+    return match.group(0) if match else None
+
+
+def parse_phone(text: str) -> str | None:
+    """The phone number in ``text`` with its formatting kept, or None."""
+    for match in PHONE.finditer(text or ""):
+        number = match.group(0).strip()
+        if DATE.fullmatch(number):
+            continue
+        digits = sum(ch.isdigit() for ch in number)
+        fewest = PHONE_DIGITS[0] if number.startswith("+") else PHONE_LOCAL_DIGITS
+        if fewest <= digits <= PHONE_DIGITS[1]:
+            return number
+    return None
+
+
+def parse_yes_no(text: str) -> bool | None:
+    """True for yes, False for no, None when the reply is ambiguous or has neither."""
+    key = normalize(text or "")
+    words = key.split()
+    phrases = {key, *words, *map(" ".join, zip(words, words[1:])), *map(" ".join, zip(words, words[1:], words[2:]))}
+    yes, no = bool(phrases & _YES), bool(phrases & _NO)
+    if no and not yes and len(words) > NO_MAX_WORDS and key not in _NO:
+        no = False  # "no" inside a longer reply may be part of an idiom or a question
+    if no and any(f" {idiom} " in f" {key} " for idiom in NEGATED_YES):
+        no = yes = False
+    if yes != no:
+        _count("yes_no_local")
+        return yes
+    _count("yes_no_ambiguous")
+    return None
+
+
+def _match_techs(tokens: list) -> tuple:
+    """Longest alias matches in ``tokens``; returns (technologies, leftover words).
+
+    When words other than technologies and filler are left over, one-word
+    ``AMBIGUOUS`` matches go back to the leftover.
+    """
+    matches, leftover = _match_aliases(tokens)
+    if not any(word not in _FILLER for word, _ in leftover):
+        return [name for name, _ in matches], leftover
+    found = []
+    for name, words in matches:
+        if len(words) == 1 and words[0][0] in AMBIGUOUS:
+            leftover.extend(words)
+        else:
+            found.append(name)
+    return found, leftover
+
+
+def _match_aliases(tokens: list) -> tuple:
+    """([(technology, matched words), ...], leftover words), taking the longest alias at each word."""
+    matches, leftover, i = [], [], 0
+    while i < len(tokens):
+        node, end, name = TECH_TRIE, i, None
+        for j in range(i, len(tokens)):
+            node = node.get(tokens[j][0])
+            if node is None:
+                break
+            if None in node:
+                end, name = j + 1, node[None]
+        if name:
+            matches.append((name, tokens[i:end]))
+            i = end
+        else:
+            leftover.append(tokens[i])
+            i += 1
+    return matches, leftover
+
+
+def _product_names(tokens: list, leftover: list) -> list:
+    """Runs of leftover words shaped like product names ("Elixir", "GraphQL", "d3.js")."""
+    names, run = [], []
+    for position, (word, original) in enumerate(tokens):
+        named = (word, original) in leftover and word not in _FILLER and (
+            _PRODUCT_SHAPE.match(original) or position and original[:1].isupper() and original != "I"
+        )
+        if named:
+            run.append(original)
+        elif run:
+            names.append(" ".join(run))
+            run = []
+    if run:
+        names.append(" ".join(run))
+    return names
+
+
+def parse_tech_stack(text: str) -> list | None:
+    """Canonical technologies in listing order, or None if ``text`` has prose naming none we know.
+
+    A reply saying there is no stack ("none", "n/a") gives []. An item with no known technology is kept as written when it is one or two
+    words ("Elixir", "apache beam"); a longer one is prose, and the whole
+    reply is left for Groq. Around known technologies only product-like
+    words are kept.
+    """
+    if normalize(text or "") in _NO_TECH:
+        _count("tech_stack_local")
+        return []
+    techs = []
+    parts = [part for part in _SEPARATORS.split(text or "") if part.strip()]
+    for part in parts:
+        tokens = _tech_tokens(part)
+        found, leftover = _match_techs(tokens)
+        if not found:
+            words = [original for word, original in tokens if word not in _FILLER]
+            if len(tokens) > 2:
+                techs = []
+                break
+            if words:
+                techs.append(" ".join(words))
+            continue
+        techs.extend(found)
+        techs.extend(_product_names(tokens, leftover))
+    unique = list(dict.fromkeys(techs))
+    if not unique:
+        _count("tech_stack_ambiguous")
+        return None
+    _count("tech_stack_local")
+    return unique
+
+
+def stats() -> dict:
+    """Inputs handled locally vs. left for Groq."""
+    with _lock:
+        return dict(_counters)